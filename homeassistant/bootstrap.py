@@ -64,6 +64,7 @@ from .components import (
 from .components.sensor import recorder as sensor_recorder  # noqa: F401
 from .const import (
     BASE_PLATFORMS,
+    EVENT_HOMEASSISTANT_STARTED,
     FORMAT_DATETIME,
     KEY_DATA_LOGGING as DATA_LOGGING,
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
@@ -90,6 +91,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.json import save_json
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
@@ -101,6 +103,7 @@ from .setup import (
     # which integrations are being set up.
     _setup_started,
     async_get_setup_timings,
+    async_get_setup_trace,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
@@ -130,6 +133,7 @@ SETUP_ORDER_SORT_KEY = partial(contains, BASE_PLATFORMS)
 
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+SETUP_TRACE_FILENAME = "home-assistant.boot_trace.json"
 
 # hass.data key for logging information.
 DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
@@ -390,6 +394,16 @@ async def async_setup_hass(
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
+    async def _async_save_setup_trace(_: core.Event) -> None:
+        """Save the setup trace of the startup."""
+        await hass.async_add_executor_job(
+            save_json,
+            hass.config.path(SETUP_TRACE_FILENAME),
+            async_get_setup_trace(hass),
+        )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_setup_trace)
+
     return hass
 
 
@@ -450,6 +464,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_compiled_templates(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -467,6 +482,13 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    # Load the manifests of the last start so resolving the integrations
+    # only has to read the manifests which changed since then, and the
+    # modules imported by the last start so they can be imported early
+    await asyncio.gather(
+        create_eager_task(loader.async_load_manifest_cache(hass)),
+        create_eager_task(loader.async_load_import_snapshot(hass)),
+    )
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -849,6 +871,47 @@ async def _async_resolve_domains_and_preload(
     return integrations_to_setup, all_integrations_to_setup
 
 
+async def _async_get_integrations_to_preload(
+    hass: core.HomeAssistant, integrations: dict[str, Integration]
+) -> dict[str, Integration]:
+    """Return the integrations which can be imported before they are set up.
+
+    Integrations are only imported ahead when the requirements of the
+    integration and its dependencies are installed. Otherwise an old
+    version of a requirement would be imported before the new version
+    is installed.
+    """
+    await requirements.async_load_installed_versions(
+        hass,
+        {
+            requirement
+            for integration in integrations.values()
+            for requirement in integration.requirements
+        },
+    )
+    missing = {
+        domain
+        for domain, integration in integrations.items()
+        if not requirements.async_requirements_installed(hass, integration.requirements)
+    }
+    return {
+        domain: integration
+        for domain, integration in integrations.items()
+        if domain not in missing
+        and integration.all_dependencies_resolved
+        and not integration.all_dependencies & missing
+    }
+
+
+async def _async_preload_import_snapshot(
+    hass: core.HomeAssistant, integrations: dict[str, Integration]
+) -> None:
+    """Import the modules imported by the last start while setting up."""
+    await loader.async_preload_import_snapshot(
+        hass, await _async_get_integrations_to_preload(hass, integrations)
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -876,6 +939,15 @@ async def _async_set_up_integrations(
 
     async_set_domains_to_be_loaded(hass, all_domains)
 
+    # Import the modules imported by the last start in parallel so
+    # setting up the integrations does not wait for them one by one
+    if loader.async_has_import_snapshot(hass):
+        hass.async_create_background_task(
+            _async_preload_import_snapshot(hass, all_integrations),
+            "preload import snapshot",
+            eager_start=True,
+        )
+
     # Initialize recorder
     if "recorder" in all_domains:
         recorder.async_initialize_recorder(hass)
@@ -956,6 +1028,11 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        import_time = loader.async_get_import_timings(hass)
+        _LOGGER.debug(
+            "Integration import times: %s",
+            dict(sorted(import_time.items(), key=itemgetter(1), reverse=True)),
+        )
 
 
 class _WatchPendingSetups:
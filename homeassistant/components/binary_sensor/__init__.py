@@ -156,7 +156,11 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
 }
 
 
-class BinarySensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
+class BinarySensorEntity(
+    Entity,
+    cached_properties=CACHED_PROPERTIES_WITH_ATTR_,
+    state_properties={"is_on"},
+):
     """Represent a binary sensor."""
 
     entity_description: BinarySensorEntityDescription
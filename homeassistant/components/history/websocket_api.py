@@ -72,6 +72,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
@@ -88,11 +89,46 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                max_points,
             ),
         )
     )
 
 
+def _ws_get_significant_states_columnar(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+) -> bytes:
+    """Fetch history significant_states as columns and convert them to json."""
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            {
+                entity_id: columns.as_dict()
+                for entity_id, columns in history.get_significant_states_columnar(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    max_points,
+                ).items()
+            },
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +139,10 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
+        vol.Optional("max_points"): vol.All(
+            vol.Coerce(int), vol.Range(min=history.POINTS_PER_BUCKET)
+        ),
     }
 )
 @websocket_api.async_response
@@ -162,7 +202,9 @@ async def ws_get_history_during_period(
 
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
-            _ws_get_significant_states,
+            _ws_get_significant_states_columnar
+            if msg["columnar"]
+            else _ws_get_significant_states,
             hass,
             msg["id"],
             start_time,
@@ -172,6 +214,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
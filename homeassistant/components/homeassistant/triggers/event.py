@@ -7,7 +7,13 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM, EVENT_STATE_REPORTED
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONF_EVENT_DATA,
+    CONF_PLATFORM,
+    EVENT_STATE_REPORTED,
+    MATCH_ALL,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, template
@@ -69,6 +75,7 @@ async def async_attach_trigger(
         )
     event_data_schema: vol.Schema | None = None
     event_data_items: ItemsView | None = None
+    match_data: tuple[str, tuple[str]] | None = None
     if CONF_EVENT_DATA in config:
         # Render the schema input
         event_data = {}
@@ -87,6 +94,10 @@ async def async_attach_trigger(
         else:
             # Use a simple items comparison if possible
             event_data_items = event_data.items()
+            # Index the listener by the entity_id of the event data so
+            # the filter is only called for events which can match
+            if isinstance(entity_id := event_data.get(ATTR_ENTITY_ID), str):
+                match_data = (ATTR_ENTITY_ID, (entity_id,))
 
     event_context_schema: vol.Schema | None = None
     event_context_items: ItemsView | None = None
@@ -167,7 +178,12 @@ async def async_attach_trigger(
 
     event_filter = filter_event if event_data_items or event_data_schema else None
     removes = [
-        hass.bus.async_listen(event_type, handle_event, event_filter=event_filter)
+        hass.bus.async_listen(
+            event_type,
+            handle_event,
+            event_filter=event_filter,
+            match_data=match_data if event_type != MATCH_ALL else None,
+        )
         for event_type in event_types
     ]
 
@@ -39,6 +39,7 @@ from . import (
 from .const import (  # noqa: F401
     CONF_DB_INTEGRITY_CHECK,
     DOMAIN,
+    INTEGRATION_PLATFORM_ASYNC_SETUP,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
     SQLITE_URL_PREFIX,
@@ -68,6 +69,11 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_ADAPTIVE_COMMIT = "adaptive_commit"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_PRE_ENCODE = "pre_encode"
+CONF_REF_COUNTING = "ref_counting"
+CONF_PARTITION_TABLES = "partition_tables"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -111,6 +117,11 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(CONF_ADAPTIVE_COMMIT, default=False): cv.boolean,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
+                    vol.Optional(CONF_PRE_ENCODE, default=False): cv.boolean,
+                    vol.Optional(CONF_REF_COUNTING, default=False): cv.boolean,
+                    vol.Optional(CONF_PARTITION_TABLES, default=False): cv.boolean,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -147,6 +158,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    adaptive_commit = conf[CONF_ADAPTIVE_COMMIT]
+    bulk_insert = conf[CONF_BULK_INSERT]
+    pre_encode = conf[CONF_PRE_ENCODE]
+    ref_counting = conf[CONF_REF_COUNTING]
+    partition_tables = conf[CONF_PARTITION_TABLES]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or get_default_url(hass)
@@ -163,6 +179,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         auto_repack=auto_repack,
         keep_days=keep_days,
         commit_interval=commit_interval,
+        adaptive_commit=adaptive_commit,
+        bulk_insert=bulk_insert,
+        pre_encode=pre_encode,
+        ref_counting=ref_counting,
+        partition_tables=partition_tables,
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
@@ -196,6 +217,9 @@ async def _async_setup_integration_platform(
         # add it to the recorder queue to be processed.
         if any(hasattr(platform, _attr) for _attr in INTEGRATION_PLATFORM_METHODS):
             instance.queue_task(AddRecorderPlatformTask(domain, platform))
+        # Platforms can set up what they need from the event loop
+        if async_setup := getattr(platform, INTEGRATION_PLATFORM_ASYNC_SETUP, None):
+            async_setup(hass)
 
     await async_process_integration_platforms(hass, DOMAIN, _process_recorder_platform)
 
@@ -0,0 +1,246 @@
+"""Buffer States and Events rows and write them with bulk inserts."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, EventStateChangedData
+
+from .db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from .models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+
+class PendingStatesRow:
+    """A States row that will be written by the next bulk insert.
+
+    The row quacks like a pending States object for the StatesManager
+    so the old_state_id linkage works the same way in both write modes.
+    """
+
+    __slots__ = (
+        "generation",
+        "old_state",
+        "params",
+        "state_attributes",
+        "state_id",
+        "states_meta",
+    )
+
+    def __init__(
+        self, params: dict[str, Any], old_state: PendingStatesRow | None
+    ) -> None:
+        """Initialize the pending row."""
+        self.params = params
+        self.old_state = old_state
+        # States that link to a row in the same buffer must be
+        # inserted after it
+        self.generation = 0 if old_state is None else old_state.generation + 1
+        self.state_id: int | None = None
+        self.state_attributes: StateAttributes | None = None
+        self.states_meta: StatesMeta | None = None
+
+    @classmethod
+    def from_event(
+        cls, event: Event[EventStateChangedData], old_state: PendingStatesRow | None
+    ) -> PendingStatesRow:
+        """Create a pending row from a state_changed event."""
+        return cls(states_params_from_event(event), old_state)
+
+    @property
+    def last_updated_ts(self) -> float | None:
+        """Return the last_updated_ts of the row."""
+        return self.params["last_updated_ts"]
+
+    @property
+    def last_reported_ts(self) -> float | None:
+        """Return the last_reported_ts of the row."""
+        return self.params["last_reported_ts"]
+
+    @last_reported_ts.setter
+    def last_reported_ts(self, last_reported_ts: float | None) -> None:
+        """Set the last_reported_ts of the row."""
+        self.params["last_reported_ts"] = last_reported_ts
+
+    def resolve(self) -> dict[str, Any]:
+        """Return the insert parameters with the foreign keys filled in."""
+        params = self.params
+        if self.old_state is not None:
+            params["old_state_id"] = self.old_state.state_id
+        if self.states_meta is not None:
+            params["metadata_id"] = self.states_meta.metadata_id
+        if self.state_attributes is not None:
+            params["attributes_id"] = self.state_attributes.attributes_id
+        return params
+
+
+class PendingEventsRow:
+    """An Events row that will be written by the next bulk insert."""
+
+    __slots__ = ("event_data", "event_type", "params")
+
+    def __init__(self, params: dict[str, Any]) -> None:
+        """Initialize the pending row."""
+        self.params = params
+        self.event_data: EventData | None = None
+        self.event_type: EventTypes | None = None
+
+    @classmethod
+    def from_event(cls, event: Event) -> PendingEventsRow:
+        """Create a pending row from a native event."""
+        return cls(events_params_from_event(event))
+
+    def resolve(self) -> dict[str, Any]:
+        """Return the insert parameters with the foreign keys filled in."""
+        params = self.params
+        if self.event_type is not None:
+            params["event_type_id"] = self.event_type.event_type_id
+        if self.event_data is not None:
+            params["data_id"] = self.event_data.data_id
+        return params
+
+
+def states_params_from_event(event: Event[EventStateChangedData]) -> dict[str, Any]:
+    """Create States insert parameters from a state_changed event.
+
+    This must produce the same values as States.from_event except
+    that the state of a removed entity is already set to None.
+    """
+    state = event.data["new_state"]
+    # None state means the state was removed from the state machine
+    if state is None:
+        state_value = None
+        last_updated_ts = event.time_fired_timestamp
+        last_changed_ts = None
+        last_reported_ts = None
+    else:
+        state_value = state.state
+        last_updated_ts = state.last_updated_timestamp
+        if state.last_updated == state.last_changed:
+            last_changed_ts = None
+        else:
+            last_changed_ts = state.last_changed_timestamp
+        if state.last_updated == state.last_reported:
+            last_reported_ts = None
+        else:
+            last_reported_ts = state.last_reported_timestamp
+    context = event.context
+    return {
+        "entity_id": event.data["entity_id"],
+        "state": state_value,
+        "context_id_bin": ulid_to_bytes_or_none(context.id),
+        "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+        "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+        "origin_idx": event.origin.idx,
+        "last_updated_ts": last_updated_ts,
+        "last_changed_ts": last_changed_ts,
+        "last_reported_ts": last_reported_ts,
+        "old_state_id": None,
+        "attributes_id": None,
+        "metadata_id": None,
+    }
+
+
+def events_params_from_event(event: Event) -> dict[str, Any]:
+    """Create Events insert parameters from a native event.
+
+    This must produce the same values as Events.from_event.
+    """
+    context = event.context
+    return {
+        "origin_idx": event.origin.idx,
+        "time_fired_ts": event.time_fired_timestamp,
+        "context_id_bin": ulid_to_bytes_or_none(context.id),
+        "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+        "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+        "event_type_id": None,
+        "data_id": None,
+    }
+
+
+class BulkInsertBuffer:
+    """Buffer States and Events rows between commits.
+
+    Building one ORM object per event and letting the unit of work
+    flush them is the most expensive part of writing to the database.
+    Instead the rows are kept as plain parameter dicts and written with
+    one executemany per table at commit time.
+
+    The rows of the deduplicated tables (StatesMeta, StateAttributes,
+    EventTypes, EventData) are still added to the session as ORM objects
+    since they are rare once the caches are warm, and they are flushed
+    first so their ids are known when the buffered rows are written.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._events: list[PendingEventsRow] = []
+        self._states: list[PendingStatesRow] = []
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self._events) + len(self._states)
+
+    def add_event(self, row: PendingEventsRow) -> None:
+        """Buffer an Events row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._events.append(row)
+
+    def add_state(self, row: PendingStatesRow) -> None:
+        """Buffer a States row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states.append(row)
+
+    def flush(self, session: Session) -> None:
+        """Write the buffered rows to the database.
+
+        The buffer is not cleared so the flush can be retried
+        if the commit fails.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        # Allocate the ids of the pending rows in the deduplicated tables
+        session.flush()
+        if self._events:
+            session.execute(insert(Events), [row.resolve() for row in self._events])
+        if not self._states:
+            return
+        generations: defaultdict[int, list[PendingStatesRow]] = defaultdict(list)
+        for row in self._states:
+            generations[row.generation].append(row)
+        # Each generation is inserted after the one before it
+        # so the state_id of the old state is known
+        for generation in sorted(generations):
+            rows = generations[generation]
+            result = session.execute(
+                insert(States).returning(States.state_id, sort_by_parameter_order=True),
+                [row.resolve() for row in rows],
+            )
+            for row, state_id in zip(rows, result.scalars(), strict=True):
+                row.state_id = state_id
+
+    def clear(self) -> None:
+        """Clear the buffer after a commit or when the session is closed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._events.clear()
+        self._states.clear()
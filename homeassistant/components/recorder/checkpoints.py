@@ -0,0 +1,104 @@
+"""Hourly checkpoints of the latest state of each entity."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util import dt as dt_util
+from homeassistant.util.collection import chunked_or_all
+
+from .const import MAX_IDS_FOR_INDEXED_GROUP_BY
+from .db_schema import StateCheckpoints
+from .queries import (
+    find_all_states_metadata_ids,
+    find_latest_states_before,
+    find_latest_states_in_range,
+    find_previous_state_checkpoint_hour,
+    find_state_checkpoint,
+    find_state_checkpoint_hour,
+)
+from .util import retryable_database_job, session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+CHECKPOINT_INTERVAL = timedelta(hours=1)
+
+
+def start_of_utc_hour(point_in_time: datetime) -> datetime:
+    """Return the start of the UTC hour of a point in time."""
+    return dt_util.as_utc(point_in_time).replace(minute=0, second=0, microsecond=0)
+
+
+@retryable_database_job("write state checkpoint")
+def write_state_checkpoint(instance: Recorder, hour: datetime) -> bool:
+    """Write the checkpoint of the latest state of each entity before hour.
+
+    The checkpoint is built from the previous checkpoint and the states
+    updated since then so only the states of the last hour are scanned.
+    Without a previous checkpoint the latest state of the entities is
+    looked up in chunks with an index seek per entity.
+    """
+    hour_ts = hour.timestamp()
+    with session_scope(session=instance.get_session()) as session:
+        if session.execute(find_state_checkpoint_hour(hour_ts)).first():
+            return True
+        previous_ts = session.execute(
+            find_previous_state_checkpoint_hour(hour_ts)
+        ).scalar()
+        if previous_ts is None:
+            latest = _find_latest_states_before(session, hour_ts)
+        else:
+            latest = {
+                metadata_id: (state_id, last_updated_ts)
+                for metadata_id, state_id, last_updated_ts in session.execute(
+                    find_state_checkpoint(previous_ts)
+                )
+            }
+            for metadata_id, state_id, last_updated_ts in session.execute(
+                find_latest_states_in_range(previous_ts, hour_ts)
+            ):
+                latest[metadata_id] = (state_id, last_updated_ts)
+        _LOGGER.debug(
+            "Writing state checkpoint for %s with %s entities", hour, len(latest)
+        )
+        if latest:
+            session.execute(
+                insert(StateCheckpoints),
+                [
+                    {
+                        "hour_ts": hour_ts,
+                        "metadata_id": metadata_id,
+                        "state_id": state_id,
+                        "last_updated_ts": last_updated_ts,
+                    }
+                    for metadata_id, (state_id, last_updated_ts) in latest.items()
+                ],
+            )
+    return True
+
+
+def _find_latest_states_before(
+    session: Session, hour_ts: float
+) -> dict[int, tuple[int, float]]:
+    """Find the latest state of each entity before hour_ts."""
+    latest: dict[int, tuple[int, float]] = {}
+    metadata_ids = [
+        metadata_id
+        for metadata_id, _ in session.execute(find_all_states_metadata_ids())
+    ]
+    for metadata_ids_chunk in chunked_or_all(
+        metadata_ids, MAX_IDS_FOR_INDEXED_GROUP_BY
+    ):
+        for metadata_id, state_id, last_updated_ts in session.execute(
+            find_latest_states_before(hour_ts, list(metadata_ids_chunk))
+        ):
+            latest[metadata_id] = (state_id, last_updated_ts)
+    return latest
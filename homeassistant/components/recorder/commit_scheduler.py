@@ -0,0 +1,98 @@
+"""Schedule recorder commits based on the queue backlog."""
+
+from __future__ import annotations
+
+import time
+
+# The minimum number of seconds between commits when the
+# queue is drained and adaptive commits are enabled
+IDLE_COMMIT_INTERVAL = 1.0
+
+# When the backlog is at least this deep periodic commits are
+# deferred so the burst is written in larger transactions
+BURST_BACKLOG = 1000
+
+# A periodic commit is never deferred for more than
+# this many commit intervals
+MAX_COMMIT_DEFER_INTERVALS = 6
+
+# A periodic commit is never deferred when at least
+# this many events are pending in the session
+MAX_COMMIT_BATCH_SIZE = 20000
+
+
+class CommitScheduler:
+    """Decide when the recorder commits and keep commit statistics.
+
+    With adaptive commits the recorder commits as soon as the queue
+    is drained, at most every IDLE_COMMIT_INTERVAL seconds, which keeps
+    the history fresh when the system is quiet. When there is a burst
+    of events periodic commits are deferred so more events are written
+    per transaction and the queue drains faster.
+
+    The statistics are always kept so they can be reported
+    in system health.
+    """
+
+    __slots__ = (
+        "_last_commit",
+        "adaptive",
+        "commit_interval",
+        "last_commit_batch_size",
+        "last_commit_latency",
+        "pending_events",
+    )
+
+    def __init__(self, commit_interval: int, adaptive: bool) -> None:
+        """Initialize the commit scheduler."""
+        self.commit_interval = commit_interval
+        self.adaptive = adaptive
+        self.pending_events = 0
+        self.last_commit_batch_size = 0
+        self.last_commit_latency = 0.0
+        self._last_commit = time.monotonic()
+
+    def event_processed(self) -> None:
+        """Count an event processed into the session.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.pending_events += 1
+
+    def should_commit_when_drained(self) -> bool:
+        """Return if the session should be committed now that the queue is empty.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return (
+            self.adaptive
+            and self.pending_events > 0
+            and time.monotonic() - self._last_commit >= IDLE_COMMIT_INTERVAL
+        )
+
+    def should_defer_commit(self, backlog: int) -> bool:
+        """Return if a periodic commit should be deferred to batch a burst.
+
+        This is called from the event loop and only reads values
+        that are updated atomically by the recorder thread.
+        """
+        return (
+            self.adaptive
+            and backlog >= BURST_BACKLOG
+            and self.pending_events < MAX_COMMIT_BATCH_SIZE
+            and time.monotonic() - self._last_commit
+            < self.commit_interval * MAX_COMMIT_DEFER_INTERVALS
+        )
+
+    def committed(self, start: float) -> None:
+        """Record a commit that started at the given monotonic time.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_commit = now = time.monotonic()
+        self.last_commit_latency = now - start
+        self.last_commit_batch_size = self.pending_events
+        self.pending_events = 0
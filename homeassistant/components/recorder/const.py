@@ -40,6 +40,12 @@ MAX_IDS_FOR_INDEXED_GROUP_BY = 999
 
 DEFAULT_MAX_BIND_VARS = 4000
 
+# The id of the data migration which counts the references to shared rows
+REF_COUNT_MIGRATION_ID = "ref_count"
+
+PENDING_PURGE_STORAGE_KEY = f"{DOMAIN}.pending_purge"
+PENDING_PURGE_STORAGE_VERSION = 1
+
 DB_WORKER_PREFIX = "DbWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
@@ -63,6 +69,7 @@ LEGACY_STATES_EVENT_FOREIGN_KEYS_FIXED_SCHEMA_VERSION = 43
 # not bump the schema version which means only databases
 # created with schema 44 and later do not need the rebuild.
 
+INTEGRATION_PLATFORM_ASYNC_SETUP = "async_setup"
 INTEGRATION_PLATFORM_COMPILE_STATISTICS = "compile_statistics"
 INTEGRATION_PLATFORM_LIST_STATISTIC_IDS = "list_statistic_ids"
 INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES = "update_statistics_issues"
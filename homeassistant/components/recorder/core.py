@@ -45,12 +45,16 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.recorder import DATA_RECORDER
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import BulkInsertBuffer, PendingEventsRow, PendingStatesRow
+from .checkpoints import start_of_utc_hour
+from .commit_scheduler import CommitScheduler
 from .const import (
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
@@ -63,6 +67,8 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    PENDING_PURGE_STORAGE_KEY,
+    PENDING_PURGE_STORAGE_VERSION,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -78,6 +84,7 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
+from .encoder import PreEncoded, RecorderEncoder
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import (
     DatabaseEngine,
@@ -87,6 +94,7 @@ from .models import (
     UnsupportedDialect,
 )
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeBatchSizer
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -107,6 +115,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    StateCheckpointTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -164,6 +173,11 @@ class Recorder(threading.Thread):
         auto_repack: bool,
         keep_days: int,
         commit_interval: int,
+        adaptive_commit: bool,
+        bulk_insert: bool,
+        pre_encode: bool,
+        ref_counting: bool,
+        partition_tables: bool,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
@@ -182,6 +196,16 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.commit_scheduler = CommitScheduler(commit_interval, adaptive_commit)
+        self.purge_batch_sizer = PurgeBatchSizer()
+        self._pending_purge_store: Store[dict[str, Any]] = Store(
+            hass, PENDING_PURGE_STORAGE_VERSION, PENDING_PURGE_STORAGE_KEY
+        )
+        self._pending_purge_before: datetime | None = None
+        self.bulk_insert = bulk_insert
+        self._encoder = RecorderEncoder(self) if pre_encode else None
+        self.ref_counting = ref_counting
+        self.partition_tables = partition_tables
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -208,6 +232,9 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Only set once connected if the database supports returning
+        # the ids of rows written with executemany
+        self._bulk_insert_buffer: BulkInsertBuffer | None = None
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -296,6 +323,15 @@ class Recorder(threading.Thread):
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
         queue_put = self._queue.put_nowait
+        if (encoder := self._encoder) is not None:
+            recorder_queue_put = queue_put
+            encoder_queue_event = encoder.queue_event
+
+            def queue_put(event: Event) -> None:
+                """Queue an event to the encoder and the recorder."""
+                # The encoder is first so it gets a head start
+                encoder_queue_event(event)
+                recorder_queue_put(event)
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -348,6 +384,7 @@ class Recorder(threading.Thread):
             self._event_listener
             and not self._database_lock_task
             and self._event_session_has_pending_writes
+            and not self.commit_scheduler.should_defer_commit(self.backlog)
         ):
             self.queue_task(COMMIT_TASK)
 
@@ -517,15 +554,51 @@ class Recorder(threading.Thread):
             # until after the database is vacuumed
             repack = self.auto_repack and is_second_sunday(now)
             purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
+            self._async_save_pending_purge(purge_before, repack)
             self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
         else:
             self.queue_task(PerodicCleanupTask())
 
+    @callback
+    def _async_save_pending_purge(self, purge_before: datetime, repack: bool) -> None:
+        """Persist the automatic purge so it can be resumed after a restart."""
+        self._pending_purge_before = purge_before
+        self._pending_purge_store.async_delay_save(
+            lambda: {"purge_before": purge_before.isoformat(), "repack": repack}, 0
+        )
+
+    @callback
+    def async_purge_finished(self, purge_before: datetime) -> None:
+        """Forget the persisted automatic purge once a purge finished."""
+        if (
+            self._pending_purge_before is None
+            or purge_before < self._pending_purge_before
+        ):
+            return
+        self._pending_purge_before = None
+        self._pending_purge_store.async_delay_save(dict, 0)
+
+    async def _async_resume_pending_purge(self) -> None:
+        """Resume an automatic purge which did not finish before a restart."""
+        if (
+            not self.auto_purge
+            or not (data := await self._pending_purge_store.async_load())
+            or not (purge_before := dt_util.parse_datetime(data["purge_before"]))
+        ):
+            return
+        _LOGGER.debug("Resuming purge before %s", purge_before)
+        self._pending_purge_before = purge_before
+        self.queue_task(
+            PurgeTask(purge_before, repack=data["repack"], apply_filter=False)
+        )
+
     @callback
     def _async_five_minute_tasks(self, now: datetime) -> None:
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
         self.async_periodic_statistics()
+        if now.minute == 0:
+            self.queue_task(StateCheckpointTask(start_of_utc_hour(now)))
 
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
@@ -660,6 +733,9 @@ class Recorder(threading.Thread):
         self._nightly_listener = async_track_time_change(
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
         )
+        self.hass.async_create_background_task(
+            self._async_resume_pending_purge(), "Recorder resume pending purge"
+        )
 
         # Compile short term statistics every 5 minutes
         self._periodic_listener = async_track_utc_time_change(
@@ -729,6 +805,11 @@ class Recorder(threading.Thread):
             # Give up if we could not connect
             return
 
+        # The encoder is only started once the dialect is known
+        # since it changes how the data is encoded
+        if self._encoder is not None:
+            self._encoder.start()
+
         schema_status = migration.validate_db_schema(self.hass, self, self.get_session)
         if schema_status is None:
             # Give up if we could not validate the schema
@@ -1040,17 +1121,38 @@ class Recorder(threading.Thread):
         )
 
     def _process_one_event(self, event: Event[Any]) -> None:
+        # Every event must be claimed, even when recording is disabled,
+        # so the encoder does not hold on to the encoded data
+        pre_encoded = self._encoder.claim(event) if self._encoder else None
         if not self.enabled:
             return
-        if event.event_type == EVENT_STATE_CHANGED:
-            self._process_state_changed_event_into_session(event)
+        if self._bulk_insert_buffer is not None:
+            if event.event_type == EVENT_STATE_CHANGED:
+                self._process_state_changed_event_into_bulk_insert_buffer(
+                    event, pre_encoded
+                )
+            else:
+                self._process_non_state_changed_event_into_bulk_insert_buffer(
+                    event, pre_encoded
+                )
+        elif event.event_type == EVENT_STATE_CHANGED:
+            self._process_state_changed_event_into_session(event, pre_encoded)
         else:
-            self._process_non_state_changed_event_into_session(event)
-        # Commit if the commit interval is zero
-        if not self.commit_interval:
+            self._process_non_state_changed_event_into_session(event, pre_encoded)
+        commit_scheduler = self.commit_scheduler
+        commit_scheduler.event_processed()
+        # Commit if the commit interval is zero or, with adaptive
+        # commits, as soon as the queue is drained to keep the history fresh
+        if not self.commit_interval or (
+            commit_scheduler.adaptive
+            and self._queue.empty()
+            and commit_scheduler.should_commit_when_drained()
+        ):
             self._commit_event_session_or_retry()
 
-    def _process_non_state_changed_event_into_session(self, event: Event) -> None:
+    def _process_non_state_changed_event_into_session(
+        self, event: Event, pre_encoded: PreEncoded | None
+    ) -> None:
         """Process any event into the session except state changed."""
         session = self.event_session
         assert session is not None
@@ -1073,7 +1175,11 @@ class Recorder(threading.Thread):
             return
 
         event_data_manager = self.event_data_manager
-        if not (shared_data_bytes := event_data_manager.serialize_from_event(event)):
+        shared_data_bytes, hash_ = pre_encoded or (
+            event_data_manager.serialize_from_event(event),
+            None,
+        )
+        if not shared_data_bytes:
             return
 
         # Map the event data to the EventData table
@@ -1081,23 +1187,26 @@ class Recorder(threading.Thread):
         # Matching attributes found in the pending commit
         if pending_event_data := event_data_manager.get_pending(shared_data):
             dbevent.event_data_rel = pending_event_data
+            event_data_manager.add_reference(pending_event_data)
         # Matching attributes id found in the cache
         elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
-            (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
+            (hash_ := hash_ or EventData.hash_shared_data_bytes(shared_data_bytes))
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
             dbevent.data_id = data_id
+            event_data_manager.add_reference(data_id)
         else:
             # No matching attributes found, save them in the DB
             dbevent_data = EventData(shared_data=shared_data, hash=hash_)
             event_data_manager.add_pending(dbevent_data)
+            event_data_manager.add_reference(dbevent_data)
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
         self._add_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(
-        self, event: Event[EventStateChangedData]
+        self, event: Event[EventStateChangedData], pre_encoded: PreEncoded | None
     ) -> None:
         """Process a state_changed event into the session."""
         state_attributes_manager = self.state_attributes_manager
@@ -1130,9 +1239,11 @@ class Recorder(threading.Thread):
         if states_meta_manager.active:
             dbstate.entity_id = None
 
-        if entity_id is None or not (
-            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
-        ):
+        shared_attrs_bytes, hash_ = pre_encoded or (
+            state_attributes_manager.serialize_from_event(event),
+            None,
+        )
+        if entity_id is None or not shared_attrs_bytes:
             return
 
         # Map the entity_id to the StatesMeta table
@@ -1157,11 +1268,15 @@ class Recorder(threading.Thread):
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
             dbstate.state_attributes = pending_event_data
+            state_attributes_manager.add_reference(pending_event_data)
         # Matching attributes id found in the cache
         elif (
             attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
         ) or (
-            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+            (
+                hash_ := hash_
+                or StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
+            )
             and (
                 attributes_id := state_attributes_manager.get(
                     shared_attrs, hash_, session
@@ -1169,15 +1284,168 @@ class Recorder(threading.Thread):
             )
         ):
             dbstate.attributes_id = attributes_id
+            state_attributes_manager.add_reference(attributes_id)
         else:
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
             state_attributes_manager.add_pending(dbstate_attributes)
+            state_attributes_manager.add_reference(dbstate_attributes)
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
         self._add_to_session(session, dbstate)
 
+    def _process_non_state_changed_event_into_bulk_insert_buffer(
+        self, event: Event, pre_encoded: PreEncoded | None
+    ) -> None:
+        """Process any event into the bulk insert buffer except state changed."""
+        session = self.event_session
+        assert session is not None
+        bulk_insert_buffer = self._bulk_insert_buffer
+        assert bulk_insert_buffer is not None
+        row = PendingEventsRow.from_event(event)
+        params = row.params
+
+        # Map the event_type to the EventTypes table
+        event_type_manager = self.event_type_manager
+        if pending_event_types := event_type_manager.get_pending(event.event_type):
+            row.event_type = pending_event_types
+        elif event_type_id := event_type_manager.get(event.event_type, session, True):
+            params["event_type_id"] = event_type_id
+        else:
+            event_types = EventTypes(event_type=event.event_type)
+            event_type_manager.add_pending(event_types)
+            self._add_to_session(session, event_types)
+            row.event_type = event_types
+
+        if event.data:
+            event_data_manager = self.event_data_manager
+            shared_data_bytes, hash_ = pre_encoded or (
+                event_data_manager.serialize_from_event(event),
+                None,
+            )
+            if not shared_data_bytes:
+                return
+
+            # Map the event data to the EventData table
+            shared_data = shared_data_bytes.decode("utf-8")
+            # Matching attributes found in the pending commit
+            if pending_event_data := event_data_manager.get_pending(shared_data):
+                row.event_data = pending_event_data
+                event_data_manager.add_reference(pending_event_data)
+            # Matching attributes id found in the cache
+            elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
+                (hash_ := hash_ or EventData.hash_shared_data_bytes(shared_data_bytes))
+                and (data_id := event_data_manager.get(shared_data, hash_, session))
+            ):
+                params["data_id"] = data_id
+                event_data_manager.add_reference(data_id)
+            else:
+                # No matching attributes found, save them in the DB
+                dbevent_data = EventData(shared_data=shared_data, hash=hash_)
+                event_data_manager.add_pending(dbevent_data)
+                event_data_manager.add_reference(dbevent_data)
+                self._add_to_session(session, dbevent_data)
+                row.event_data = dbevent_data
+
+        self._event_session_has_pending_writes = True
+        bulk_insert_buffer.add_event(row)
+
+    def _process_state_changed_event_into_bulk_insert_buffer(
+        self, event: Event[EventStateChangedData], pre_encoded: PreEncoded | None
+    ) -> None:
+        """Process a state_changed event into the bulk insert buffer."""
+        state_attributes_manager = self.state_attributes_manager
+        states_meta_manager = self.states_meta_manager
+        entity_removed = not event.data.get("new_state")
+        entity_id = event.data["entity_id"]
+        old_state = event.data["old_state"]
+
+        assert self.event_session is not None
+        session = self.event_session
+        bulk_insert_buffer = self._bulk_insert_buffer
+        assert bulk_insert_buffer is not None
+
+        states_manager = self.states_manager
+        # Only PendingStatesRow are added to the states manager
+        # when the bulk insert buffer is in use
+        pending_state = cast(
+            PendingStatesRow | None, states_manager.pop_pending(entity_id)
+        )
+        row = PendingStatesRow.from_event(event, pending_state)
+        params = row.params
+        if pending_state:
+            if old_state:
+                pending_state.last_reported_ts = old_state.last_reported_timestamp
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            params["old_state_id"] = old_state_id
+            if old_state:
+                states_manager.update_pending_last_reported(
+                    old_state_id, old_state.last_reported_timestamp
+                )
+        if not entity_removed:
+            states_manager.add_pending(entity_id, row)
+
+        if states_meta_manager.active:
+            params["entity_id"] = None
+
+        shared_attrs_bytes, hash_ = pre_encoded or (
+            state_attributes_manager.serialize_from_event(event),
+            None,
+        )
+        if entity_id is None or not shared_attrs_bytes:
+            return
+
+        # Map the entity_id to the StatesMeta table
+        if pending_states_meta := states_meta_manager.get_pending(entity_id):
+            row.states_meta = pending_states_meta
+        elif metadata_id := states_meta_manager.get(entity_id, session, True):
+            params["metadata_id"] = metadata_id
+        elif states_meta_manager.active and entity_removed:
+            # If the entity was removed, we don't need to add it to the
+            # StatesMeta table or record it in the pending commit
+            # if it does not have a metadata_id allocated to it as
+            # it either never existed or was just renamed.
+            return
+        else:
+            states_meta = StatesMeta(entity_id=entity_id)
+            states_meta_manager.add_pending(states_meta)
+            self._add_to_session(session, states_meta)
+            row.states_meta = states_meta
+
+        # Map the event data to the StateAttributes table
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
+        # Matching attributes found in the pending commit
+        if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
+            row.state_attributes = pending_event_data
+            state_attributes_manager.add_reference(pending_event_data)
+        # Matching attributes id found in the cache
+        elif (
+            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
+        ) or (
+            (
+                hash_ := hash_
+                or StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
+            )
+            and (
+                attributes_id := state_attributes_manager.get(
+                    shared_attrs, hash_, session
+                )
+            )
+        ):
+            params["attributes_id"] = attributes_id
+            state_attributes_manager.add_reference(attributes_id)
+        else:
+            # No matching attributes found, save them in the DB
+            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+            state_attributes_manager.add_pending(dbstate_attributes)
+            state_attributes_manager.add_reference(dbstate_attributes)
+            self._add_to_session(session, dbstate_attributes)
+            row.state_attributes = dbstate_attributes
+
+        self._event_session_has_pending_writes = True
+        bulk_insert_buffer.add_state(row)
+
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if (
@@ -1223,6 +1491,10 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        start = time.monotonic()
+
+        if self._bulk_insert_buffer is not None:
+            self._bulk_insert_buffer.flush(session)
 
         if (
             pending_last_reported
@@ -1239,16 +1511,23 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        self.state_attributes_manager.flush_references(session)
+        self.event_data_manager.flush_references(session)
         session.commit()
 
+        self.commit_scheduler.committed(start)
         self._event_session_has_pending_writes = False
+        if self._bulk_insert_buffer is not None:
+            self._bulk_insert_buffer.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
         self.state_attributes_manager.post_commit_pending()
+        self.state_attributes_manager.post_commit_references()
         self.event_data_manager.post_commit_pending()
+        self.event_data_manager.post_commit_references()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
 
@@ -1279,6 +1558,9 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.commit_scheduler.pending_events = 0
+        if self._bulk_insert_buffer is not None:
+            self._bulk_insert_buffer.clear()
 
         if not self.event_session:
             return
@@ -1437,6 +1719,16 @@ class Recorder(threading.Thread):
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
         self.__dict__.pop("dialect_name", None)
+        self._bulk_insert_buffer = None
+        if self.bulk_insert:
+            if self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+                self._bulk_insert_buffer = BulkInsertBuffer()
+            else:
+                _LOGGER.warning(
+                    "The %s database does not support returning the ids of bulk "
+                    "inserted rows, using the default write mode",
+                    self.engine.dialect.name,
+                )
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         migration.pre_migrate_schema(self.engine)
@@ -1483,6 +1775,8 @@ class Recorder(threading.Thread):
     def _shutdown(self) -> None:
         """Save end time for current run."""
         _LOGGER.debug("Shutting down recorder")
+        if self._encoder is not None:
+            self._encoder.stop()
 
         # If the schema version is not set, we never had a working
         # connection to the database or the schema never reached a
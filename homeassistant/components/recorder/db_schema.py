@@ -78,7 +78,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 50
+SCHEMA_VERSION = 51
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -95,6 +95,7 @@ TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 TABLE_MIGRATION_CHANGES = "migration_changes"
+TABLE_STATE_CHECKPOINTS = "state_checkpoints"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -113,6 +114,7 @@ ALL_TABLES = [
     TABLE_SCHEMA_CHANGES,
     TABLE_MIGRATION_CHANGES,
     TABLE_STATES_META,
+    TABLE_STATE_CHECKPOINTS,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
@@ -378,6 +380,9 @@ class EventData(Base):
     shared_data: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The number of events referencing the row, only kept when reference
+    # counting is enabled
+    ref_count: Mapped[int | None] = mapped_column(Integer)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -625,6 +630,9 @@ class StateAttributes(Base):
     shared_attrs: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The number of states referencing the row, only kept when reference
+    # counting is enabled
+    ref_count: Mapped[int | None] = mapped_column(Integer)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -707,6 +715,41 @@ class StatesMeta(Base):
         )
 
 
+class StateCheckpoints(Base):
+    """Latest state of each entity before the start of an hour.
+
+    The start state of a history query is found from the checkpoint
+    before the start time and the states after the checkpoint instead
+    of searching the whole states table.
+    """
+
+    __table_args__ = (
+        Index(
+            "ix_state_checkpoints_hour_ts_metadata_id",
+            "hour_ts",
+            "metadata_id",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATE_CHECKPOINTS
+    checkpoint_id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    hour_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    metadata_id: Mapped[int] = mapped_column(ID_TYPE)
+    # Not a foreign key so states can be purged without touching checkpoints
+    state_id: Mapped[int] = mapped_column(ID_TYPE)
+    last_updated_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StateCheckpoints("
+            f"id={self.checkpoint_id}, hour_ts={self.hour_ts}, "
+            f"metadata_id={self.metadata_id}, state_id={self.state_id}"
+            ")>"
+        )
+
+
 class StatisticsBase:
     """Statistics base class."""
 
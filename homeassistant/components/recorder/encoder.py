@@ -0,0 +1,110 @@
+"""Encode recorder event data and state attributes ahead of the recorder thread."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event
+
+from .db_schema import EventData, StateAttributes
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+ENCODER_THREAD_NAME = "RecorderEncoder"
+
+# The shared data or attributes bytes and their hash
+type PreEncoded = tuple[bytes | None, int | None]
+
+
+class RecorderEncoder(threading.Thread):
+    """Encode and hash event data and state attributes for the recorder.
+
+    Events are queued to the encoder at the same time they are queued
+    to the recorder. Whichever thread gets to an event first claims it.
+    When the encoder is first, the recorder thread picks up the encoded
+    bytes and hash and only has to do the lookups and writes. When the
+    recorder is first, it encodes the event itself and the encoder
+    skips it.
+
+    A single thread is used since encoding holds the GIL; the gain comes
+    from encoding while the recorder thread waits on the database.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the encoder."""
+        super().__init__(name=ENCODER_THREAD_NAME, daemon=True)
+        self._recorder = recorder
+        self._queue: queue.SimpleQueue[Event[Any] | None] = queue.SimpleQueue()
+        # None marks an event claimed by the recorder thread and
+        # an empty tuple an event the encoder failed to encode
+        self._encoded: dict[Event[Any], PreEncoded | tuple[()] | None] = {}
+
+    def queue_event(self, event: Event[Any]) -> None:
+        """Queue an event to be encoded."""
+        self._queue.put_nowait(event)
+
+    def stop(self) -> None:
+        """Stop the encoder once the queue is drained."""
+        self._queue.put_nowait(None)
+
+    def claim(self, event: Event[Any]) -> PreEncoded | None:
+        """Claim an event for the recorder thread.
+
+        Returns the encoded data if the encoder got to the event first.
+
+        This call must be called from the recorder thread exactly
+        once for every queued event.
+        """
+        encoded = self._encoded.setdefault(event, None)
+        if encoded is None:
+            return None
+        del self._encoded[event]
+        return encoded or None
+
+    def run(self) -> None:
+        """Encode events until stopped."""
+        queue_ = self._queue
+        encoded = self._encoded
+        while (event := queue_.get()) is not None:
+            # The recorder thread already claimed the event
+            if event in encoded:
+                del encoded[event]
+                continue
+            result: PreEncoded | tuple[()]
+            try:
+                result = self._encode(event)
+            except Exception:
+                _LOGGER.exception("Error while encoding event %s", event)
+                result = ()
+            # setdefault is atomic so if the recorder thread claimed the
+            # event while it was being encoded the result is discarded
+            if encoded.setdefault(event, result) is not result:
+                del encoded[event]
+
+    def _encode(self, event: Event[Any]) -> PreEncoded:
+        """Encode and hash the shared data or attributes of an event."""
+        recorder = self._recorder
+        if event.event_type == EVENT_STATE_CHANGED:
+            if (
+                shared_attrs_bytes
+                := recorder.state_attributes_manager.serialize_from_event(event)
+            ):
+                return (
+                    shared_attrs_bytes,
+                    StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes),
+                )
+        elif event.data and (
+            shared_data_bytes := recorder.event_data_manager.serialize_from_event(event)
+        ):
+            return (
+                shared_data_bytes,
+                EventData.hash_shared_data_bytes(shared_data_bytes),
+            )
+        return None, None
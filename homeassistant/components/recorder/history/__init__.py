@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -11,11 +11,15 @@ from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
+from ..util import session_scope
+from .columnar import HistoryColumns
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .downsample import POINTS_PER_BUCKET
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columnar_with_session as _modern_get_significant_states_columnar_with_session,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -23,10 +27,14 @@ from .modern import (
 # These are the APIs of this package
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
+    "POINTS_PER_BUCKET",
     "SIGNIFICANT_DOMAINS",
+    "HistoryColumns",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columnar",
+    "get_significant_states_columnar_with_session",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -91,17 +99,30 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return a dict of significant states during a time period."""
-    if not get_instance(hass).states_meta_manager.active:
-        from .legacy import (  # pylint: disable=import-outside-toplevel
-            get_significant_states as _legacy_get_significant_states,
+    if get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            max_points,
         )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
 
-        _target = _legacy_get_significant_states
-    else:
-        _target = _modern_get_significant_states
-    return _target(
+    # The legacy schema is only used until the states
+    # are migrated so the states are not downsampled
+    return _legacy_get_significant_states(
         hass,
         start_time,
         end_time,
@@ -127,17 +148,31 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return a dict of significant states during a time period."""
-    if not get_instance(hass).states_meta_manager.active:
-        from .legacy import (  # pylint: disable=import-outside-toplevel
-            get_significant_states_with_session as _legacy_get_significant_states_with_session,
+    if get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            max_points,
         )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states_with_session as _legacy_get_significant_states_with_session,
+    )
 
-        _target = _legacy_get_significant_states_with_session
-    else:
-        _target = _modern_get_significant_states_with_session
-    return _target(
+    # The legacy schema is only used until the states
+    # are migrated so the states are not downsampled
+    return _legacy_get_significant_states_with_session(
         hass,
         session,
         start_time,
@@ -152,6 +187,86 @@ def get_significant_states_with_session(
     )
 
 
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    max_points: int | None = None,
+) -> dict[str, HistoryColumns]:
+    """Wrap get_significant_states_columnar_with_session with an sql session."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return get_significant_states_columnar_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            max_points,
+        )
+
+
+def get_significant_states_columnar_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    max_points: int | None = None,
+) -> dict[str, HistoryColumns]:
+    """Return the significant states during a time period as columns."""
+    if get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_columnar_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            max_points,
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states_with_session as _legacy_get_significant_states_with_session,
+    )
+
+    # The legacy schema is only used until the states are
+    # migrated so the rows are not streamed or downsampled
+    include_last_changed = not significant_changes_only
+    return {
+        entity_id: HistoryColumns.from_compressed_states(
+            cast(list[dict[str, Any]], states), include_last_changed
+        )
+        for entity_id, states in _legacy_get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ).items()
+    }
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -0,0 +1,143 @@
+"""Columnar representation of the history of an entity."""
+
+from __future__ import annotations
+
+from array import array
+from base64 import b64encode
+import sys
+from typing import Any
+
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+
+from ..models.state_attributes import decode_attributes_from_source
+
+# Keys of the columnar history sent to the frontend
+COLUMNAR_LAST_UPDATED = "lu"
+COLUMNAR_LAST_CHANGED = "lc"
+COLUMNAR_STATES = "s"
+COLUMNAR_STATE_INDEXES = "si"
+COLUMNAR_ATTRIBUTES = "a"
+
+
+def _array_to_base64(values: array) -> str:
+    """Encode an array as base64 of its little endian bytes."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return b64encode(values.tobytes()).decode("ascii")
+
+
+class HistoryColumns:
+    """The history of an entity stored as columns.
+
+    Timestamps are kept in float arrays and states are dictionary
+    encoded so a long history of a sensor does not create a Python
+    object per row. Attributes are only decoded and kept for the rows
+    where they changed.
+    """
+
+    __slots__ = (
+        "_attr_cache",
+        "_last_attributes_source",
+        "_state_to_index",
+        "attributes",
+        "last_changed",
+        "last_updated",
+        "state_indexes",
+        "states",
+    )
+
+    def __init__(self, include_last_changed: bool) -> None:
+        """Initialize empty columns."""
+        self.last_updated = array("d")
+        self.last_changed = array("d") if include_last_changed else None
+        self.states: list[str | None] = []
+        self.state_indexes = array("I")
+        self.attributes: list[tuple[int, dict[str, Any]]] = []
+        self._state_to_index: dict[str | None, int] = {}
+        self._attr_cache: dict[str, dict[str, Any]] = {}
+        self._last_attributes_source: Any = None
+
+    @classmethod
+    def from_compressed_states(
+        cls, states: list[dict[str, Any]], include_last_changed: bool
+    ) -> HistoryColumns:
+        """Create columns from states in the compressed state format."""
+        columns = cls(include_last_changed)
+        attributes = columns.attributes
+        for comp_state in states:
+            if (attrs := comp_state.get(COMPRESSED_STATE_ATTRIBUTES)) is not None and (
+                not attributes or attributes[-1][1] != attrs
+            ):
+                attributes.append((len(columns), attrs))
+            last_updated_ts = comp_state[COMPRESSED_STATE_LAST_UPDATED]
+            columns.append(
+                comp_state[COMPRESSED_STATE_STATE],
+                last_updated_ts,
+                comp_state.get(COMPRESSED_STATE_LAST_CHANGED, last_updated_ts),
+                None,
+                False,
+            )
+        return columns
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.last_updated)
+
+    @property
+    def last_state(self) -> str | None:
+        """Return the state of the last row."""
+        return self.states[self.state_indexes[-1]] if self.state_indexes else None
+
+    def append(
+        self,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float | None,
+        attributes_source: Any,
+        include_attributes: bool,
+    ) -> None:
+        """Append a row.
+
+        The attributes source is the json encoded attributes from the
+        database and is only decoded when it differs from the previous row.
+        """
+        if (state_index := self._state_to_index.get(state)) is None:
+            state_index = self._state_to_index[state] = len(self.states)
+            self.states.append(state)
+        if include_attributes and (
+            not self.attributes or attributes_source != self._last_attributes_source
+        ):
+            self._last_attributes_source = attributes_source
+            self.attributes.append(
+                (
+                    len(self.last_updated),
+                    decode_attributes_from_source(attributes_source, self._attr_cache),
+                )
+            )
+        self.last_updated.append(last_updated_ts)
+        self.state_indexes.append(state_index)
+        if self.last_changed is not None:
+            self.last_changed.append(last_changed_ts or last_updated_ts)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON friendly representation.
+
+        The arrays are sent as base64 encoded little endian bytes so
+        they can be loaded into typed arrays without parsing every value.
+        """
+        result: dict[str, Any] = {
+            COLUMNAR_LAST_UPDATED: _array_to_base64(self.last_updated),
+            COLUMNAR_STATES: self.states,
+            COLUMNAR_STATE_INDEXES: _array_to_base64(self.state_indexes),
+        }
+        if self.last_changed is not None:
+            result[COLUMNAR_LAST_CHANGED] = _array_to_base64(self.last_changed)
+        if self.attributes:
+            result[COLUMNAR_ATTRIBUTES] = self.attributes
+        return result
@@ -0,0 +1,95 @@
+"""Downsample history rows on the server."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import math
+from typing import Any
+
+from sqlalchemy.engine.row import Row
+
+# Each bucket keeps the first, minimum, maximum and last row
+POINTS_PER_BUCKET = 4
+
+
+def _numeric_state(state: Any) -> float | None:
+    """Return the state as a finite float or None if it is not numeric."""
+    try:
+        value = float(state)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def downsample_rows(
+    rows: Iterable[Row],
+    state_idx: int,
+    last_updated_ts_idx: int,
+    start_time_ts: float,
+    end_time_ts: float,
+    max_points: int,
+) -> Iterator[Row]:
+    """Downsample the rows of a single entity in a single pass.
+
+    The time range is split into max_points / POINTS_PER_BUCKET buckets
+    and only the first, last, minimum and maximum rows of each bucket
+    are kept so spikes are still visible after downsampling.
+
+    Rows with a state that is not numeric, such as unavailable, are
+    always kept so gaps in the history are not hidden. They close the
+    current bucket to preserve the order of the rows.
+
+    Rows must be sorted by last_updated. A row without last_updated
+    is the state at the start time.
+    """
+    buckets = max(1, max_points // POINTS_PER_BUCKET)
+    if (bucket_width := (end_time_ts - start_time_ts) / buckets) <= 0:
+        yield from rows
+        return
+
+    current_bucket: int | None = None
+    first: tuple[int, Row] | None = None
+    last: tuple[int, Row] | None = None
+    minimum: tuple[float, int, Row] | None = None
+    maximum: tuple[float, int, Row] | None = None
+
+    def _flush() -> list[Row]:
+        """Return the rows kept for the current bucket in order."""
+        kept: dict[int, Row] = {}
+        for candidate in (first, last):
+            if candidate is not None:
+                kept[candidate[0]] = candidate[1]
+        for extreme in (minimum, maximum):
+            if extreme is not None:
+                kept[extreme[1]] = extreme[2]
+        return [kept[seq] for seq in sorted(kept)]
+
+    for seq, row in enumerate(rows):
+        if (value := _numeric_state(row[state_idx])) is None:
+            yield from _flush()
+            first = last = minimum = maximum = None
+            yield row
+            continue
+        bucket = min(
+            buckets - 1,
+            max(
+                0,
+                int(
+                    ((row[last_updated_ts_idx] or start_time_ts) - start_time_ts)
+                    / bucket_width
+                ),
+            ),
+        )
+        if bucket != current_bucket:
+            yield from _flush()
+            current_bucket = bucket
+            first = last = minimum = maximum = None
+        if first is None:
+            first = (seq, row)
+        last = (seq, row)
+        if minimum is None or value < minimum[0]:
+            minimum = (value, seq, row)
+        if maximum is None or value > maximum[0]:
+            maximum = (value, seq, row)
+
+    yield from _flush()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
+from functools import partial
 from itertools import groupby
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any, cast
@@ -29,10 +30,12 @@ from homeassistant.helpers.recorder import get_instance
 from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
+from ..checkpoints import start_of_utc_hour
 from ..const import LAST_REPORTED_SCHEMA_VERSION, MAX_IDS_FOR_INDEXED_GROUP_BY
 from ..db_schema import (
     SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
     StateAttributes,
+    StateCheckpoints,
     States,
     StatesMeta,
 )
@@ -43,13 +46,16 @@ from ..models import (
     extract_metadata_ids,
     row_to_compressed_state,
 )
+from ..queries import find_state_checkpoint_hour
 from ..util import execute_stmt_lambda_element, session_scope
+from .columnar import HistoryColumns
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
     STATE_KEY,
 )
+from .downsample import downsample_rows
 
 _FIELD_MAP = {
     "metadata_id": 0,
@@ -123,6 +129,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -138,6 +145,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -152,6 +160,7 @@ def _significant_states_stmt(
     include_start_time_state: bool,
     run_start_ts: float | None,
     slow_dependent_subquery: bool,
+    checkpoint_ts: float | None,
 ) -> Select | CompoundSelect:
     """Query the database for significant state changes."""
     include_last_changed = not significant_changes_only
@@ -191,6 +200,7 @@ def _significant_states_stmt(
                 no_attributes,
                 include_last_changed,
                 slow_dependent_subquery,
+                checkpoint_ts,
             ).subquery(),
             no_attributes,
             include_last_changed,
@@ -220,6 +230,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -231,11 +242,117 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    max_points is an optional limit of the number of numeric states
+    returned per entity, see downsample_rows.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _get_significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, entity_id_to_metadata_id, start_time_ts = significant_states
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+        downsampler=_downsampler(start_time, end_time, max_points),
+    )
+
+
+def get_significant_states_columnar_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    max_points: int | None = None,
+) -> dict[str, HistoryColumns]:
+    """Return states changes during UTC period start_time - end_time as columns.
+
+    This returns the same data as get_significant_states_with_session
+    with compressed_state_format but streams the rows into a
+    HistoryColumns per entity instead of creating a dict per row.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _get_significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, entity_id_to_metadata_id, start_time_ts = significant_states
+    return _sorted_states_to_columns(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        not significant_changes_only,
+        minimal_response,
+        no_attributes,
+        _downsampler(start_time, end_time, max_points),
+    )
+
+
+def _downsampler(
+    start_time: datetime, end_time: datetime | None, max_points: int | None
+) -> Callable[[Iterable[Row]], Iterator[Row]] | None:
+    """Return a function to downsample the rows of an entity if requested."""
+    if not max_points:
+        return None
+    return partial(
+        downsample_rows,
+        state_idx=_FIELD_MAP["state"],
+        last_updated_ts_idx=_FIELD_MAP["last_updated_ts"],
+        start_time_ts=start_time.timestamp(),
+        end_time_ts=(end_time or dt_util.utcnow()).timestamp(),
+        max_points=max_points,
+    )
+
+
+def _get_significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[list[Row], dict[str, int | None], float | None] | None:
+    """Return the significant states rows sorted by metadata_id and last_updated.
+
+    Also returns the entity_id to metadata_id map and the start time
+    timestamp if the start time state is included.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -244,7 +361,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,6 +392,9 @@ def get_significant_states_with_session(
         iter_metadata_ids = chunked_or_all(metadata_ids, MAX_IDS_FOR_INDEXED_GROUP_BY)
     else:
         iter_metadata_ids = (metadata_ids,)
+    checkpoint_ts: float | None = None
+    if include_start_time_state and not single_metadata_id:
+        checkpoint_ts = _get_state_checkpoint_ts(session, start_time)
     for metadata_ids_chunk in iter_metadata_ids:
         stmt = _generate_significant_states_with_session_stmt(
             start_time_ts,
@@ -287,6 +407,7 @@ def get_significant_states_with_session(
             include_start_time_state,
             oldest_ts,
             slow_dependent_subquery,
+            checkpoint_ts,
         )
         row_chunk = cast(
             list[Row],
@@ -299,14 +420,10 @@ def get_significant_states_with_session(
             # as this is the common case since its rare that
             # we exceed the MAX_IDS_FOR_INDEXED_GROUP_BY limit
             rows = row_chunk
-    return _sorted_states_to_dict(
+    return (
         rows,
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -321,6 +438,7 @@ def _generate_significant_states_with_session_stmt(
     include_start_time_state: bool,
     oldest_ts: float | None,
     slow_dependent_subquery: bool,
+    checkpoint_ts: float | None,
 ) -> StatementLambdaElement:
     return lambda_stmt(
         lambda: _significant_states_stmt(
@@ -334,6 +452,7 @@ def _generate_significant_states_with_session_stmt(
             include_start_time_state,
             oldest_ts,
             slow_dependent_subquery,
+            checkpoint_ts,
         ),
         track_on=[
             bool(single_metadata_id),
@@ -343,6 +462,7 @@ def _generate_significant_states_with_session_stmt(
             no_attributes,
             include_start_time_state,
             slow_dependent_subquery,
+            bool(checkpoint_ts),
         ],
     )
 
@@ -710,6 +830,75 @@ def _get_start_time_state_for_entities_stmt_group_by(
     )
 
 
+def _get_start_time_state_for_entities_stmt_checkpoint(
+    epoch_time: float,
+    checkpoint_ts: float,
+    metadata_ids: list[int],
+    no_attributes: bool,
+    include_last_changed: bool,
+) -> Select:
+    """Baked query to get states for specific entities from a checkpoint."""
+    # The state checkpoint has the last state of each entity before
+    # checkpoint_ts so only the states between the checkpoint and
+    # epoch_time have to be searched for a newer state.
+    candidates = union_all(
+        select(StateCheckpoints.metadata_id, StateCheckpoints.last_updated_ts).filter(
+            (StateCheckpoints.hour_ts == checkpoint_ts)
+            & StateCheckpoints.metadata_id.in_(metadata_ids)
+        ),
+        select(States.metadata_id, States.last_updated_ts).filter(
+            (States.last_updated_ts >= checkpoint_ts)
+            & (States.last_updated_ts < epoch_time)
+            & States.metadata_id.in_(metadata_ids)
+        ),
+    ).subquery()
+    most_recent_states_for_entities_by_date = (
+        select(
+            candidates.c.metadata_id.label("max_metadata_id"),
+            func.max(candidates.c.last_updated_ts).label("max_last_updated"),
+        )
+        .group_by(candidates.c.metadata_id)
+        .subquery()
+    )
+    stmt = (
+        _stmt_and_join_attributes_for_start_state(
+            no_attributes=no_attributes,
+            include_last_changed=include_last_changed,
+            include_last_reported=False,
+        )
+        .join(
+            most_recent_states_for_entities_by_date,
+            and_(
+                States.metadata_id
+                == most_recent_states_for_entities_by_date.c.max_metadata_id,
+                States.last_updated_ts
+                == most_recent_states_for_entities_by_date.c.max_last_updated,
+            ),
+        )
+        .filter(
+            (States.last_updated_ts < epoch_time) & States.metadata_id.in_(metadata_ids)
+        )
+    )
+    if no_attributes:
+        return stmt
+    return stmt.outerjoin(
+        StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+    )
+
+
+def _get_state_checkpoint_ts(session: Session, start_time: datetime) -> float | None:
+    """Return the timestamp of the state checkpoint to find the start states from.
+
+    Returns None if there is no state checkpoint for the hour of start_time.
+    """
+    checkpoint_ts = start_of_utc_hour(start_time).timestamp()
+    if execute_stmt_lambda_element(
+        session, find_state_checkpoint_hour(checkpoint_ts), orm_rows=False
+    ):
+        return checkpoint_ts
+    return None
+
+
 def _get_oldest_possible_ts(
     hass: HomeAssistant, utc_point_in_time: datetime
 ) -> float | None:
@@ -731,6 +920,7 @@ def _get_start_time_state_stmt(
     no_attributes: bool,
     include_last_changed: bool,
     slow_dependent_subquery: bool,
+    checkpoint_ts: float | None,
 ) -> Select:
     """Return the states at a specific point in time."""
     if single_metadata_id:
@@ -745,6 +935,14 @@ def _get_start_time_state_stmt(
         )
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
+    if checkpoint_ts:
+        return _get_start_time_state_for_entities_stmt_checkpoint(
+            epoch_time,
+            checkpoint_ts,
+            metadata_ids,
+            no_attributes,
+            include_last_changed,
+        )
     if slow_dependent_subquery:
         return _get_start_time_state_for_entities_stmt_group_by(
             epoch_time,
@@ -797,6 +995,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    downsampler: Callable[[Iterable[Row]], Iterator[Row]] | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -850,6 +1049,8 @@ def _sorted_states_to_dict(
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
+        if downsampler is not None:
+            group = downsampler(group)
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
@@ -933,3 +1134,66 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    include_last_changed: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    downsampler: Callable[[Iterable[Row]], Iterator[Row]] | None = None,
+) -> dict[str, HistoryColumns]:
+    """Stream SQL results into a HistoryColumns per entity.
+
+    States must be sorted by entity_id and last_updated
+
+    This follows the same rules as _sorted_states_to_dict with
+    compressed_state_format.
+    """
+    field_map = _FIELD_MAP
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    # Set all entity IDs to empty columns in result set to maintain the order
+    result: dict[str, HistoryColumns] = {
+        entity_id: HistoryColumns(include_last_changed) for entity_id in entity_ids
+    }
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    states_iter: Iterable[tuple[int, Iterator[Row]]]
+    if len(entity_ids) == 1:
+        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
+        assert metadata_id is not None  # should not be possible if we got here
+        states_iter = ((metadata_id, iter(states)),)
+    else:
+        states_iter = groupby(states, itemgetter(field_map["metadata_id"]))
+
+    for metadata_id, group in states_iter:
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        columns = result[entity_id]
+        minimal = (
+            minimal_response
+            and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        )
+        append = columns.append
+        if downsampler is not None:
+            group = downsampler(group)
+        for row in group:
+            state = row[state_idx]
+            # With minimal response we only provide the attributes
+            # of the first row and filter out duplicate states
+            if minimal and columns and state == columns.last_state:
+                continue
+            append(
+                state,
+                row[last_updated_ts_idx] or start_time_ts,
+                getattr(row, "last_changed_ts", None),
+                None if no_attributes else getattr(row, "attributes", None),
+                not no_attributes and not (minimal and columns),
+            )
+
+    # Filter out the empty columns if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
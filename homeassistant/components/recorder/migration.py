@@ -30,6 +30,7 @@ from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
@@ -54,6 +55,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_FOREIGN_KEYS_FIXED_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
+    REF_COUNT_MIGRATION_ID,
     STATES_META_SCHEMA_VERSION,
     SupportedDialect,
 )
@@ -83,10 +85,23 @@ from .db_schema import (
 )
 from .models import StatisticMeanType, process_timestamp
 from .models.time import datetime_to_timestamp_or_none
+from .partitions import (
+    PARTITION_INTERVAL,
+    PARTITIONED_TABLES,
+    PARTITIONS_AHEAD,
+    get_partitioned_tables,
+    partition_table,
+    start_of_utc_day,
+)
 from .queries import (
     batch_cleanup_entity_ids,
+    count_event_data_references,
+    count_state_attributes_references,
     delete_duplicate_short_term_statistics_row,
     delete_duplicate_statistics_row,
+    delete_migration_changes,
+    find_attributes_ids_to_count,
+    find_data_ids_to_count,
     find_entity_ids_to_migrate,
     find_event_type_to_migrate,
     find_events_context_ids_to_migrate,
@@ -2037,6 +2052,17 @@ class _SchemaVersion50Migrator(_SchemaVersionMigrator, target_version=50):
             connection.execute(text("UPDATE statistics_meta SET has_mean=NULL"))
 
 
+class _SchemaVersion51Migrator(_SchemaVersionMigrator, target_version=51):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        for table in ("state_attributes", "event_data"):
+            _add_columns(
+                self.session_maker,
+                table,
+                ["ref_count INTEGER"],
+            )
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2456,7 +2482,7 @@ class MigrationTask(RecorderTask):
         """Run migration task."""
         if not self.migrator.migrate_data(instance):
             # Schedule a new migration task if this one didn't finish
-            instance.queue_task(MigrationTask(self.migrator))
+            instance.queue_task(self.migrator.task(self.migrator))
 
 
 @dataclass(slots=True)
@@ -3029,16 +3055,154 @@ class EntityIDPostMigration(BaseMigrationWithQuery, BaseOffLineMigration):
         return has_used_states_entity_ids()
 
 
+class RefCountMigration(BaseRunTimeMigration):
+    """Migration to count the references to state attributes and event data.
+
+    The reference counts are only kept up to date while reference
+    counting is enabled, so they are counted again from the states and
+    events tables every time it is enabled. Purge also checks the rows
+    the counts find against the states and events tables and forgets
+    the counts if they are out of date, for example when an older
+    version recorded states after they were counted.
+    """
+
+    migration_id = REF_COUNT_MIGRATION_ID
+    task = CommitBeforeMigrationTask
+
+    def __init__(
+        self,
+        *,
+        initial_schema_version: int,
+        start_schema_version: int,
+        migration_changes: dict[str, int],
+    ) -> None:
+        """Initialize a new RefCountMigration."""
+        super().__init__(
+            initial_schema_version=initial_schema_version,
+            start_schema_version=start_schema_version,
+            migration_changes=migration_changes,
+        )
+        self._last_attributes_id = 0
+        self._last_data_id = 0
+
+    def needs_migrate(self, instance: Recorder, session: Session) -> bool:
+        """Return if the references need to be counted."""
+        done = self.migration_changes.get(self.migration_id, -1) >= (
+            self.migration_version
+        )
+        if not instance.ref_counting:
+            if done:
+                # The reference counts will be out of date as soon
+                # as states or events are recorded or purged
+                session.execute(delete_migration_changes(self.migration_id))
+            return False
+        return not done
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        return DataMigrationStatus(
+            needs_migrate=instance.ref_counting, migration_done=False
+        )
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Count the references of a batch of rows, return True if completed."""
+        max_bind_vars = instance.max_bind_vars
+        is_done = False
+        with session_scope(session=instance.get_session()) as session:
+            if attributes_ids := [
+                attributes_id
+                for (attributes_id,) in session.execute(
+                    find_attributes_ids_to_count(
+                        self._last_attributes_id, max_bind_vars
+                    )
+                )
+            ]:
+                session.execute(count_state_attributes_references(attributes_ids))
+                self._last_attributes_id = attributes_ids[-1]
+            elif data_ids := [
+                data_id
+                for (data_id,) in session.execute(
+                    find_data_ids_to_count(self._last_data_id, max_bind_vars)
+                )
+            ]:
+                session.execute(count_event_data_references(data_ids))
+                self._last_data_id = data_ids[-1]
+            else:
+                is_done = True
+
+        _LOGGER.debug("Counting references: done=%s", is_done)
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def migration_done(self, instance: Recorder, session: Session) -> None:
+        """Will be called after migrate returns True or if migration is not needed."""
+        if instance.ref_counting:
+            instance.state_attributes_manager.ref_counts_valid = True
+            instance.event_data_manager.ref_counts_valid = True
+
+
+class PartitionTablesMigration(BaseOffLineMigration):
+    """Migration to partition the states and events tables by day.
+
+    Partitioned tables are only supported with PostgreSQL. The tables
+    stay partitioned if partitioning is disabled again.
+    """
+
+    migration_id = "partition_tables"
+
+    def needs_migrate(self, instance: Recorder, session: Session) -> bool:
+        """Return if there are tables left to partition."""
+        if not instance.partition_tables:
+            return False
+        if instance.dialect_name != SupportedDialect.POSTGRESQL:
+            _LOGGER.warning(
+                "Partitioned tables are only supported with PostgreSQL, "
+                "the tables will not be partitioned"
+            )
+            return False
+        return bool(PARTITIONED_TABLES.keys() - get_partitioned_tables(session))
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        return DataMigrationStatus(needs_migrate=True, migration_done=False)
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Do one step of partitioning a table, return True if completed."""
+        today = start_of_utc_day(dt_util.utcnow())
+        with session_scope(session=instance.get_session()) as session:
+            to_partition = sorted(
+                PARTITIONED_TABLES.keys() - get_partitioned_tables(session)
+            )
+            is_done = not to_partition
+            if to_partition:
+                _LOGGER.debug("Partitioning table %s", to_partition[0])
+                is_done = (
+                    partition_table(
+                        session,
+                        to_partition[0],
+                        today - timedelta(days=instance.keep_days + 1),
+                        today + (PARTITIONS_AHEAD + 1) * PARTITION_INTERVAL,
+                    )
+                    and len(to_partition) == 1
+                )
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+
 NON_LIVE_DATA_MIGRATORS: tuple[type[BaseOffLineMigration], ...] = (
     StatesContextIDMigration,  # Introduced in HA Core 2023.4 by PR #88942
     EventsContextIDMigration,  # Introduced in HA Core 2023.4 by PR #88942
     EventTypeIDMigration,  # Introduced in HA Core 2023.4 by PR #89465
     EntityIDMigration,  # Introduced in HA Core 2023.4 by PR #89557
     EntityIDPostMigration,  # Introduced in HA Core 2023.4 by PR #89557
+    PartitionTablesMigration,
 )
 
 LIVE_DATA_MIGRATORS: tuple[type[BaseRunTimeMigration], ...] = (
     EventIDPostMigration,  # Introduced in HA Core 2023.4 by PR #89901
+    RefCountMigration,
 )
 
 
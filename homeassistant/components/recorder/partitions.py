@@ -0,0 +1,283 @@
+"""Time partitioned states and events tables for PostgreSQL."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Column, Identity, MetaData, Table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util import dt as dt_util
+
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Base
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+# Each partition holds the rows of a single UTC day
+PARTITION_INTERVAL = timedelta(days=1)
+# Partitions are created ahead of time so new rows do not
+# end up in the default partition
+PARTITIONS_AHEAD = 3
+# The number of rows copied at once when converting a table
+PARTITION_COPY_BATCH_SIZE = 100000
+
+# The tables which can be partitioned and their id and time columns
+PARTITIONED_TABLES: dict[str, tuple[str, str]] = {
+    TABLE_STATES: ("state_id", "last_updated_ts"),
+    TABLE_EVENTS: ("event_id", "time_fired_ts"),
+}
+
+_PARTITION_DATE_FORMAT = "%Y%m%d"
+
+
+def start_of_utc_day(point_in_time: datetime) -> datetime:
+    """Return the start of the UTC day of a point in time."""
+    return dt_util.as_utc(point_in_time).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def partition_name(table_name: str, start: datetime) -> str:
+    """Return the name of the partition of a table starting at start."""
+    return f"{table_name}_p{start.strftime(_PARTITION_DATE_FORMAT)}"
+
+
+def partition_start(table_name: str, name: str) -> datetime | None:
+    """Return the start of a partition or None if it is not a daily partition."""
+    prefix = f"{table_name}_p"
+    if not name.startswith(prefix):
+        return None
+    try:
+        start = datetime.strptime(name[len(prefix) :], _PARTITION_DATE_FORMAT)
+    except ValueError:
+        return None
+    return start.replace(tzinfo=dt_util.UTC)
+
+
+def _create_partition_sql(parent: str, name: str, start: datetime) -> str:
+    """Return the statement to create a partition of a partitioned table."""
+    end = start + PARTITION_INTERVAL
+    return (
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {parent} "
+        f"FOR VALUES FROM ({start.timestamp()}) TO ({end.timestamp()})"
+    )
+
+
+def get_partitioned_tables(session: Session | Connection) -> set[str]:
+    """Return the names of the partitioned tables."""
+    return {
+        table_name
+        for (table_name,) in session.execute(
+            text(
+                "SELECT c.relname FROM pg_partitioned_table p "
+                "JOIN pg_class c ON c.oid = p.partrelid "
+                "WHERE pg_table_is_visible(c.oid)"
+            )
+        )
+    }
+
+
+def get_partitions(session: Session, table_name: str) -> dict[str, datetime]:
+    """Return the daily partitions of a table and their start."""
+    partitions: dict[str, datetime] = {}
+    for (name,) in session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table_name AND pg_table_is_visible(p.oid)"
+        ),
+        {"table_name": table_name},
+    ):
+        if (start := partition_start(table_name, name)) is not None:
+            partitions[name] = start
+    return partitions
+
+
+def find_partitions_to_drop(
+    session: Session, table_name: str, purge_before: datetime
+) -> list[str]:
+    """Return the partitions of a table which only hold rows before purge_before."""
+    return sorted(
+        name
+        for name, start in get_partitions(session, table_name).items()
+        if start + PARTITION_INTERVAL <= purge_before
+    )
+
+
+def _table_exists(connection: Connection, table_name: str) -> bool:
+    """Return if a table exists."""
+    return (
+        connection.execute(
+            text("SELECT to_regclass(:table_name)"), {"table_name": table_name}
+        ).scalar()
+        is not None
+    )
+
+
+def _create_partitioned_table(
+    connection: Connection,
+    table: Table,
+    temp_name: str,
+    start: datetime,
+    end: datetime,
+) -> None:
+    """Create an empty partitioned copy of a table with its partitions.
+
+    A unique constraint of a partitioned table has to include the
+    partition key, so the primary key is made of the id and the time.
+    The foreign keys to other tables are kept, the ones to the table
+    itself can't be since the id alone is no longer unique.
+    """
+    table_name = table.name
+    id_column, time_column = PARTITIONED_TABLES[table_name]
+    Table(
+        temp_name,
+        MetaData(),
+        *(
+            Column(
+                column.name,
+                column.type,
+                *((Identity(),) if column.identity is not None else ()),
+                primary_key=column.name in (id_column, time_column),
+                nullable=column.nullable and column.name != time_column,
+            )
+            for column in table.columns
+        ),
+        postgresql_partition_by=f"RANGE ({time_column})",
+    ).create(connection)
+    for column in table.columns:
+        for foreign_key in column.foreign_keys:
+            if foreign_key.column.table is table:
+                continue
+            target = foreign_key.column
+            connection.execute(
+                text(
+                    f"ALTER TABLE {temp_name} ADD CONSTRAINT "
+                    f"{table_name}_{column.name}_fkey FOREIGN KEY ({column.name}) "
+                    f"REFERENCES {target.table.name} ({target.name})"
+                )
+            )
+    connection.execute(
+        text(f"CREATE TABLE {table_name}_default PARTITION OF {temp_name} DEFAULT")
+    )
+    day = start_of_utc_day(start)
+    while day < end:
+        connection.execute(
+            text(_create_partition_sql(temp_name, partition_name(table_name, day), day))
+        )
+        day += PARTITION_INTERVAL
+
+
+def _copy_rows(
+    connection: Connection,
+    table: Table,
+    temp_name: str,
+    batch_size: int,
+) -> int:
+    """Copy the next batch of rows to the partitioned table.
+
+    Rows without a timestamp get timestamp 0, which puts them in the
+    default partition where they are purged with the oldest rows.
+    """
+    id_column, time_column = PARTITIONED_TABLES[table.name]
+    quote = connection.dialect.identifier_preparer.quote
+    column_names = ", ".join(quote(column.name) for column in table.columns)
+    select_columns = ", ".join(
+        f"COALESCE({time_column}, 0)"
+        if column.name == time_column
+        else quote(column.name)
+        for column in table.columns
+    )
+    return connection.execute(
+        text(
+            f"INSERT INTO {temp_name} ({column_names}) "  # noqa: S608
+            f"SELECT {select_columns} FROM {table.name} "
+            f"WHERE {id_column} > "
+            f"(SELECT COALESCE(MAX({id_column}), 0) FROM {temp_name}) "
+            f"ORDER BY {id_column} LIMIT :batch_size"
+        ),
+        {"batch_size": batch_size},
+    ).rowcount
+
+
+def _replace_table(connection: Connection, table: Table, temp_name: str) -> None:
+    """Replace a table with its partitioned copy."""
+    table_name = table.name
+    id_column, _ = PARTITIONED_TABLES[table_name]
+    connection.execute(
+        text(
+            f"SELECT setval(pg_get_serial_sequence('{temp_name}', '{id_column}'), "  # noqa: S608
+            f"COALESCE(MAX({id_column}), 0) + 1, false) FROM {temp_name}"
+        )
+    )
+    # No CASCADE, dropping the table must fail if any other
+    # table still references it
+    connection.execute(text(f"DROP TABLE {table_name}"))
+    connection.execute(text(f"ALTER TABLE {temp_name} RENAME TO {table_name}"))
+    connection.execute(
+        text(
+            f"ALTER TABLE {table_name} RENAME CONSTRAINT "
+            f"{temp_name}_pkey TO {table_name}_pkey"
+        )
+    )
+    for index in table.indexes:
+        index.create(connection)
+
+
+def partition_table(
+    session: Session,
+    table_name: str,
+    start: datetime,
+    end: datetime,
+    batch_size: int = PARTITION_COPY_BATCH_SIZE,
+) -> bool:
+    """Convert a table to a table partitioned by day, return True if completed.
+
+    The rows are copied in batches to a partitioned copy of the table,
+    each call does one step and the caller commits it so the conversion
+    resumes where it stopped. The copy replaces the table once all rows
+    are copied. Rows before start are kept in the default partition and
+    are purged row by row.
+    """
+    table = Base.metadata.tables[table_name]
+    connection = session.connection()
+    temp_name = f"{table_name}_partitioned"
+    if not _table_exists(connection, temp_name):
+        _create_partitioned_table(connection, table, temp_name, start, end)
+        return False
+    if _copy_rows(connection, table, temp_name, batch_size) == batch_size:
+        return False
+    _replace_table(connection, table, temp_name)
+    return True
+
+
+def create_partitions(instance: Recorder) -> None:
+    """Create the partitions of the partitioned tables for the next days.
+
+    A partition can not be created when the default partition already
+    holds rows of its day, those rows stay in the default partition.
+    """
+    assert instance.engine is not None
+    today = start_of_utc_day(dt_util.utcnow())
+    with instance.engine.connect() as connection:
+        with connection.begin():
+            partitioned_tables = get_partitioned_tables(connection)
+        for table_name in PARTITIONED_TABLES.keys() & partitioned_tables:
+            for days in range(PARTITIONS_AHEAD + 1):
+                day = today + days * PARTITION_INTERVAL
+                name = partition_name(table_name, day)
+                try:
+                    with connection.begin():
+                        connection.execute(
+                            text(_create_partition_sql(table_name, name, day))
+                        )
+                except SQLAlchemyError as err:
+                    _LOGGER.warning("Could not create partition %s: %s", name, err)
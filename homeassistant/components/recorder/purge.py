@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Callable
 from datetime import datetime
 import logging
 import time
 from typing import TYPE_CHECKING
 
+from sqlalchemy import column, select, table, text
 from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
-from .db_schema import Events, States, StatesMeta
+from .const import REF_COUNT_MIGRATION_ID, SupportedDialect
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Events, States, StatesMeta
 from .models import DatabaseEngine
+from .partitions import find_partitions_to_drop, get_partitioned_tables
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -22,7 +26,9 @@ from .queries import (
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
+    delete_migration_changes,
     delete_recorder_runs_rows,
+    delete_state_checkpoints_before,
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
@@ -52,6 +58,58 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The target time to spend deleting states or events in a single
+# purge cycle before giving the recorder thread back to the queue
+PURGE_CYCLE_TARGET_LATENCY = 0.3
+# The target time of a single batch of deleted states or events
+PURGE_BATCH_TARGET_LATENCY = 0.05
+MIN_PURGE_BATCH_SIZE = 100
+
+
+class PurgeBatchSizer:
+    """Adapt the number of rows deleted per purge batch to a target latency.
+
+    The batch size shrinks when deletes are slow, for example on a large
+    MariaDB database that has to lock more rows, and grows again up to
+    max_bind_vars when they are fast. A purge cycle stops starting new
+    batches once it used PURGE_CYCLE_TARGET_LATENCY so the recorder can
+    process the events which were queued in the meantime before the purge
+    task continues.
+    """
+
+    __slots__ = ("_batch_size", "_cycle_start")
+
+    def __init__(self) -> None:
+        """Initialize the purge batch sizer."""
+        self._batch_size: int | None = None
+        self._cycle_start = 0.0
+
+    def start_cycle(self) -> None:
+        """Start a purge cycle."""
+        self._cycle_start = time.monotonic()
+
+    @property
+    def cycle_expired(self) -> bool:
+        """Return if the purge cycle used its time budget."""
+        return time.monotonic() - self._cycle_start >= PURGE_CYCLE_TARGET_LATENCY
+
+    def batch_size(self, max_bind_vars: int) -> int:
+        """Return the number of rows to delete in the next batch."""
+        if self._batch_size is None:
+            return max_bind_vars
+        return min(self._batch_size, max_bind_vars)
+
+    def batch_done(self, rows: int, start: float, max_bind_vars: int) -> None:
+        """Adapt the batch size after a batch of rows started at start was deleted."""
+        if not rows or (elapsed := time.monotonic() - start) <= 0:
+            return
+        target_rows = int(rows * PURGE_BATCH_TARGET_LATENCY / elapsed)
+        # Only move half way to the target to smooth out outliers
+        self._batch_size = max(
+            MIN_PURGE_BATCH_SIZE,
+            min(max_bind_vars, (self.batch_size(max_bind_vars) + target_rows) // 2),
+        )
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -70,6 +128,7 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    instance.purge_batch_sizer.start_cycle()
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
@@ -85,6 +144,8 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
+            if instance.dialect_name == SupportedDialect.POSTGRESQL:
+                has_more_to_purge |= _purge_partitions(instance, session, purge_before)
             has_more_to_purge |= _purge_states_and_attributes_ids(
                 instance, session, states_batch_size, purge_before
             )
@@ -121,6 +182,7 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
+        _purge_old_state_checkpoints(session, purge_before)
     with session_scope(session=instance.get_session(), read_only=True) as session:
         instance.recorder_runs_manager.load_from_db(session)
         instance.states_manager.load_from_db(session)
@@ -129,6 +191,111 @@ def purge_old_data(
     return True
 
 
+def _select_committed_state_ids_in_partition(
+    instance: Recorder, session: Session, partition: str
+) -> set[int]:
+    """Return the committed state ids which are in a states partition."""
+    state_id = column("state_id")
+    return {
+        committed_state_id
+        for state_ids_chunk in chunked_or_all(
+            instance.states_manager.get_committed_state_ids(), instance.max_bind_vars
+        )
+        for committed_state_id in session.execute(
+            select(state_id)
+            .select_from(table(partition))
+            .where(state_id.in_(state_ids_chunk))
+        ).scalars()
+    }
+
+
+def _drop_states_partition(
+    instance: Recorder, session: Session, partition: str
+) -> None:
+    """Drop a states partition and release its attributes."""
+    attributes_ids: Counter[int] = Counter(
+        dict(
+            session.execute(
+                text(
+                    "SELECT attributes_id, COUNT(*) "  # noqa: S608
+                    f"FROM {partition} WHERE attributes_id IS NOT NULL "
+                    "GROUP BY attributes_id"
+                )
+            ).tuples()
+        )
+    )
+    purged_state_ids = _select_committed_state_ids_in_partition(
+        instance, session, partition
+    )
+    session.execute(
+        text(
+            f"UPDATE {TABLE_STATES} SET old_state_id = NULL "  # noqa: S608
+            f"WHERE old_state_id IN (SELECT state_id FROM {partition})"
+        )
+    )
+    session.execute(text(f"DROP TABLE {partition}"))
+    _LOGGER.debug("Dropped partition %s", partition)
+    # Evict any entries in the old_states cache referring to a purged state
+    instance.states_manager.evict_purged_state_ids(purged_state_ids)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _drop_events_partition(
+    instance: Recorder, session: Session, partition: str
+) -> None:
+    """Drop an events partition and release its data."""
+    data_ids: Counter[int] = Counter(
+        dict(
+            session.execute(
+                text(
+                    "SELECT data_id, COUNT(*) "  # noqa: S608
+                    f"FROM {partition} WHERE data_id IS NOT NULL "
+                    "GROUP BY data_id"
+                )
+            ).tuples()
+        )
+    )
+    session.execute(text(f"DROP TABLE {partition}"))
+    _LOGGER.debug("Dropped partition %s", partition)
+    _purge_unused_data_ids(instance, session, data_ids)
+
+
+def _purge_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Drop the partitions which only hold states or events before purge_before.
+
+    The remaining rows before purge_before are in the partition of the
+    day of purge_before or in the default partition and are purged row
+    by row.
+
+    Return True if there are partitions left to drop once the purge
+    cycle used its time budget.
+    """
+    if not (partitioned_tables := get_partitioned_tables(session)):
+        return False
+    to_drop: list[tuple[str, Callable[[Recorder, Session, str], None]]] = []
+    if TABLE_STATES in partitioned_tables:
+        to_drop.extend(
+            (partition, _drop_states_partition)
+            for partition in find_partitions_to_drop(
+                session, TABLE_STATES, purge_before
+            )
+        )
+    if TABLE_EVENTS in partitioned_tables:
+        to_drop.extend(
+            (partition, _drop_events_partition)
+            for partition in find_partitions_to_drop(
+                session, TABLE_EVENTS, purge_before
+            )
+        )
+    for partition, drop_partition in to_drop:
+        if instance.purge_batch_sizer.cycle_expired:
+            return True
+        drop_partition(instance, session, partition)
+    return False
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -187,23 +354,26 @@ def _purge_states_and_attributes_ids(
     database_engine = instance.database_engine
     assert database_engine is not None
     has_remaining_state_ids_to_purge = True
-    # There are more states relative to attributes_ids so
-    # we purge enough state_ids to try to generate a full
-    # size batch of attributes_ids that will be around the size
-    # max_bind_vars
-    attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    batch_sizer = instance.purge_batch_sizer
     for _ in range(states_batch_size):
+        start = time.monotonic()
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, batch_sizer.batch_size(max_bind_vars)
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
-        attributes_ids_batch = attributes_ids_batch | attributes_ids
+        # The attributes of the batch are released and the batch is
+        # committed within the measured time, so the batch size also
+        # accounts for the unused attributes scan and the commit
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+        session.commit()
+        batch_sizer.batch_done(len(state_ids), start, max_bind_vars)
+        if batch_sizer.cycle_expired:
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -222,23 +392,25 @@ def _purge_events_and_data_ids(
     Returns true if there are more states to purge.
     """
     has_remaining_event_ids_to_purge = True
-    # There are more events relative to data_ids so
-    # we purge enough event_ids to try to generate a full
-    # size batch of data_ids that will be around the size
-    # max_bind_vars
-    data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    batch_sizer = instance.purge_batch_sizer
     for _ in range(events_batch_size):
+        start = time.monotonic()
         event_ids, data_ids = _select_event_data_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, batch_sizer.batch_size(max_bind_vars)
         )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
-        data_ids_batch = data_ids_batch | data_ids
+        # The data of the batch is released and the batch is committed
+        # within the measured time, like for states
+        _purge_unused_data_ids(instance, session, data_ids)
+        session.commit()
+        batch_sizer.batch_done(len(event_ids), start, max_bind_vars)
+        if batch_sizer.cycle_expired:
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -248,16 +420,16 @@ def _purge_events_and_data_ids(
 
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
-    """Return sets of state and attribute ids to purge."""
+) -> tuple[set[int], Counter[int]]:
+    """Return the state ids and the number of states by attribute id to purge."""
     state_ids = set()
-    attributes_ids = set()
+    attributes_ids: Counter[int] = Counter()
     for state_id, attributes_id in session.execute(
         find_states_to_purge(purge_before.timestamp(), max_bind_vars)
     ).all():
         state_ids.add(state_id)
         if attributes_id:
-            attributes_ids.add(attributes_id)
+            attributes_ids[attributes_id] += 1
     _LOGGER.debug(
         "Selected %s state ids and %s attributes_ids to remove",
         len(state_ids),
@@ -268,16 +440,16 @@ def _select_state_attributes_ids_to_purge(
 
 def _select_event_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
-    """Return sets of event and data ids to purge."""
+) -> tuple[set[int], Counter[int]]:
+    """Return the event ids and the number of events by data id to purge."""
     event_ids = set()
-    data_ids = set()
+    data_ids: Counter[int] = Counter()
     for event_id, data_id in session.execute(
         find_events_to_purge(purge_before.timestamp(), max_bind_vars)
     ).all():
         event_ids.add(event_id)
         if data_id:
-            data_ids.add(data_id)
+            data_ids[data_id] += 1
     _LOGGER.debug(
         "Selected %s event ids and %s data_ids to remove", len(event_ids), len(data_ids)
     )
@@ -316,17 +488,52 @@ def _select_unused_attributes_ids(
     return to_remove
 
 
+def _invalidate_ref_counts(instance: Recorder, session: Session) -> None:
+    """Stop using reference counts which are out of date.
+
+    The references are counted again the next time the recorder starts.
+    """
+    _LOGGER.warning(
+        "The reference counts of state attributes and event data are out of "
+        "date, they will be counted again when the recorder starts"
+    )
+    instance.state_attributes_manager.ref_counts_valid = False
+    instance.event_data_manager.ref_counts_valid = False
+    session.execute(delete_migration_changes(REF_COUNT_MIGRATION_ID))
+
+
 def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
-    attributes_ids_batch: set[int],
+    attributes_ids_batch: Counter[int],
 ) -> None:
-    """Purge unused attributes ids."""
+    """Purge unused attributes ids.
+
+    The batch holds the number of purged states for each attributes id.
+    When the reference counts are known, the unused attributes ids
+    are found by primary key instead of searching the states table.
+    """
     database_engine = instance.database_engine
     assert database_engine is not None
-    if unused_attribute_ids_set := _select_unused_attributes_ids(
-        instance, session, attributes_ids_batch, database_engine
-    ):
+    state_attributes_manager = instance.state_attributes_manager
+    if state_attributes_manager.ref_counting and attributes_ids_batch:
+        state_attributes_manager.release_references(session, attributes_ids_batch)
+    if state_attributes_manager.ref_counts_valid:
+        # Only the attributes ids the reference counts find are checked
+        # against the states table in case the counts are out of date
+        unreferenced_ids = state_attributes_manager.find_unreferenced(
+            session, attributes_ids_batch
+        )
+        unused_attribute_ids_set = _select_unused_attributes_ids(
+            instance, session, unreferenced_ids, database_engine
+        )
+        if len(unused_attribute_ids_set) != len(unreferenced_ids):
+            _invalidate_ref_counts(instance, session)
+    else:
+        unused_attribute_ids_set = _select_unused_attributes_ids(
+            instance, session, set(attributes_ids_batch), database_engine
+        )
+    if unused_attribute_ids_set:
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
 
 
@@ -357,13 +564,26 @@ def _select_unused_event_data_ids(
 
 
 def _purge_unused_data_ids(
-    instance: Recorder, session: Session, data_ids_batch: set[int]
+    instance: Recorder, session: Session, data_ids_batch: Counter[int]
 ) -> None:
     database_engine = instance.database_engine
     assert database_engine is not None
-    if unused_data_ids_set := _select_unused_event_data_ids(
-        instance, session, data_ids_batch, database_engine
-    ):
+    event_data_manager = instance.event_data_manager
+    if event_data_manager.ref_counting and data_ids_batch:
+        event_data_manager.release_references(session, data_ids_batch)
+    if event_data_manager.ref_counts_valid:
+        # See _purge_unused_attributes_ids
+        unreferenced_ids = event_data_manager.find_unreferenced(session, data_ids_batch)
+        unused_data_ids_set = _select_unused_event_data_ids(
+            instance, session, unreferenced_ids, database_engine
+        )
+        if len(unused_data_ids_set) != len(unreferenced_ids):
+            _invalidate_ref_counts(instance, session)
+    else:
+        unused_data_ids_set = _select_unused_event_data_ids(
+            instance, session, set(data_ids_batch), database_engine
+        )
+    if unused_data_ids_set:
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
 
 
@@ -401,7 +621,7 @@ def _select_short_term_statistics_to_purge(
 
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
+) -> tuple[set[int], Counter[int]]:
     """Return a list of state, and attribute ids to purge.
 
     We do not link these anymore since state_change events
@@ -415,18 +635,18 @@ def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     ).all()
     _LOGGER.debug("Selected %s state ids to remove", len(states))
     state_ids = set()
-    attributes_ids = set()
+    attributes_ids: Counter[int] = Counter()
     for state_id, attributes_id in states:
         if state_id:
             state_ids.add(state_id)
         if attributes_id:
-            attributes_ids.add(attributes_id)
+            attributes_ids[attributes_id] += 1
     return state_ids, attributes_ids
 
 
 def _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int], set[int], set[int]]:
+) -> tuple[set[int], set[int], Counter[int], Counter[int]]:
     """Return a list of event, state, and attribute ids to purge linked by the event_id.
 
     We do not link these anymore since state_change events
@@ -441,16 +661,16 @@ def _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
     _LOGGER.debug("Selected %s event ids to remove", len(events))
     event_ids = set()
     state_ids = set()
-    attributes_ids = set()
-    data_ids = set()
+    attributes_ids: Counter[int] = Counter()
+    data_ids: Counter[int] = Counter()
     for event_id, data_id, state_id, attributes_id in events:
         event_ids.add(event_id)
         if state_id:
             state_ids.add(state_id)
         if attributes_id:
-            attributes_ids.add(attributes_id)
+            attributes_ids[attributes_id] += 1
         if data_id:
-            data_ids.add(data_id)
+            data_ids[data_id] += 1
     return event_ids, state_ids, attributes_ids, data_ids
 
 
@@ -536,6 +756,15 @@ def _purge_old_recorder_runs(
     _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
 
+def _purge_old_state_checkpoints(session: Session, purge_before: datetime) -> None:
+    """Purge all old state checkpoints."""
+    # There is a checkpoint per entity per hour, small enough to not batch
+    deleted_rows = session.execute(
+        delete_state_checkpoints_before(purge_before.timestamp())
+    )
+    _LOGGER.debug("Deleted %s state_checkpoints", deleted_rows)
+
+
 def _purge_old_event_types(instance: Recorder, session: Session) -> None:
     """Purge all old event types."""
     # Event types is small, no need to batch run it
@@ -653,13 +882,9 @@ def _purge_filtered_states(
     # created but since we did not remove them when we stopped adding new ones
     # we will need to purge them here.
     _purge_event_ids(session, filtered_event_ids)
-    unused_attribute_ids_set = _select_unused_attributes_ids(
-        instance,
-        session,
-        {id_ for id_ in attributes_ids if id_ is not None},
-        database_engine,
+    _purge_unused_attributes_ids(
+        instance, session, Counter(id_ for id_ in attributes_ids if id_ is not None)
     )
-    _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
     return False
 
 
@@ -692,21 +917,28 @@ def _purge_filtered_events(
     if (
         instance.use_legacy_events_index
         and (
-            states := session.query(States.state_id)
+            states := session.query(States.state_id, States.attributes_id)
             .filter(States.event_id.in_(event_ids_set))
             .all()
         )
-        and (state_ids := {state_id for (state_id,) in states})
+        and (state_ids := {state_id for state_id, _ in states})
     ):
         # These are legacy states that are linked to an event that are no longer
         # created but since we did not remove them when we stopped adding new ones
         # we will need to purge them here.
         _purge_state_ids(instance, session, state_ids)
+        if instance.state_attributes_manager.ref_counting and (
+            attributes_ids := Counter(
+                attributes_id for _, attributes_id in states if attributes_id
+            )
+        ):
+            instance.state_attributes_manager.release_references(
+                session, attributes_ids
+            )
     _purge_event_ids(session, event_ids_set)
-    if unused_data_ids_set := _select_unused_event_data_ids(
-        instance, session, set(data_ids), database_engine
-    ):
-        _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    _purge_unused_data_ids(
+        instance, session, Counter(id_ for id_ in data_ids if id_ is not None)
+    )
     return False
 
 
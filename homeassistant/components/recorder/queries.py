@@ -5,7 +5,17 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import and_, delete, distinct, func, lambda_stmt, select, update
+from sqlalchemy import (
+    and_,
+    bindparam,
+    delete,
+    distinct,
+    func,
+    lambda_stmt,
+    select,
+    update,
+)
+from sqlalchemy.sql.dml import Update
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -16,6 +26,7 @@ from .db_schema import (
     MigrationChanges,
     RecorderRuns,
     StateAttributes,
+    StateCheckpoints,
     States,
     StatesMeta,
     Statistics,
@@ -162,6 +173,106 @@ def data_ids_exist_in_events(
     )
 
 
+def update_state_attributes_ref_counts() -> Update:
+    """Generate an update adding to the ref_count of state_attributes rows.
+
+    This query is intentionally not a lambda statement as it is
+    executed with many sets of parameters.
+    """
+    return (
+        update(StateAttributes)
+        .where(StateAttributes.attributes_id == bindparam("b_id"))
+        .values(ref_count=StateAttributes.ref_count + bindparam("b_delta"))
+    )
+
+
+def update_event_data_ref_counts() -> Update:
+    """Generate an update adding to the ref_count of event_data rows.
+
+    This query is intentionally not a lambda statement as it is
+    executed with many sets of parameters.
+    """
+    return (
+        update(EventData)
+        .where(EventData.data_id == bindparam("b_id"))
+        .values(ref_count=EventData.ref_count + bindparam("b_delta"))
+    )
+
+
+def find_unreferenced_attributes_ids(
+    attributes_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find attributes ids that are no longer referenced by any state."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id)
+        .where(StateAttributes.attributes_id.in_(attributes_ids))
+        .where(StateAttributes.ref_count <= 0)
+    )
+
+
+def find_unreferenced_data_ids(data_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find data ids that are no longer referenced by any event."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .where(EventData.data_id.in_(data_ids))
+        .where(EventData.ref_count <= 0)
+    )
+
+
+def find_attributes_ids_to_count(
+    after_attributes_id: int, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find the next attributes ids to count the references of."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id)
+        .where(StateAttributes.attributes_id > after_attributes_id)
+        .order_by(StateAttributes.attributes_id)
+        .limit(max_bind_vars)
+    )
+
+
+def find_data_ids_to_count(
+    after_data_id: int, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find the next data ids to count the references of."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .where(EventData.data_id > after_data_id)
+        .order_by(EventData.data_id)
+        .limit(max_bind_vars)
+    )
+
+
+def count_state_attributes_references(
+    attributes_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Set the ref_count of state_attributes rows from the states table."""
+    return lambda_stmt(
+        lambda: update(StateAttributes)
+        .where(StateAttributes.attributes_id.in_(attributes_ids))
+        .values(
+            ref_count=select(func.count())
+            .where(States.attributes_id == StateAttributes.attributes_id)
+            .scalar_subquery()
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def count_event_data_references(data_ids: Iterable[int]) -> StatementLambdaElement:
+    """Set the ref_count of event_data rows from the events table."""
+    return lambda_stmt(
+        lambda: update(EventData)
+        .where(EventData.data_id.in_(data_ids))
+        .values(
+            ref_count=select(func.count())
+            .where(Events.data_id == EventData.data_id)
+            .scalar_subquery()
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
 def disconnect_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     """Disconnect states rows."""
     return lambda_stmt(
@@ -278,6 +389,113 @@ def find_oldest_state() -> StatementLambdaElement:
     )
 
 
+def find_state_checkpoint_hour(hour_ts: float) -> StatementLambdaElement:
+    """Find if the state checkpoint of an hour exists."""
+    return lambda_stmt(
+        lambda: select(StateCheckpoints.hour_ts)
+        .filter(StateCheckpoints.hour_ts == hour_ts)
+        .limit(1)
+    )
+
+
+def find_previous_state_checkpoint_hour(hour_ts: float) -> StatementLambdaElement:
+    """Find the hour of the last state checkpoint before an hour."""
+    return lambda_stmt(
+        lambda: select(func.max(StateCheckpoints.hour_ts)).filter(
+            StateCheckpoints.hour_ts < hour_ts
+        )
+    )
+
+
+def find_state_checkpoint(hour_ts: float) -> StatementLambdaElement:
+    """Find the states of the state checkpoint of an hour."""
+    return lambda_stmt(
+        lambda: select(
+            StateCheckpoints.metadata_id,
+            StateCheckpoints.state_id,
+            StateCheckpoints.last_updated_ts,
+        ).filter(StateCheckpoints.hour_ts == hour_ts)
+    )
+
+
+def _latest_states_in_range_stmt(start_ts: float, end_ts: float) -> Select:
+    """Return the statement to find the latest state of each entity in a range."""
+    most_recent_states = (
+        select(
+            States.metadata_id.label("max_metadata_id"),
+            func.max(States.last_updated_ts).label("max_last_updated"),
+        )
+        .filter(
+            (States.last_updated_ts >= start_ts)
+            & (States.last_updated_ts < end_ts)
+            & States.metadata_id.is_not(None)
+        )
+        .group_by(States.metadata_id)
+        .subquery()
+    )
+    return (
+        select(States.metadata_id, func.max(States.state_id), States.last_updated_ts)
+        .join(
+            most_recent_states,
+            and_(
+                States.metadata_id == most_recent_states.c.max_metadata_id,
+                States.last_updated_ts == most_recent_states.c.max_last_updated,
+            ),
+        )
+        .group_by(States.metadata_id, States.last_updated_ts)
+    )
+
+
+def find_latest_states_in_range(
+    start_ts: float, end_ts: float
+) -> StatementLambdaElement:
+    """Find the latest state of each entity updated in a time range."""
+    return lambda_stmt(lambda: _latest_states_in_range_stmt(start_ts, end_ts))
+
+
+def find_latest_states_before(
+    end_ts: float, metadata_ids: list[int]
+) -> StatementLambdaElement:
+    """Find the latest state of each of the entities before end_ts.
+
+    The latest state of each entity is found with an index seek so the
+    whole states table is not scanned.
+    """
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id, States.state_id, States.last_updated_ts)
+        .select_from(StatesMeta)
+        .join(
+            States,
+            and_(
+                States.last_updated_ts
+                == (
+                    select(States.last_updated_ts)
+                    .where(
+                        (StatesMeta.metadata_id == States.metadata_id)
+                        & (States.last_updated_ts < end_ts)
+                    )
+                    .order_by(States.last_updated_ts.desc())
+                    .limit(1)
+                )
+                .scalar_subquery()
+                .correlate(StatesMeta),
+                States.metadata_id == StatesMeta.metadata_id,
+            ),
+        )
+        .where(StatesMeta.metadata_id.in_(metadata_ids))
+        .order_by(States.state_id)
+    )
+
+
+def delete_state_checkpoints_before(purge_before: float) -> StatementLambdaElement:
+    """Delete the state checkpoints before purge_before."""
+    return lambda_stmt(
+        lambda: delete(StateCheckpoints)
+        .filter(StateCheckpoints.hour_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -469,6 +687,15 @@ def get_migration_changes() -> StatementLambdaElement:
     )
 
 
+def delete_migration_changes(migration_id: str) -> StatementLambdaElement:
+    """Forget that a migration was done so it runs again."""
+    return lambda_stmt(
+        lambda: delete(MigrationChanges).where(
+            MigrationChanges.migration_id == migration_id
+        )
+    )
+
+
 def find_event_types_to_purge() -> StatementLambdaElement:
     """Find event_type_ids to purge.
 
@@ -55,6 +55,17 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_commit_info(instance: Recorder) -> dict[str, Any]:
+    """Get commit and queue info."""
+    commit_scheduler = instance.commit_scheduler
+    return {
+        "commit_latency": f"{commit_scheduler.last_commit_latency * 1000:.2f} ms",
+        "commit_batch_size": commit_scheduler.last_commit_batch_size,
+        "queue_depth": instance.backlog,
+    }
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -72,4 +83,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | _async_get_commit_info(instance)
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Protocol
 
 from lru import LRU
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.dml import Update
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.event_type import EventType
 
 if TYPE_CHECKING:
     from ..core import Recorder
 
 
+class _RefCounted(Protocol):
+    """A row with a ref_count column."""
+
+    ref_count: int | None
+
+
 class BaseTableManager[_DataT]:
     """Base class for table managers."""
 
@@ -74,3 +86,106 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+
+class BaseRefCountingLRUTableManager[_DataT: _RefCounted](
+    BaseLRUTableManager[_DataT], ABC
+):
+    """Base class for LRU table managers of rows shared by reference.
+
+    When reference counting is enabled the number of rows referencing
+    each shared row is kept in its ref_count column. References to
+    pending rows are counted on the pending row itself and references
+    to existing rows are collected and written when the session is
+    committed so purge can find unreferenced rows by primary key.
+    """
+
+    def __init__(self, recorder: Recorder, lru_size: int) -> None:
+        """Initialize the reference counting LRU table manager."""
+        super().__init__(recorder, lru_size)
+        self.ref_counting = recorder.ref_counting
+        # Set once the reference counts of all existing rows are known
+        self.ref_counts_valid = False
+        self._pending_references: dict[int, int] = {}
+
+    @abstractmethod
+    def _update_ref_counts(self) -> Update:
+        """Return the statement to add to the ref_count of rows."""
+
+    @abstractmethod
+    def _find_unreferenced(self, ids: Iterable[int]) -> StatementLambdaElement:
+        """Return the statement to find unreferenced ids."""
+
+    def add_reference(self, id_or_pending: int | _DataT) -> None:
+        """Count a new reference to an existing or pending row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self.ref_counting:
+            return
+        if type(id_or_pending) is int:
+            references = self._pending_references
+            references[id_or_pending] = references.get(id_or_pending, 0) + 1
+        else:
+            id_or_pending.ref_count = (id_or_pending.ref_count or 0) + 1
+
+    def flush_references(self, session: Session) -> None:
+        """Write the references counted since the last commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._add_to_ref_counts(session, self._pending_references)
+
+    def release_references(
+        self, session: Session, references: Mapping[int, int]
+    ) -> None:
+        """Release the references of purged rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._add_to_ref_counts(
+            session, {id_: -count for id_, count in references.items()}
+        )
+
+    def find_unreferenced(self, session: Session, ids: Iterable[int]) -> set[int]:
+        """Return the ids which are no longer referenced.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        unreferenced: set[int] = set()
+        for ids_chunk in chunked_or_all(ids, self.recorder.max_bind_vars):
+            unreferenced.update(
+                id_ for (id_,) in session.execute(self._find_unreferenced(ids_chunk))
+            )
+        return unreferenced
+
+    def _add_to_ref_counts(self, session: Session, deltas: Mapping[int, int]) -> None:
+        """Add to the ref_count of existing rows."""
+        if not deltas:
+            return
+        with session.no_autoflush:
+            session.connection().execute(
+                self._update_ref_counts(),
+                [{"b_id": id_, "b_delta": delta} for id_, delta in deltas.items()],
+            )
+
+    def post_commit_references(self) -> None:
+        """Call after commit to clear the references that were written.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_references.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._pending_references.clear()
@@ -7,15 +7,21 @@ import logging
 from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.dml import Update
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import Event
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import EventData
-from ..queries import get_shared_event_datas
+from ..queries import (
+    find_unreferenced_data_ids,
+    get_shared_event_datas,
+    update_event_data_ref_counts,
+)
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseRefCountingLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -26,13 +32,21 @@ CACHE_SIZE = 2048
 _LOGGER = logging.getLogger(__name__)
 
 
-class EventDataManager(BaseLRUTableManager[EventData]):
+class EventDataManager(BaseRefCountingLRUTableManager[EventData]):
     """Manage the EventData table."""
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
 
+    def _update_ref_counts(self) -> Update:
+        """Return the statement to add to the ref_count of rows."""
+        return update_event_data_ref_counts()
+
+    def _find_unreferenced(self, ids: Iterable[int]) -> StatementLambdaElement:
+        """Return the statement to find unreferenced ids."""
+        return find_unreferenced_data_ids(ids)
+
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
         try:
@@ -7,15 +7,21 @@ import logging
 from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.dml import Update
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import (
+    find_unreferenced_attributes_ids,
+    get_shared_attributes,
+    update_state_attributes_ref_counts,
+)
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseRefCountingLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -31,13 +37,21 @@ CACHE_SIZE = 2048
 _LOGGER = logging.getLogger(__name__)
 
 
-class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
+class StateAttributesManager(BaseRefCountingLRUTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
 
+    def _update_ref_counts(self) -> Update:
+        """Return the statement to add to the ref_count of rows."""
+        return update_state_attributes_ref_counts()
+
+    def _find_unreferenced(self, ids: Iterable[int]) -> StatementLambdaElement:
+        """Return the statement to find unreferenced ids."""
+        return find_unreferenced_attributes_ids(ids)
+
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
         try:
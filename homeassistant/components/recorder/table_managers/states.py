@@ -8,6 +8,7 @@ from typing import Any, cast
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
+from ..bulk_insert import PendingStatesRow
 from ..db_schema import States
 from ..queries import find_oldest_state
 from ..util import execute_stmt_lambda_element
@@ -18,7 +19,7 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, States | PendingStatesRow] = {}
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
         self._oldest_ts: float | None = None
@@ -28,7 +29,7 @@ class StatesManager:
         """Return the oldest timestamp."""
         return self._oldest_ts
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> States | PendingStatesRow | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -49,7 +50,15 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def get_committed_state_ids(self) -> set[int]:
+        """Return the state ids of the committed states.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return set(self._last_committed_id.values())
+
+    def add_pending(self, entity_id: str, state: States | PendingStatesRow) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
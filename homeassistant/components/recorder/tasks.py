@@ -15,7 +15,7 @@ from homeassistant.helpers.recorder import DATA_RECORDER
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
-from . import entity_registry, purge, statistics
+from . import checkpoints, entity_registry, purge, statistics
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -124,6 +124,7 @@ class PurgeTask(RecorderTask):
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
             periodic_db_cleanups(instance)
+            instance.hass.add_job(instance.async_purge_finished, self.purge_before)
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(
@@ -173,6 +174,20 @@ class StatisticsTask(RecorderTask):
         instance.queue_task(StatisticsTask(self.start, self.fire_events))
 
 
+@dataclass(slots=True)
+class StateCheckpointTask(RecorderTask):
+    """An object to insert into the recorder queue to write a state checkpoint."""
+
+    hour: datetime
+
+    def run(self, instance: Recorder) -> None:
+        """Write the state checkpoint."""
+        if checkpoints.write_state_checkpoint(instance, self.hour):
+            return
+        # Schedule a new state checkpoint task if this one didn't finish
+        instance.queue_task(StateCheckpointTask(self.hour))
+
+
 @dataclass(slots=True)
 class CompileMissingStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run a compile missing statistics."""
@@ -50,6 +50,7 @@ from .models import (
     UnsupportedDialect,
     process_timestamp,
 )
+from .partitions import create_partitions
 
 if TYPE_CHECKING:
     from sqlite3.dbapi2 import Cursor as SQLiteCursor
@@ -739,6 +740,8 @@ def periodic_db_cleanups(instance: Recorder) -> None:
         with instance.engine.connect() as connection:
             connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE);"))
             connection.execute(text("PRAGMA OPTIMIZE;"))
+    elif instance.engine.dialect.name == SupportedDialect.POSTGRESQL:
+        create_partitions(instance)
 
 
 @contextmanager
@@ -151,7 +151,11 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
 TEMPERATURE_UNITS = {UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT}
 
 
-class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
+class SensorEntity(
+    Entity,
+    cached_properties=CACHED_PROPERTIES_WITH_ATTR_,
+    state_properties={"native_value"},
+):
     """Base class for sensor entities."""
 
     _entity_component_unrecorded_attributes = frozenset({ATTR_OPTIONS})
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 from contextlib import suppress
@@ -10,6 +11,8 @@ import datetime
 import itertools
 import logging
 import math
+from operator import attrgetter
+import threading
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -28,12 +31,22 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -94,6 +107,10 @@ WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 WARN_STATISTICS_MEAN_CHANGED: HassKey[set[str]] = HassKey(
     f"{DOMAIN}_warn_statistics_mean_change"
 )
+# The recent states of sensors used to compile statistics without querying the database
+STATES_BUFFER: HassKey[SensorStatesBuffer] = HassKey(f"{DOMAIN}_states_buffer")
+_SENSOR_PREFIX = f"{DOMAIN}."
+_LAST_UPDATED = attrgetter("last_updated")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 STATE_CLASS_REMOVED_ISSUE = "state_class_removed"
@@ -101,6 +118,183 @@ UNITS_CHANGED_ISSUE = "units_changed"
 MEAN_TYPE_CHANGED_ISSUE = "mean_type_changed"
 
 
+class SensorStatesBuffer:
+    """Keep the recent states of the sensors with a state class in memory.
+
+    The buffer is fed by state_changed events and holds, per sensor, the
+    last state before the period which is being compiled and all newer
+    states. Periods which started after the buffer started tracking are
+    compiled from the buffer instead of querying the states table.
+    Periods before that, for example after a restart, are compiled from
+    the database.
+
+    The buffer is filled from the event loop and read from the
+    recorder thread. The lock is only held to copy or trim the lists of
+    states so the event loop is never blocked by a compile.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the buffer."""
+        self._hass = hass
+        self._lock = threading.Lock()
+        self._states: dict[str, list[State]] = {}
+        # The oldest start time of a period which can be compiled from the buffer
+        self._oldest_start_time: datetime.datetime | None = None
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start tracking the states of all sensors."""
+        sensor_states = [
+            state
+            for state in self._hass.states.async_all(DOMAIN)
+            if ATTR_STATE_CLASS in state.attributes
+        ]
+        with self._lock:
+            self._states = {state.entity_id: [state] for state in sensor_states}
+            # The current states are the only states known before the buffer
+            # started tracking, they must be older than any period compiled
+            # from the buffer.
+            self._oldest_start_time = max(
+                dt_util.utcnow(), *(state.last_updated for state in sensor_states)
+            )
+        self._unsub_state_changed = self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_sensor_state_changed_filter,
+        )
+        self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @callback
+    def _async_stop(self, _event: Event) -> None:
+        """Stop tracking, periods are compiled from the database afterwards."""
+        if self._unsub_state_changed is not None:
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+        with self._lock:
+            self._states = {}
+            self._oldest_start_time = None
+
+    @callback
+    def _async_sensor_state_changed_filter(
+        self, event_data: EventStateChangedData
+    ) -> bool:
+        """Filter state changed events of sensors."""
+        return event_data["entity_id"].startswith(_SENSOR_PREFIX)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a new state to the buffer."""
+        new_state = event.data["new_state"]
+        with self._lock:
+            # Statistics are only compiled for sensors with a state class
+            if new_state is None or ATTR_STATE_CLASS not in new_state.attributes:
+                self._states.pop(event.data["entity_id"], None)
+                return
+            if not (states := self._states.setdefault(new_state.entity_id, [])) or (
+                states[-1].last_updated <= new_state.last_updated
+            ):
+                states.append(new_state)
+            else:
+                insort(states, new_state, key=_LAST_UPDATED)
+
+    def get_history(
+        self,
+        entity_ids: list[str],
+        start: datetime.datetime,
+        end: datetime.datetime,
+        significant_changes_only: bool,
+    ) -> dict[str, list[State]] | None:
+        """Return the states during start-end like the history API does.
+
+        Returns None if the buffer does not hold the states for the whole period.
+        """
+        start_time = start - datetime.timedelta.resolution
+        snapshot: dict[str, list[State]] = {}
+        with self._lock:
+            if self._oldest_start_time is None or self._oldest_start_time > start_time:
+                return None
+            buffered_states = self._states
+            for entity_id in entity_ids:
+                if not (states := buffered_states.get(entity_id)):
+                    continue
+                # Copy the states up to the last state before start and
+                # before end, the rest is done without holding the lock
+                snapshot[entity_id] = states[
+                    max(0, bisect_right(states, start_time, key=_LAST_UPDATED) - 1) : (
+                        bisect_left(states, end, key=_LAST_UPDATED)
+                    )
+                ]
+        history_list: dict[str, list[State]] = {}
+        for entity_id, states in snapshot.items():
+            start_state: State | None = None
+            entity_history: list[State] = []
+            for state in states:
+                if state.last_updated <= start_time:
+                    start_state = state
+                elif (
+                    not significant_changes_only
+                    or state.last_changed == state.last_updated
+                ):
+                    entity_history.append(state)
+            if start_state is not None:
+                entity_history.insert(0, start_state)
+            if entity_history:
+                history_list[entity_id] = entity_history
+        return history_list
+
+    def prune(self, end: datetime.datetime) -> None:
+        """Remove the states which are not needed to compile periods after end."""
+        start_time = end - datetime.timedelta.resolution
+        with self._lock:
+            if self._oldest_start_time is None or self._oldest_start_time >= start_time:
+                return
+            self._oldest_start_time = start_time
+            for states in self._states.values():
+                # Keep the last state before start_time
+                if (
+                    keep_from := bisect_right(states, start_time, key=_LAST_UPDATED) - 1
+                ) > 0:
+                    del states[:keep_from]
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Start the sensor states buffer when the recorder loads the platform."""
+    states_buffer = hass.data[STATES_BUFFER] = SensorStatesBuffer(hass)
+    states_buffer.async_start()
+
+
+def _load_history(
+    hass: HomeAssistant,
+    session: Session,
+    states_buffer: SensorStatesBuffer | None,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    entity_ids: list[str],
+    significant_changes_only: bool,
+) -> dict[str, list[State]]:
+    """Return the history of the entities during start-end."""
+    if (
+        states_buffer is not None
+        and (
+            history_list := states_buffer.get_history(
+                entity_ids, start, end, significant_changes_only
+            )
+        )
+        is not None
+    ):
+        return history_list
+    return history.get_full_significant_states_with_session(
+        hass,
+        session,
+        start - datetime.timedelta.resolution,
+        end,
+        entity_ids=entity_ids,
+        significant_changes_only=significant_changes_only,
+    )
+
+
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
     instance = get_instance(hass)
@@ -460,6 +654,7 @@ def compile_statistics(  # noqa: C901
     """Compile statistics for all entities during start-end."""
     result: list[StatisticResult] = []
 
+    states_buffer = hass.data.get(STATES_BUFFER)
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
     # Get history between start and end
@@ -470,13 +665,8 @@ def compile_statistics(  # noqa: C901
     ]
     history_list: dict[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list = _load_history(
+            hass, session, states_buffer, start, end, entities_full_history, False
         )
     entities_significant_history = [
         i.entity_id
@@ -484,14 +674,12 @@ def compile_statistics(  # noqa: C901
         if "sum" not in wanted_statistics[i.entity_id].types
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        _history_list = _load_history(
+            hass, session, states_buffer, start, end, entities_significant_history, True
         )
         history_list = {**history_list, **_history_list}
+    if states_buffer is not None:
+        states_buffer.prune(end)
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
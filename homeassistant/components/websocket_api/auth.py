@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable
 from typing import TYPE_CHECKING, Any, Final
 
 from aiohttp.web import Request
@@ -57,6 +57,8 @@ class AuthPhase:
         cancel_ws: CALLBACK_TYPE,
         request: Request,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_conflatable_message: Callable[[Hashable, bytes, Callable[[], bytes]], None]
+        | None = None,
     ) -> None:
         """Initialize the authenticated connection."""
         self._hass = hass
@@ -67,6 +69,7 @@ class AuthPhase:
         self._request = request
         # send_bytes_text will directly send a message to the client.
         self._send_bytes_text = send_bytes_text
+        self._send_conflatable_message = send_conflatable_message
 
     async def async_handle(self, msg: JsonValueType) -> ActiveConnection:
         """Handle authentication."""
@@ -89,6 +92,7 @@ class AuthPhase:
                 self._send_message,
                 refresh_token.user,
                 refresh_token,
+                self._send_conflatable_message,
             )
             conn.subscriptions["auth"] = (
                 self._hass.auth.async_register_revoke_token_callback(
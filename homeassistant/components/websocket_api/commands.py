@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
 from functools import lru_cache, partial
 import json
 import logging
@@ -19,6 +20,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -55,11 +57,17 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
+    async_get_import_timings,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.setup import (
+    async_get_loaded_integrations,
+    async_get_setup_timings,
+    async_get_setup_trace,
+)
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +75,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+DATA_ENTITY_SUBSCRIPTIONS: HassKey[_EntitySubscriptions] = HassKey(
+    "websocket_api_entity_subscriptions"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -85,7 +96,9 @@ def async_register_commands(
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_integration_import_info)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -368,30 +381,143 @@ def _send_handle_get_states_response(
 
 
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
+def _user_can_read_entity(user: User, entity_id: str) -> bool:
+    """Return if a user is allowed to read the state of an entity."""
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    return (
+        user.is_admin
+        or permissions.access_all_entities(POLICY_READ)
+        or permissions.check_entity(entity_id, POLICY_READ)
+    )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    send_conflatable_message: Callable[[Hashable, bytes, Callable[[], bytes]], None]
+    entity_ids: set[str] | None
+    entity_filter: Callable[[str], bool] | None
+    user: User
+    message_id_as_bytes: bytes
+    include_sequence: bool
+
+
+class _EntitySubscriptions:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state changed listener is shared by all subscriptions.
+    Subscriptions for specific entities are indexed by entity_id so a
+    state change is only looked at by the subscriptions that want it.
+    The subscriptions are stored in tuples which are replaced when a
+    subscription is added or removed so they can be iterated while
+    messages are sent.
+    """
+
+    __slots__ = ("_all", "_by_entity_id", "_hass", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self._hass = hass
+        self._all: tuple[_EntitySubscription, ...] = ()
+        self._by_entity_id: dict[str, tuple[_EntitySubscription, ...]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, subscription: _EntitySubscription) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if subscription.entity_ids:
+            by_entity_id = self._by_entity_id
+            for entity_id in subscription.entity_ids:
+                by_entity_id[entity_id] = (
+                    *by_entity_id.get(entity_id, ()),
+                    subscription,
+                )
+        else:
+            self._all = (*self._all, subscription)
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+        return partial(self._async_remove, subscription)
+
+    @callback
+    def _async_remove(self, subscription: _EntitySubscription) -> None:
+        """Remove a subscription."""
+        if subscription.entity_ids:
+            by_entity_id = self._by_entity_id
+            for entity_id in subscription.entity_ids:
+                if remaining := tuple(
+                    sub for sub in by_entity_id[entity_id] if sub is not subscription
+                ):
+                    by_entity_id[entity_id] = remaining
+                else:
+                    del by_entity_id[entity_id]
+        else:
+            self._all = tuple(sub for sub in self._all if sub is not subscription)
+        if not self._all and not self._by_entity_id and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward entity state changed events to the subscriptions."""
+        entity_id = event.data["entity_id"]
+        if (by_entity_id := self._by_entity_id.get(entity_id)) is None:
+            if not (subscriptions := self._all):
+                return
+        elif self._all:
+            subscriptions = self._all + by_entity_id
+        else:
+            subscriptions = by_entity_id
+        # Removals have no sequence, a client catching up after missing
+        # them gets them again which is harmless.
+        new_state = event.data["new_state"]
+        sequence = new_state.change_sequence if new_state is not None else None
+        # The permissions are only resolved once per user
+        # for each state change and shared by all of their connections.
+        allowed_by_user_id: dict[str, bool] = {}
+        for subscription in subscriptions:
+            if (entity_filter := subscription.entity_filter) and not entity_filter(
+                entity_id
+            ):
+                continue
+            user = subscription.user
+            if (allowed := allowed_by_user_id.get(user.id)) is None:
+                allowed = allowed_by_user_id[user.id] = _user_can_read_entity(
+                    user, entity_id
+                )
+            if allowed:
+                message_id_as_bytes = subscription.message_id_as_bytes
+                message_sequence = sequence if subscription.include_sequence else None
+                # A pending diff of the entity is replaced by its full state
+                # when the connection is not keeping up
+                subscription.send_conflatable_message(
+                    (message_id_as_bytes, entity_id),
+                    messages.cached_state_diff_message(
+                        message_id_as_bytes, event, message_sequence
+                    ),
+                    partial(
+                        messages.cached_state_full_message,
+                        message_id_as_bytes,
+                        event,
+                        message_sequence,
+                    ),
+                )
+
+
+@callback
+def _async_get_entity_subscriptions(hass: HomeAssistant) -> _EntitySubscriptions:
+    """Return the shared subscribe_entities subscriptions."""
+    if (subscriptions := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        subscriptions = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = _EntitySubscriptions(
+            hass
+        )
+    return subscriptions
 
 
 @callback
@@ -399,32 +525,59 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("include_sequence", default=False): bool,
+        vol.Optional("since"): cv.positive_int,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    A client which passes the sequence of the last change it has seen in
+    since only gets the entities which changed after it, as long as the
+    state machine still tracks those changes.
+    """
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    since: int | None = msg.get("since")
+    include_sequence: bool = msg["include_sequence"] or since is not None
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    sequence = hass.states.async_change_sequence()
+    removed_entity_ids: list[str] | None = None
+    if (
+        since is None
+        or (changed_entity_ids := hass.states.async_entity_ids_changed_since(since))
+        is None
+    ):
+        states = _async_get_allowed_states(hass, connection)
+    else:
+        states, removed_entity_ids = _async_get_allowed_changed_states(
+            hass, connection, changed_entity_ids
+        )
+        if entity_ids or entity_filter:
+            removed_entity_ids = [
+                entity_id
+                for entity_id in removed_entity_ids
+                if (not entity_ids or entity_id in entity_ids)
+                and (not entity_filter or entity_filter(entity_id))
+            ]
+    init_response_sequence = sequence if include_sequence else None
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
+    connection.subscriptions[msg_id] = _async_get_entity_subscriptions(hass).async_add(
+        _EntitySubscription(
+            connection.send_conflatable_message,
             entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
-        ),
+            include_sequence,
+        )
     )
     connection.send_result(msg_id)
 
@@ -446,7 +599,11 @@ def handle_subscribe_entities(
         pass
     else:
         _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+            connection,
+            message_id_as_bytes,
+            serialized_states,
+            init_response_sequence,
+            removed_entity_ids,
         )
         return
 
@@ -463,27 +620,63 @@ def handle_subscribe_entities(
             )
 
     _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+        connection,
+        message_id_as_bytes,
+        serialized_states,
+        init_response_sequence,
+        removed_entity_ids,
     )
 
 
+@callback
+def _async_get_allowed_changed_states(
+    hass: HomeAssistant, connection: ActiveConnection, changed_entity_ids: set[str]
+) -> tuple[list[State], list[str]]:
+    """Return the allowed changed states and the allowed removed entity ids."""
+    user = connection.user
+    check_entity = None
+    if not user.is_admin and not user.permissions.access_all_entities(POLICY_READ):
+        check_entity = user.permissions.check_entity
+    states: list[State] = []
+    removed_entity_ids: list[str] = []
+    for entity_id in changed_entity_ids:
+        if check_entity and not check_entity(entity_id, POLICY_READ):
+            continue
+        if (state := hass.states.get(entity_id)) is None:
+            removed_entity_ids.append(entity_id)
+        else:
+            states.append(state)
+    return states, removed_entity_ids
+
+
 def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
     serialized_states: list[bytes],
+    sequence: int | None = None,
+    removed_entity_ids: list[str] | None = None,
 ) -> None:
-    """Send handle entities init response."""
-    connection.send_message(
-        b"".join(
-            (
-                b'{"id":',
-                message_id_as_bytes,
-                b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
-                b"}}}",
-            )
-        )
-    )
+    """Send handle entities init response.
+
+    The removed entity ids are only passed when the response only has
+    the entities which changed since the sequence the client passed.
+    """
+    parts = [
+        b'{"id":',
+        message_id_as_bytes,
+        b',"type":"event","event":{"a":{',
+        b",".join(serialized_states),
+        b"}",
+    ]
+    if removed_entity_ids is not None:
+        parts.extend((b',"r":', json_bytes(removed_entity_ids)))
+    parts.append(b"}")
+    if sequence is not None:
+        parts.extend((b',"seq":', str(sequence).encode()))
+    if removed_entity_ids is not None:
+        parts.append(b',"delta":true')
+    parts.append(b"}")
+    connection.send_message(b"".join(parts))
 
 
 async def _async_get_all_descriptions_json(hass: HomeAssistant) -> bytes:
@@ -570,6 +763,30 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_trace"})
+def handle_integration_setup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration setup trace command."""
+    connection.send_result(msg["id"], async_get_setup_trace(hass))
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_info"})
+def handle_integration_import_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration import timings command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"module": module, "seconds": seconds}
+            for module, seconds in async_get_import_timings(hass).items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
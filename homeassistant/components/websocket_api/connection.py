@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
 
 from aiohttp import web
@@ -36,17 +37,29 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+def _send_without_conflation(
+    send_message: Callable[[bytes | str | dict[str, Any]], None],
+    key: Hashable,
+    message: bytes,
+    full_message: Callable[[], bytes],
+) -> None:
+    """Send a conflatable message as a regular message."""
+    send_message(message)
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
     __slots__ = (
         "binary_handlers",
         "can_coalesce",
+        "can_compress",
         "handlers",
         "hass",
         "last_id",
         "logger",
         "refresh_token_id",
+        "send_conflatable_message",
         "send_message",
         "subscriptions",
         "supported_features",
@@ -60,16 +73,24 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        send_conflatable_message: Callable[[Hashable, bytes, Callable[[], bytes]], None]
+        | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Send a message which may be replaced by a newer message with the
+        # same key while it is pending, falls back to sending every message
+        self.send_conflatable_message = send_conflatable_message or partial(
+            _send_without_conflation, send_message
+        )
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.can_compress = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
@@ -85,6 +106,7 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.can_compress = const.FEATURE_COMPRESSED_MESSAGES in features
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -30,6 +30,11 @@ PENDING_MSG_PEAK_TIME: Final = 10
 # limit it to a lower number.
 MAX_PENDING_MSG: Final = 4096
 
+# Number of pending messages after which entity state messages
+# replace the pending message of the same entity instead of
+# being queued so slow clients can catch up.
+PENDING_MSG_CONFLATE: Final = 128
+
 # Maximum number of messages that are pending before we force
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
@@ -58,3 +63,10 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_COMPRESSED_MESSAGES = "compressed_messages"
+
+# Messages of at least this size are sent as zlib compressed binary frames
+# to clients supporting compressed messages, unless the websocket
+# connection already negotiated the permessage-deflate extension.
+COMPRESSED_MESSAGE_MIN_SIZE: Final = 32768
+COMPRESSED_MESSAGE_LEVEL: Final = 6
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable, Iterable
 import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 from aiohttp.http_websocket import WebSocketWriter
@@ -23,8 +24,11 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESSED_MESSAGE_LEVEL,
+    COMPRESSED_MESSAGE_MIN_SIZE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_CONFLATE,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -66,12 +70,23 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f"[{self.extra['connid']}] {msg}", kwargs
 
 
+class _ConflatedMessage:
+    """Placeholder in the message queue for a message which can be replaced."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Hashable) -> None:
+        """Initialize the placeholder."""
+        self.key = key
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
     __slots__ = (
         "_authenticated",
         "_closing",
+        "_conflated_messages",
         "_connection",
         "_debug",
         "_handle_task",
@@ -105,7 +120,10 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[bytes] = deque()
+        self._message_queue: deque[bytes | _ConflatedMessage] = deque()
+        # The pending messages which can be replaced by a newer message
+        # with the same key, the queue holds their keys in order
+        self._conflated_messages: dict[Hashable, bytes] = {}
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
         self._async_logging_changed()
@@ -137,6 +155,7 @@ class WebSocketHandler:
         self,
         connection: ActiveConnection,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -146,6 +165,10 @@ class WebSocketHandler:
         loop = self._loop
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        # The messages are already compressed if the permessage-deflate
+        # extension was negotiated, there is no need to compress them twice
+        transport_compressed = bool(wsock.compress)
+        can_compress = connection.can_compress and not transport_compressed
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -161,18 +184,44 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
+                if not can_compress and not transport_compressed:
+                    # compression may be enabled later in the connection
+                    can_compress = connection.can_compress
+
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    if type(message) is _ConflatedMessage:
+                        message = self._conflated_messages.pop(message.key)
                     if self._debug:
                         debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
+                    if can_compress and len(message) >= COMPRESSED_MESSAGE_MIN_SIZE:
+                        await send_bytes_binary(await self._async_compress(message))
+                    else:
+                        await send_bytes_text(message)
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                if conflated_messages := self._conflated_messages:
+                    pending_messages: Iterable[bytes] = [
+                        conflated_messages.pop(pending.key)
+                        if type(pending) is _ConflatedMessage
+                        else pending
+                        for pending in message_queue
+                    ]
+                else:
+                    pending_messages = message_queue  # type: ignore[assignment]
+                coalesced_messages = b"".join((b"[", b",".join(pending_messages), b"]"))
                 message_queue.clear()
                 if self._debug:
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                if (
+                    can_compress
+                    and len(coalesced_messages) >= COMPRESSED_MESSAGE_MIN_SIZE
+                ):
+                    await send_bytes_binary(
+                        await self._async_compress(coalesced_messages)
+                    )
+                else:
+                    await send_bytes_text(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -182,6 +231,14 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            # The pending messages will never be sent
+            self._conflated_messages.clear()
+
+    async def _async_compress(self, message: bytes) -> bytes:
+        """Compress a large message in the executor."""
+        return await self._hass.async_add_executor_job(
+            zlib.compress, message, COMPRESSED_MESSAGE_LEVEL
+        )
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -209,6 +266,47 @@ class WebSocketHandler:
             elif isinstance(message, str):
                 message = message.encode("utf-8")
 
+        self._queue_message(message)
+
+    @callback
+    def _send_conflatable_message(
+        self, key: Hashable, message: bytes, full_message: Callable[[], bytes]
+    ) -> None:
+        """Queue sending a message which may be replaced by a newer message.
+
+        When the client is falling behind, a message replaces the pending
+        message with the same key instead of being queued behind it. The
+        pending message has not been sent yet so it is replaced by the
+        full message which does not depend on the pending message.
+
+        Async friendly.
+        """
+        if self._closing:
+            return
+
+        if (conflated_messages := self._conflated_messages) and (
+            key in conflated_messages
+        ):
+            conflated_messages[key] = full_message()
+            return
+
+        if len(self._message_queue) < PENDING_MSG_CONFLATE:
+            self._queue_message(message)
+            return
+
+        conflated_messages[key] = message
+        self._queue_message(_ConflatedMessage(key))
+
+    @callback
+    def _queued_message_payload(self, message: bytes | _ConflatedMessage) -> bytes:
+        """Return the payload of a queued message."""
+        if type(message) is _ConflatedMessage:
+            return self._conflated_messages[message.key]
+        return message
+
+    @callback
+    def _queue_message(self, message: bytes | _ConflatedMessage) -> None:
+        """Queue a message and close the connection if the queue is full."""
         message_queue = self._message_queue
         message_queue.append(message)
         if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
@@ -220,7 +318,7 @@ class WebSocketHandler:
                 ),
                 self.description,
                 MAX_PENDING_MSG,
-                message,
+                self._queued_message_payload(message),
             )
             self._cancel()
             return
@@ -285,7 +383,7 @@ class WebSocketHandler:
             self.description,
             PENDING_MSG_PEAK,
             PENDING_MSG_PEAK_TIME,
-            self._message_queue[-1],
+            self._queued_message_payload(self._message_queue[-1]),
         )
         self._cancel()
 
@@ -340,14 +438,23 @@ class WebSocketHandler:
             assert writer is not None
 
         send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
+        send_bytes_binary = partial(writer.send_frame, opcode=WSMsgType.BINARY)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._send_conflatable_message,
         )
         connection: ActiveConnection | None = None
         disconnect_warn: str | None = None
 
         try:
-            connection = await self._async_handle_auth_phase(auth, send_bytes_text)
+            connection = await self._async_handle_auth_phase(
+                auth, send_bytes_text, send_bytes_binary
+            )
             self._async_increase_writer_limit(writer)
             await self._async_websocket_command_phase(connection)
         except asyncio.CancelledError:
@@ -383,6 +490,7 @@ class WebSocketHandler:
         self,
         auth: AuthPhase,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> ActiveConnection:
         """Handle the auth phase of the websocket connection."""
         await send_bytes_text(AUTH_REQUIRED_MESSAGE)
@@ -420,7 +528,9 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
-        self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
+        self._writer_task = create_eager_task(
+            self._writer(connection, send_bytes_text, send_bytes_binary)
+        )
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
@@ -142,7 +142,9 @@ def _partial_cached_event_message(event: Event) -> bytes:
 
 
 def cached_state_diff_message(
-    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+    sequence: int | None = None,
 ) -> bytes:
     """Return an event message.
 
@@ -151,12 +153,27 @@ def cached_state_diff_message(
     Since we can have many clients connected that are
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
+
+    The change sequence of the state is added when passed.
     """
+    return _join_partial_message(
+        _partial_cached_state_diff_message(event), message_id_as_bytes, sequence
+    )
+
+
+def _join_partial_message(
+    partial_message: bytes, message_id_as_bytes: bytes, sequence: int | None
+) -> bytes:
+    """Add the id and the change sequence to a partial message."""
+    if sequence is None:
+        return b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
     return b"".join(
         (
-            _partial_cached_state_diff_message(event)[:-1],
+            partial_message[:-1],
             b',"id":',
             message_id_as_bytes,
+            b',"seq":',
+            str(sequence).encode(),
             b"}",
         )
     )
@@ -177,6 +194,40 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def cached_state_full_message(
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+    sequence: int | None = None,
+) -> bytes:
+    """Return an event message with the full new state.
+
+    Unlike the diff, the message does not depend on the previous
+    state so it can replace pending diffs of the same entity.
+    """
+    return _join_partial_message(
+        _partial_cached_state_full_message(event), message_id_as_bytes, sequence
+    )
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_full_message(event: Event[EventStateChangedData]) -> bytes:
+    """Cache and serialize the event with the full new state to json.
+
+    The message is constructed without the id which
+    will be appended in cached_state_full_message
+    """
+    if (new_state := event.data["new_state"]) is None:
+        state_event: dict[str, Any] = {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    else:
+        state_event = {
+            ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}
+        }
+    return (
+        _message_to_json_bytes_or_none({"type": "event", "event": state_event})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -7,23 +7,28 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
-from collections import UserDict, defaultdict
+from collections import UserDict, defaultdict, deque
 from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
+    Sequence,
     ValuesView,
 )
 import concurrent.futures
+from contextlib import contextmanager
 from dataclasses import dataclass
 import datetime
 import enum
 import functools
 import inspect
+import itertools
 import logging
+from operator import itemgetter
 import re
 import threading
 import time
@@ -193,6 +198,10 @@ _DEPRECATED_Config = DeferredDeprecatedAlias(
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# Number of recent state changes the state machine keeps track of
+# so clients can catch up with the changes they missed.
+MAX_TRACKED_STATE_CHANGES = 4096
+
 
 EVENTS_EXCLUDED_FROM_MATCH_ALL = {
     EVENT_HOMEASSISTANT_CLOSE,
@@ -1421,8 +1430,11 @@ def _event_repr(
 _FilterableJobType = tuple[
     HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],  # job
     Callable[[_DataT], bool] | None,  # event_filter
+    int,  # order in which the listener was registered
 ]
 
+_listener_order = itemgetter(2)
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1448,8 +1460,8 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
-# Empty list, used by EventBus.async_fire_internal
-EMPTY_LIST: list[Any] = []
+# Listeners indexed by a key of the event data and its values
+_KeyedListeners = dict[str, dict[Any, tuple[_FilterableJobType[Any], ...]]]
 
 
 @functools.lru_cache
@@ -1462,15 +1474,30 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listener_counts",
+        "_keyed_listeners",
+        "_listener_orders",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
-        """Initialize a new event bus."""
-        self._listeners: defaultdict[
-            EventType[Any] | str, list[_FilterableJobType[Any]]
-        ] = defaultdict(list)
-        self._match_all_listeners: list[_FilterableJobType[Any]] = []
-        self._listeners[MATCH_ALL] = self._match_all_listeners
+        """Initialize a new event bus.
+
+        The listeners are stored in tuples which are replaced when a
+        listener is added or removed so they can be iterated while
+        firing an event without making a copy.
+        """
+        self._match_all_listeners: tuple[_FilterableJobType[Any], ...] = ()
+        self._listeners: dict[
+            EventType[Any] | str, tuple[_FilterableJobType[Any], ...]
+        ] = {MATCH_ALL: self._match_all_listeners}
+        self._keyed_listeners: dict[EventType[Any] | str, _KeyedListeners] = {}
+        self._keyed_listener_counts: dict[EventType[Any] | str, int] = {}
+        self._listener_orders = itertools.count()
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1486,7 +1513,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for key, count in self._keyed_listener_counts.items():
+            listeners[key] = listeners.get(key, 0) + count
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1551,35 +1581,67 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
+        listeners: Sequence[_FilterableJobType[Any]] = self._listeners.get(
+            event_type, ()
+        )
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
-            match_all_listeners = EMPTY_LIST
+            match_all_listeners = ()
+        if (
+            event_data is not None
+            and (keyed_by_key := self._keyed_listeners.get(event_type))
+            and (
+                keyed_listeners := self._async_get_keyed_listeners(
+                    keyed_by_key, event_data
+                )
+            )
+        ):
+            # Run the indexed listeners in the order they were registered
+            # in with the other listeners of the event type
+            listeners = sorted((*listeners, *keyed_listeners), key=_listener_order)
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
-            if event_filter is not None:
-                try:
-                    if event_data is None or not event_filter(event_data):
+        for filterable_jobs in (listeners, match_all_listeners):
+            for job, event_filter, _ in filterable_jobs:
+                if event_filter is not None:
+                    try:
+                        if event_data is None or not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
                         continue
-                except Exception:
-                    _LOGGER.exception("Error in event filter")
-                    continue
-
-            if not event:
-                event = Event(
-                    event_type,
-                    event_data,
-                    origin,
-                    time_fired,
-                    context,
-                )
 
+                if not event:
+                    event = Event(
+                        event_type,
+                        event_data,
+                        origin,
+                        time_fired,
+                        context,
+                    )
+
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
+    @staticmethod
+    def _async_get_keyed_listeners(
+        keyed_by_key: _KeyedListeners, event_data: Mapping[str, Any]
+    ) -> tuple[_FilterableJobType[Any], ...]:
+        """Return the keyed listeners matching the event data."""
+        keyed_listeners: tuple[_FilterableJobType[Any], ...] = ()
+        for key, by_value in keyed_by_key.items():
             try:
-                self._hass.async_run_hass_job(job, event)
-            except Exception:
-                _LOGGER.exception("Error running job: %s", job)
+                if matching := by_value.get(event_data.get(key)):
+                    keyed_listeners = (
+                        keyed_listeners + matching if keyed_listeners else matching
+                    )
+            except (AttributeError, TypeError):
+                # The event data is not a mapping or the value is not hashable
+                continue
+        return keyed_listeners
 
     def listen(
         self,
@@ -1608,6 +1670,8 @@ class EventBus:
         listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[_DataT], bool] | None = None,
         run_immediately: bool | object = _SENTINEL,
+        *,
+        match_data: tuple[str, Iterable[Any]] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1618,6 +1682,14 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        An optional match_data of a key of the event data and the values
+        it must have indexes the listener so it is only looked at when an
+        event with one of those values is fired instead of for every event
+        of the type. The values are looked up in a dict so they must hash
+        like the values in the event data. Indexed listeners run in the
+        order they were registered in with the other listeners of the
+        event type and the event_filter is still called when passed.
+
         If run_immediately is passed:
           - callbacks will be run right away instead of using call_soon.
           - coroutine functions will be scheduled eagerly.
@@ -1636,12 +1708,25 @@ class EventBus:
 
         if event_filter is not None and not is_callback_check_partial(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
-        filterable_job = (HassJob(listener, f"listen {event_type}"), event_filter)
+        filterable_job = (
+            HassJob(listener, f"listen {event_type}"),
+            event_filter,
+            next(self._listener_orders),
+        )
         if event_type == EVENT_STATE_REPORTED:
-            if not event_filter:
+            if not event_filter and not match_data:
                 raise HomeAssistantError(
                     f"Event filter is required for event {event_type}"
                 )
+        if match_data is not None:
+            if event_type == MATCH_ALL:
+                raise HomeAssistantError(
+                    f"Match data is not supported for event {event_type}"
+                )
+            key, values = match_data
+            return self._async_listen_keyed_filterable_job(
+                event_type, key, tuple(dict.fromkeys(values)), filterable_job
+            )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
     @callback
@@ -1651,11 +1736,33 @@ class EventBus:
         filterable_job: _FilterableJobType[_DataT],
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
-        self._listeners[event_type].append(filterable_job)
+        listeners = (*self._listeners.get(event_type, ()), filterable_job)
+        self._listeners[event_type] = listeners
+        if event_type == MATCH_ALL:
+            self._match_all_listeners = listeners
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def _async_listen_keyed_filterable_job(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str,
+        values: tuple[Any, ...],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with one of the values for key."""
+        by_value = self._keyed_listeners.setdefault(event_type, {}).setdefault(key, {})
+        for value in values:
+            by_value[value] = (*by_value.get(value, ()), filterable_job)
+        self._keyed_listener_counts[event_type] = (
+            self._keyed_listener_counts.get(event_type, 0) + 1
+        )
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, key, values, filterable_job
+        )
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1716,6 +1823,7 @@ class EventBus:
                     job_type=HassJobType.Callback,
                 ),
                 None,
+                next(self._listener_orders),
             ),
         )
         one_time_listener.remove = remove
@@ -1732,17 +1840,61 @@ class EventBus:
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(filterable_job)
-
-            # delete event_type list if empty
-            if not self._listeners[event_type] and event_type != MATCH_ALL:
-                self._listeners.pop(event_type)
+            listeners = self._listeners[event_type]
+            index = listeners.index(filterable_job)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+
+        listeners = listeners[:index] + listeners[index + 1 :]
+        if event_type == MATCH_ALL:
+            self._listeners[MATCH_ALL] = self._match_all_listeners = listeners
+        elif listeners:
+            self._listeners[event_type] = listeners
+        else:
+            # delete event_type if it has no listeners left
+            del self._listeners[event_type]
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str,
+        values: tuple[Any, ...],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a listener indexed by the values of a key of the event data.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_by_key = self._keyed_listeners[event_type]
+            by_value = keyed_by_key[key]
+            for value in values:
+                listeners = by_value[value]
+                index = listeners.index(filterable_job)
+                if remaining := listeners[:index] + listeners[index + 1 :]:
+                    by_value[value] = remaining
+                else:
+                    del by_value[value]
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+
+        if not by_value:
+            del keyed_by_key[key]
+            if not keyed_by_key:
+                del self._keyed_listeners[event_type]
+        if count := self._keyed_listener_counts[event_type] - 1:
+            self._keyed_listener_counts[event_type] = count
+        else:
+            del self._keyed_listener_counts[event_type]
 
 
 class CompressedState(TypedDict):
@@ -1772,6 +1924,7 @@ class State:
     __slots__ = (
         "_cache",
         "attributes",
+        "change_sequence",
         "context",
         "domain",
         "entity_id",
@@ -1823,6 +1976,8 @@ class State:
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.state_info = state_info
+        # Set by the state machine when the state is set
+        self.change_sequence = 0
         self.domain, self.object_id = split_entity_id(self.entity_id)
         # The recorder or the websocket_api will always call the timestamps,
         # so we will set the timestamp values here to avoid the overhead of
@@ -2070,7 +2225,16 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_batch",
+        "_bus",
+        "_change_sequence",
+        "_changes",
+        "_loop",
+        "_reservations",
+        "_states",
+        "_states_data",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2081,6 +2245,63 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # The sequence starts at the current time in microseconds so the
+        # sequences of a previous run are always older than the current ones.
+        self._change_sequence = time.time_ns() // 1000
+        self._changes: deque[tuple[int, str]] = deque(maxlen=MAX_TRACKED_STATE_CHANGES)
+        self._batch: tuple[float, Context | None] | None = None
+
+    @contextmanager
+    def async_batch_update(self, context: Context | None = None) -> Generator[None]:
+        """Share the timestamp of the states set in the block.
+
+        States set in the block all get the same last updated time so
+        consumers of the state changed events can handle them as one update.
+        Each state still gets its own context unless a context is passed
+        to the block or when setting the state. A nested block joins the
+        outer block.
+
+        The block must not await.
+
+        This method must be run in the event loop.
+        """
+        if self._batch is not None:
+            yield
+            return
+        self._batch = (time.time(), context)
+        try:
+            yield
+        finally:
+            self._batch = None
+
+    @callback
+    def async_change_sequence(self) -> int:
+        """Return the sequence number of the last state change.
+
+        This method must be run in the event loop.
+        """
+        return self._change_sequence
+
+    @callback
+    def async_entity_ids_changed_since(self, sequence: int) -> set[str] | None:
+        """Return the entity ids which changed or were removed after a sequence.
+
+        Returns None if the changes after the sequence are no longer tracked.
+
+        This method must be run in the event loop.
+        """
+        changes = self._changes
+        if sequence > self._change_sequence or (
+            sequence < self._change_sequence
+            and (not changes or changes[0][0] > sequence + 1)
+        ):
+            return None
+        entity_ids: set[str] = set()
+        for change_sequence, entity_id in reversed(changes):
+            if change_sequence <= sequence:
+                break
+            entity_ids.add(entity_id)
+        return entity_ids
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2193,6 +2414,8 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._change_sequence = change_sequence = self._change_sequence + 1
+        self._changes.append((change_sequence, entity_id))
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2320,7 +2543,11 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # Entities which track their attribute changes pass the
+            # attributes of the old state when they did not change
+            same_attr = (
+                old_attributes := old_state.attributes
+            ) is attributes or old_attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -2334,6 +2561,10 @@ class StateMachine:
         # timestamp implementation:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+        if (batch := self._batch) is not None:
+            timestamp, batch_context = batch
+            if context is None:
+                context = batch_context
         now = dt_util.utc_from_timestamp(timestamp)
 
         if context is None:
@@ -2378,6 +2609,9 @@ class StateMachine:
         )
         if old_state is not None:
             old_state.expire()
+        self._change_sequence = change_sequence = self._change_sequence + 1
+        self._changes.append((change_sequence, entity_id))
+        state.change_sequence = change_sequence
         self._states[entity_id] = state
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
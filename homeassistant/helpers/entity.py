@@ -57,6 +57,7 @@ from homeassistant.exceptions import (
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -71,6 +72,7 @@ timer = time.time
 
 if TYPE_CHECKING:
     from .entity_platform import EntityPlatform
+    from .entity_values import EntityValues
 
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
@@ -265,6 +267,10 @@ class CalculatedState:
     capability_attributes: Mapping[str, Any] | None
 
 
+# Key in the instance __dict__ of the attributes cached by the last state write
+CACHED_ATTRIBUTES = "_cached_attributes"
+
+
 class CachedProperties(type):
     """Metaclass which invalidates cached entity properties on write to _attr_.
 
@@ -278,6 +284,9 @@ class CachedProperties(type):
       data, which will be stored in an attribute prefixed with __attr_
     - The _attr_-property setter will invalidate the @cached_property by calling
       delattr on it
+    - The _attr_-property setter will also drop the cached attributes of the
+      instance, unless the property is in the set of state_properties which
+      only change the state
     """
 
     def __new__(
@@ -286,13 +295,15 @@ class CachedProperties(type):
         bases: tuple[type, ...],
         namespace: dict[Any, Any],
         cached_properties: set[str] | None = None,
+        state_properties: set[str] | None = None,
         **kwargs: Any,
     ) -> Any:
         """Start creating a new CachedProperties.
 
-        Pop cached_properties and store it in the namespace.
+        Pop cached_properties and state_properties and store them in the namespace.
         """
         namespace["_CachedProperties__cached_properties"] = cached_properties or set()
+        namespace["_CachedProperties__state_properties"] = state_properties or set()
         return super().__new__(mcs, name, bases, namespace, **kwargs)
 
     def __init__(
@@ -306,10 +317,17 @@ class CachedProperties(type):
 
         Wrap _attr_ for cached properties in property objects.
         """
+        state_properties: set[str] = set().union(
+            *(
+                klass.__dict__.get("_CachedProperties__state_properties", ())
+                for klass in cls.__mro__
+            )
+        )
 
         def deleter(name: str) -> Callable[[Any], None]:
             """Create a deleter for an _attr_ property."""
             private_attr_name = f"__attr_{name}"
+            changes_attributes = name not in state_properties
 
             def _deleter(o: Any) -> None:
                 """Delete an _attr_ property.
@@ -322,6 +340,8 @@ class CachedProperties(type):
                 """
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                if changes_attributes:
+                    o.__dict__.pop(CACHED_ATTRIBUTES, None)
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
 
@@ -330,6 +350,7 @@ class CachedProperties(type):
         def setter(name: str) -> Callable[[Any, Any], None]:
             """Create a setter for an _attr_ property."""
             private_attr_name = f"__attr_{name}"
+            changes_attributes = name not in state_properties
 
             def _setter(o: Any, val: Any) -> None:
                 """Set an _attr_ property to the backing __attr attribute.
@@ -344,6 +365,8 @@ class CachedProperties(type):
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                if changes_attributes:
+                    o.__dict__.pop(CACHED_ATTRIBUTES, None)
 
             return _setter
 
@@ -428,8 +451,21 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
 }
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class _CachedAttributes:
+    """Attributes written by an entity and what they were calculated from."""
+
+    registry_entry: er.RegistryEntry | None
+    device_entry: dr.DeviceEntry | None
+    customize: EntityValues | None
+    available: bool
+    attributes: ReadOnlyDict[str, Any]
+
+
 class Entity(
-    metaclass=ABCCachedProperties, cached_properties=CACHED_PROPERTIES_WITH_ATTR_
+    metaclass=ABCCachedProperties,
+    cached_properties=CACHED_PROPERTIES_WITH_ATTR_,
+    state_properties={"state"},
 ):
     """An abstract class for Home Assistant entities."""
 
@@ -514,6 +550,13 @@ class Entity(
     # Job type cache
     _job_types: dict[str, HassJobType] | None = None
 
+    # Reuse the attributes of the last state write until an _attr_ property
+    # which is not a state property is set. Only set this if the attributes
+    # of the entity are only changed by setting new values to _attr_
+    # properties, mutating a dict such as _attr_extra_state_attributes
+    # in place is not noticed.
+    _track_attribute_changes = False
+
     # StateInfo. Set by EntityPlatform by calling async_internal_added_to_hass
     # While not purely typed, it makes typehinting more useful for us
     # and removes the need for constant None checks or asserts.
@@ -1120,6 +1163,48 @@ class Entity(
 
         return (state, attr, capability_attr, original_device_class, supported_features)
 
+    def __async_update_registry_capabilities(
+        self,
+        time_now: float,
+        capabilities: Mapping[str, Any] | None,
+        original_device_class: str | None,
+        supported_features: int,
+    ) -> None:
+        """Update the capabilities in the entity registry."""
+        if not self.__capabilities_updated_at_reported:
+            # _Entity__capabilities_updated_at is because of name mangling
+            if not (
+                capabilities_updated_at := getattr(
+                    self, "_Entity__capabilities_updated_at", None
+                )
+            ):
+                self.__capabilities_updated_at = deque(
+                    maxlen=CAPABILITIES_UPDATE_LIMIT + 1
+                )
+                capabilities_updated_at = self.__capabilities_updated_at
+            capabilities_updated_at.append(time_now)
+            while time_now - capabilities_updated_at[0] > 3600:
+                capabilities_updated_at.popleft()
+            if len(capabilities_updated_at) > CAPABILITIES_UPDATE_LIMIT:
+                self.__capabilities_updated_at_reported = True
+                report_issue = self._suggest_report_issue()
+                _LOGGER.warning(
+                    (
+                        "Entity %s (%s) is updating its capabilities too often,"
+                        " please %s"
+                    ),
+                    self.entity_id,
+                    type(self),
+                    report_issue,
+                )
+        entity_registry = er.async_get(self.hass)
+        self.registry_entry = entity_registry.async_update_entity(
+            self.entity_id,
+            capabilities=capabilities,
+            original_device_class=original_device_class,
+            supported_features=supported_features,
+        )
+
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
@@ -1144,52 +1229,52 @@ class Entity(
             return
 
         state_calculate_start = timer()
-        state, attr, capabilities, original_device_class, supported_features = (
-            self.__async_calculate_state()
-        )
-        time_now = timer()
-
-        if entry:
-            # Make sure capabilities in the entity registry are up to date. Capabilities
-            # include capability attributes, device class and supported features
-            supported_features = supported_features or 0
-            if (
-                capabilities != entry.capabilities
-                or original_device_class != entry.original_device_class
-                or supported_features != entry.supported_features
-            ):
-                if not self.__capabilities_updated_at_reported:
-                    # _Entity__capabilities_updated_at is because of name mangling
-                    if not (
-                        capabilities_updated_at := getattr(
-                            self, "_Entity__capabilities_updated_at", None
-                        )
-                    ):
-                        self.__capabilities_updated_at = deque(
-                            maxlen=CAPABILITIES_UPDATE_LIMIT + 1
-                        )
-                        capabilities_updated_at = self.__capabilities_updated_at
-                    capabilities_updated_at.append(time_now)
-                    while time_now - capabilities_updated_at[0] > 3600:
-                        capabilities_updated_at.popleft()
-                    if len(capabilities_updated_at) > CAPABILITIES_UPDATE_LIMIT:
-                        self.__capabilities_updated_at_reported = True
-                        report_issue = self._suggest_report_issue()
-                        _LOGGER.warning(
-                            (
-                                "Entity %s (%s) is updating its capabilities too often,"
-                                " please %s"
-                            ),
-                            entity_id,
-                            type(self),
-                            report_issue,
-                        )
-                entity_registry = er.async_get(self.hass)
-                self.registry_entry = entity_registry.async_update_entity(
-                    self.entity_id,
-                    capabilities=capabilities,
-                    original_device_class=original_device_class,
-                    supported_features=supported_features,
+        track_attribute_changes = self._track_attribute_changes
+        customize: EntityValues | None = hass.data.get(DATA_CUSTOMIZE)
+        if (
+            track_attribute_changes
+            and (cached := self.__dict__.get(CACHED_ATTRIBUTES)) is not None
+            and cached.registry_entry is entry
+            and cached.device_entry is self.device_entry
+            and cached.customize is customize
+            and cached.available == (available := self.available)
+        ):
+            # Only the state changed since the last write, reuse the attributes
+            # so they are not calculated and compared to the old attributes
+            state = self._stringify_state(available)
+            attr: dict[str, Any] = cached.attributes
+            time_now = timer()
+        else:
+            state, attr, capabilities, original_device_class, supported_features = (
+                self.__async_calculate_state()
+            )
+            time_now = timer()
+
+            if entry:
+                # Make sure capabilities in the entity registry are up to date.
+                # Capabilities include capability attributes, device class and
+                # supported features
+                supported_features = supported_features or 0
+                if (
+                    capabilities != entry.capabilities
+                    or original_device_class != entry.original_device_class
+                    or supported_features != entry.supported_features
+                ):
+                    self.__async_update_registry_capabilities(
+                        time_now,
+                        capabilities,
+                        original_device_class,
+                        supported_features,
+                    )
+
+            # Overwrite properties that have been set in the config file.
+            if customize is not None and (custom := customize.get(entity_id)):
+                attr |= custom
+
+            if track_attribute_changes:
+                attr = ReadOnlyDict(attr)
+                self.__dict__[CACHED_ATTRIBUTES] = _CachedAttributes(
+                    entry, self.device_entry, customize, self.available, attr
                 )
 
         if time_now - state_calculate_start > 0.4 and not self._slow_reported:
@@ -1203,19 +1288,6 @@ class Entity(
                 report_issue,
             )
 
-        try:
-            # Most of the time this will already be
-            # set and since try is near zero cost
-            # on py3.11+ its faster to assume it is
-            # set and catch the exception if it is not.
-            customize = hass.data[DATA_CUSTOMIZE]
-        except KeyError:
-            pass
-        else:
-            # Overwrite properties that have been set in the config file.
-            if custom := customize.get(entity_id):
-                attr |= custom
-
         if (
             self._context_set is not None
             and time_now - self._context_set > CONTEXT_RECENT_TIME_SECONDS
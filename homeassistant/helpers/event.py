@@ -9,6 +9,8 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial, wraps
+from heapq import heapify, heappop, heappush
+from itertools import count
 import logging
 from random import randint
 import time
@@ -76,6 +78,11 @@ _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
 
+_TIMER_WHEEL: HassKey[_TimerWheel] = HassKey("timer_wheel")
+_TRACK_TIME_PATTERN_DATA: HassKey[dict[_TimePatternKey, _TrackTimePattern]] = HassKey(
+    "track_time_pattern_data"
+)
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -89,8 +96,18 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Timers due within the same slot of TIMER_WHEEL_RESOLUTION seconds share a
+# single loop handle which runs all of them that are due at once.
+TIMER_WHEEL_RESOLUTION = 1.0
+
+_CLOCK_RESOLUTION = time.get_clock_info("monotonic").resolution
+# The number of cancelled timers a bucket keeps before compacting its heap
+_TIMER_BUCKET_MIN_COMPACT = 64
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 
+type _TimePatternKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool]
+
 
 @dataclass(slots=True, frozen=True)
 class _KeyedEventTracker(Generic[_TypedDictT]):
@@ -1485,19 +1502,214 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
+class _Timer:
+    """A timer scheduled on the timer wheel.
+
+    A timer can be scheduled again once it has run or has been cancelled.
+    The generation changes each time the timer is scheduled or cancelled
+    so entries of the bucket heaps for an earlier schedule are skipped.
+    """
+
+    __slots__ = ("bucket", "callback", "generation", "job", "when")
+
+    def __init__(self, job: HassJob[..., Any], callback: Callable[[], None]) -> None:
+        """Initialize the timer."""
+        self.job = job
+        self.callback = callback
+        self.when = 0.0
+        self.generation = 0
+        self.bucket: _TimerBucket | None = None
+
+
+class _TimerBucket:
+    """Timers of the timer wheel which are due in the same slot.
+
+    The timers are kept in a heap of (when, generation, timer). Cancelled
+    timers are not removed from the heap, their entries are skipped when
+    they reach the top because the generation of the timer changed.
+    """
+
+    __slots__ = ("handle", "heap", "key", "size", "wheel", "when")
+
+    def __init__(self, wheel: _TimerWheel, key: tuple[int, bool | None]) -> None:
+        """Initialize the bucket."""
+        self.wheel = wheel
+        self.key = key
+        self.heap: list[tuple[float, int, _Timer]] = []
+        self.size = 0
+        self.handle: asyncio.TimerHandle | None = None
+        self.when = 0.0
+
+    @callback
+    def async_push(self, timer: _Timer) -> None:
+        """Add a timer to the bucket."""
+        heappush(self.heap, (timer.when, timer.generation, timer))
+        self.size += 1
+        timer.bucket = self
+
+    @callback
+    def async_remove(self, timer: _Timer) -> None:
+        """Remove a timer from the bucket."""
+        timer.bucket = None
+        self.size -= 1
+        heap = self.heap
+        # Compact the heap when it mostly holds cancelled timers
+        if len(heap) > 2 * self.size + _TIMER_BUCKET_MIN_COMPACT:
+            heap[:] = [entry for entry in heap if entry[2].generation == entry[1]]
+            heapify(heap)
+
+    @callback
+    def async_arm(self, timer: _Timer) -> None:
+        """Arm the loop handle of the bucket for a timer."""
+        self.when = when = timer.when
+        # The job of the timer is passed to the loop handle so the handle
+        # is cancelled on shutdown and shows up in the debug logs as if
+        # the timer had its own handle. Timers are kept in buckets by
+        # cancel_on_shutdown so the other timers of the bucket match.
+        self.handle = self.wheel.loop.call_at(when, self._async_run, timer.job)
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop the timers of the bucket.
+
+        Used when the loop handle of the bucket was cancelled from outside
+        the wheel, which cancelled the timers of the bucket as well.
+        """
+        generations = self.wheel.generations
+        for _, generation, timer in self.heap:
+            if timer.generation == generation:
+                timer.generation = next(generations)
+                timer.bucket = None
+        self.heap.clear()
+        self.size = 0
+        self.handle = None
+
+    @callback
+    def async_arm_next(self) -> None:
+        """Arm the loop handle for the earliest timer or remove the bucket."""
+        heap = self.heap
+        while heap and heap[0][2].generation != heap[0][1]:
+            heappop(heap)
+        if heap:
+            self.async_arm(heap[0][2])
+        else:
+            del self.wheel.buckets[self.key]
+
+    @callback
+    def _async_run(self, _: Any, fire_all: bool = False) -> None:
+        """Run the timers of the bucket which are due."""
+        self.handle = None
+        loop = self.wheel.loop
+        # The timers the handle was armed for are always due. The time
+        # tracker clock decides if the others are, so tests which move
+        # the clock forward run them as well.
+        wall_time = time.time()
+        now = max(
+            self.when,
+            loop.time() + _CLOCK_RESOLUTION + time_tracker_timestamp() - wall_time,
+        )
+        heap = self.heap
+        due: list[tuple[_Timer, int]] = []
+        while heap and (fire_all or heap[0][0] <= now):
+            _, generation, timer = heappop(heap)
+            if timer.generation == generation:
+                timer.bucket = None
+                self.size -= 1
+                due.append((timer, generation))
+        self.async_arm_next()
+
+        for timer, generation in due:
+            # A timer which ran earlier in the batch may have cancelled
+            # or scheduled again one of the other due timers
+            if timer.generation != generation:
+                continue
+            try:
+                timer.callback()
+            except Exception as exc:  # noqa: BLE001
+                loop.call_exception_handler(
+                    {
+                        "message": f"Exception in callback {timer.callback!r}",
+                        "exception": exc,
+                    }
+                )
+
+
+class _TimerWheel:
+    """Coalesce timers into one loop handle per slot.
+
+    Instead of a loop handle per timer, the loop holds one handle per slot
+    of TIMER_WHEEL_RESOLUTION seconds, armed at the earliest deadline of
+    the slot. Cancelling a timer only removes it from its bucket, and the
+    handle is only re-armed when an earlier timer is added to the slot.
+    """
+
+    __slots__ = ("buckets", "generations", "loop")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the timer wheel."""
+        self.loop = loop
+        self.buckets: dict[tuple[int, bool | None], _TimerBucket] = {}
+        self.generations = count(1)
+
+    @callback
+    def async_schedule(self, timer: _Timer, when: float) -> None:
+        """Schedule a timer at the loop time when."""
+        self.async_cancel(timer)
+        timer.when = when
+        timer.generation = next(self.generations)
+        key = (int(when // TIMER_WHEEL_RESOLUTION), timer.job.cancel_on_shutdown)
+        if (bucket := self.buckets.get(key)) is None:
+            bucket = self.buckets[key] = _TimerBucket(self, key)
+        elif (handle := bucket.handle) is not None and handle.cancelled():
+            # The handle is cancelled with the timers on shutdown
+            bucket.async_clear()
+        bucket.async_push(timer)
+        if (handle := bucket.handle) is None:
+            bucket.async_arm_next()
+        elif when < bucket.when:
+            handle.cancel()
+            bucket.async_arm(timer)
+
+    @callback
+    def async_cancel(self, timer: _Timer) -> None:
+        """Cancel a timer.
+
+        A timer which is due in the batch that is running is not run.
+        """
+        timer.generation = next(self.generations)
+        if (bucket := timer.bucket) is None:
+            return
+        bucket.async_remove(timer)
+        if bucket.size:
+            return
+        if bucket.handle is not None:
+            bucket.handle.cancel()
+            bucket.handle = None
+        del self.buckets[bucket.key]
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the timer wheel."""
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is None:
+        wheel = hass.data[_TIMER_WHEEL] = _TimerWheel(hass.loop)
+    return wheel
+
+
 @dataclass(slots=True)
 class _TrackPointUTCTime:
     hass: HomeAssistant
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    _timer: _Timer | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
         loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
+        self._timer = _Timer(self.job, self)
+        _async_get_timer_wheel(self.hass).async_schedule(
+            self._timer, loop.time() + self.expected_fire_timestamp - time.time()
         )
 
     @callback
@@ -1516,18 +1728,21 @@ class _TrackPointUTCTime:
         # time.
         if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            if TYPE_CHECKING:
+                assert self._timer is not None
+            _async_get_timer_wheel(self.hass).async_schedule(
+                self._timer, self.hass.loop.time() + delta
+            )
             return
 
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Cancel the timer."""
         if TYPE_CHECKING:
-            assert self._cancel_callback is not None
-        self._cancel_callback.cancel()
+            assert self._timer is not None
+        _async_get_timer_wheel(self.hass).async_cancel(self._timer)
 
 
 @callback
@@ -1565,6 +1780,19 @@ def _run_async_call_action(
     hass.async_run_hass_job(job, time_tracker_utcnow())
 
 
+@callback
+def _async_schedule_call_action(
+    hass: HomeAssistant,
+    job: HassJob[[datetime], Coroutine[Any, Any, None] | None],
+    loop_time: float,
+) -> CALLBACK_TYPE:
+    """Schedule a call action on the timer wheel."""
+    wheel = _async_get_timer_wheel(hass)
+    timer = _Timer(job, partial(_run_async_call_action, hass, job))
+    wheel.async_schedule(timer, loop_time)
+    return partial(wheel.async_cancel, timer)
+
+
 @callback
 @bind_hass
 def async_call_at(
@@ -1582,7 +1810,7 @@ def async_call_at(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
-    return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
+    return _async_schedule_call_action(hass, job, loop_time)
 
 
 @callback
@@ -1604,8 +1832,7 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    loop = hass.loop
-    return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
+    return _async_schedule_call_action(hass, job, hass.loop.time() + delay)
 
 
 call_later = threaded_listener_factory(async_call_later)
@@ -1620,9 +1847,9 @@ class _TrackTimeInterval:
     job_name: str
     action: Callable[[datetime], Coroutine[Any, Any, None] | None]
     cancel_on_shutdown: bool | None
-    _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
+    _track_job: HassJob[[], None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _timer: _Timer | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1637,20 +1864,19 @@ class _TrackTimeInterval:
             f"track time interval {self.seconds}",
             cancel_on_shutdown=self.cancel_on_shutdown,
         )
+        self._timer = _Timer(self._track_job, self._interval_listener)
         self._schedule_timer()
 
     def _schedule_timer(self) -> None:
         """Schedule the timer."""
         if TYPE_CHECKING:
-            assert self._track_job is not None
-        hass = self.hass
-        loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+            assert self._timer is not None
+        _async_get_timer_wheel(self.hass).async_schedule(
+            self._timer, self.hass.loop.time() + self.seconds
         )
 
     @callback
-    def _interval_listener(self, _: Any) -> None:
+    def _interval_listener(self) -> None:
         """Handle elapsed intervals."""
         if TYPE_CHECKING:
             assert self._run_job is not None
@@ -1659,10 +1885,10 @@ class _TrackTimeInterval:
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Cancel the timer."""
         if TYPE_CHECKING:
-            assert self._timer_handle is not None
-        self._timer_handle.cancel()
+            assert self._timer is not None
+        _async_get_timer_wheel(self.hass).async_cancel(self._timer)
 
 
 @callback
@@ -1787,36 +2013,65 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
-@dataclass(slots=True)
-class _TrackUTCTimeChange:
-    hass: HomeAssistant
-    time_match_expression: tuple[list[int], list[int], list[int]]
-    microsecond: int
-    local: bool
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
-    listener_job_name: str
-    _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
-    _cancel_callback: CALLBACK_TYPE | None = None
+class _TrackTimePattern:
+    """Shared wakeup of the time change listeners with the same time pattern.
 
-    def async_attach(self) -> None:
-        """Initialize track job."""
-        self._pattern_time_change_listener_job = HassJob(
+    The time pattern is compiled once and the next time it matches is
+    only calculated once per wakeup for all its listeners.
+    """
+
+    __slots__ = (
+        "_cancel_callback",
+        "_job",
+        "expression",
+        "hass",
+        "key",
+        "listeners",
+        "local",
+        "microsecond",
+        "next_fire",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: _TimePatternKey,
+        expression: dt_util.TimeExpression,
+        local: bool,
+        listener_job_name: str,
+    ) -> None:
+        """Initialize the time pattern."""
+        self.hass = hass
+        self.key = key
+        self.expression = expression
+        self.local = local
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        self.microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        self.listeners: dict[_TrackUTCTimeChange, None] = {}
+        self.next_fire: datetime | None = None
+        self._job = HassJob(
             self._pattern_time_change_listener,
-            self.listener_job_name,
+            listener_job_name,
             job_type=HassJobType.Callback,
         )
-        self._cancel_callback = async_track_point_in_utc_time(
-            self.hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(dt_util.utcnow()),
-        )
+        self._cancel_callback: CALLBACK_TYPE | None = None
 
-    def _calculate_next(self, utc_now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
+    def calculate_next(self, utc_now: datetime) -> datetime:
+        """Calculate the next time the pattern matches."""
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        return dt_util.find_next_time_expression_time(
-            localized_now, *self.time_match_expression
-        ).replace(microsecond=self.microsecond)
+        return self.expression.find_next(localized_now).replace(
+            microsecond=self.microsecond
+        )
+
+    @callback
+    def async_schedule(self, next_fire: datetime) -> None:
+        """Schedule the wakeup of the listeners."""
+        self.next_fire = next_fire
+        self._cancel_callback = async_track_point_in_utc_time(
+            self.hass, self._job, next_fire
+        )
 
     @callback
     def _pattern_time_change_listener(self, _: datetime) -> None:
@@ -1826,21 +2081,67 @@ class _TrackUTCTimeChange:
         # time when the timer was scheduled
         utc_now = time_tracker_utcnow()
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        if TYPE_CHECKING:
-            assert self._pattern_time_change_listener_job is not None
-        self._cancel_callback = async_track_point_in_utc_time(
-            hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(utc_now + timedelta(seconds=1)),
-        )
-        hass.async_run_hass_job(self.job, localized_now, background=True)
+        self.async_schedule(self.calculate_next(utc_now + timedelta(seconds=1)))
+        listeners = self.listeners
+        for listener in list(listeners):
+            # A listener may have been removed by an earlier one
+            if listener in listeners:
+                hass.async_run_hass_job(listener.job, localized_now, background=True)
 
     @callback
-    def async_cancel(self) -> None:
-        """Cancel the call_at."""
+    def async_remove(self, listener: _TrackUTCTimeChange) -> None:
+        """Remove a listener."""
+        del self.listeners[listener]
+        if self.listeners:
+            return
         if TYPE_CHECKING:
             assert self._cancel_callback is not None
         self._cancel_callback()
+        del self.hass.data[_TRACK_TIME_PATTERN_DATA][self.key]
+
+
+@dataclass(slots=True, eq=False)
+class _TrackUTCTimeChange:
+    hass: HomeAssistant
+    pattern: _TrackTimePattern
+    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    _cancel_first: CALLBACK_TYPE | None = None
+
+    def async_attach(self) -> None:
+        """Initialize track job."""
+        pattern = self.pattern
+        first_fire = pattern.calculate_next(dt_util.utcnow())
+        if pattern.next_fire is None:
+            pattern.async_schedule(first_fire)
+        elif first_fire < pattern.next_fire:
+            # The pattern matches before the shared wakeup, which already
+            # happened for this match before we started listening.
+            self._cancel_first = async_track_point_in_utc_time(
+                self.hass,
+                HassJob(
+                    self._first_time_change_listener,
+                    f"first {self.job.name}",
+                    job_type=HassJobType.Callback,
+                ),
+                first_fire,
+            )
+        pattern.listeners[self] = None
+
+    @callback
+    def _first_time_change_listener(self, _: datetime) -> None:
+        """Listen for the first matching time_changed event."""
+        self._cancel_first = None
+        utc_now = time_tracker_utcnow()
+        localized_now = dt_util.as_local(utc_now) if self.pattern.local else utc_now
+        self.hass.async_run_hass_job(self.job, localized_now, background=True)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop listening."""
+        if self._cancel_first is not None:
+            self._cancel_first()
+            self._cancel_first = None
+        self.pattern.async_remove(self)
 
 
 @callback
@@ -1871,19 +2172,23 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
-    track = _TrackUTCTimeChange(
-        hass,
-        (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
+    # Listeners with the same time pattern share a single wakeup
+    key: _TimePatternKey = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
         local,
-        job,
-        listener_job_name,
     )
+    patterns = hass.data.setdefault(_TRACK_TIME_PATTERN_DATA, {})
+    if (pattern := patterns.get(key)) is None:
+        pattern = patterns[key] = _TrackTimePattern(
+            hass,
+            key,
+            dt_util.TimeExpression(matching_seconds, matching_minutes, matching_hours),
+            local,
+            f"time change listener {hour}:{minute}:{second} local={local}",
+        )
+    track = _TrackUTCTimeChange(hass, pattern, job)
     track.async_attach()
     return track.async_cancel
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
@@ -17,7 +18,7 @@ from homeassistant.util.json import json_loads
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -26,7 +27,7 @@ DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
@@ -34,6 +35,11 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How often the periodic save checks all states instead of only the
+# states written since the last save, and how long the last seen time
+# of an unchanged state is kept
+LAST_SEEN_REFRESH_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -75,6 +81,7 @@ class StoredState:
     def as_dict(self) -> dict[str, Any]:
         """Return a dict representation of the stored state to be JSON serialized."""
         return {
+            "id": self.state.entity_id,
             "state": self.state.json_fragment,
             "extra_data": self.extra_data.as_dict() if self.extra_data else None,
             "last_seen": self.last_seen,
@@ -95,6 +102,34 @@ class StoredState:
         )
 
 
+@dataclass(slots=True, frozen=True)
+class _DumpedState:
+    """A stored state as it was last saved."""
+
+    state: State
+    extra_data: bytes | None
+    last_seen: datetime
+    fragment: json_fragment
+
+
+class RestoreStateStore(Store[dict[str, list[dict[str, Any]]]]):
+    """Store restore state data."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: list[dict[str, Any]],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Migrate to the new version."""
+        if old_major_version > STORAGE_VERSION:
+            raise NotImplementedError
+        # Version 2 stores the states keyed by entity id
+        return {
+            "states": [{"id": item["state"]["entity_id"], **item} for item in old_data]
+        }
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -118,11 +153,14 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+        self.store = RestoreStateStore(
+            hass, STORAGE_VERSION, STORAGE_KEY, journaled=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._dumped_states: dict[str, _DumpedState] = {}
+        self._changed_entity_ids: set[str] = set()
+        self._last_all_states_dump: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -149,7 +187,7 @@ class RestoreStateData:
         else:
             self.last_states = {
                 item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
+                for item in stored_states["states"]
                 if valid_entity_id(item["state"]["entity_id"])
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
@@ -198,15 +236,115 @@ class RestoreStateData:
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+    @callback
+    def _async_get_stored_state(
+        self, entity_id: str, now: datetime
+    ) -> StoredState | None:
+        """Get the state of an entity which should be stored, if any.
+
+        Follows the same rules as async_get_stored_states.
+        """
+        if (
+            state := self.hass.states.get(entity_id)
+        ) is not None and not state.attributes.get(ATTR_RESTORED):
+            if (entity := self.entities.get(entity_id)) is None:
+                return None
+            return StoredState(state, entity.extra_restore_state_data, now)
+        if (
+            stored_state := self.last_states.get(entity_id)
+        ) is None or stored_state.last_seen < now - STATE_EXPIRATION:
+            return None
+        return stored_state
+
+    @callback
+    def _async_dump_state(
+        self, stored_state: StoredState, dumped: _DumpedState | None, full: bool
+    ) -> _DumpedState | None:
+        """Return the serialized stored state.
+
+        The state is only serialized again if it changed since it was last
+        saved. The last seen time of an unchanged state is only refreshed
+        once per LAST_SEEN_REFRESH_INTERVAL unless all states are saved.
+        """
+        try:
+            extra_data = (
+                json_bytes(stored_state.extra_data.as_dict())
+                if stored_state.extra_data
+                else None
+            )
+            if (
+                dumped is not None
+                and dumped.state is stored_state.state
+                and dumped.extra_data == extra_data
+                and (
+                    dumped.last_seen == stored_state.last_seen
+                    or (
+                        not full
+                        and stored_state.last_seen - dumped.last_seen
+                        < LAST_SEEN_REFRESH_INTERVAL
+                    )
+                )
+            ):
+                return dumped
+            fragment = json_fragment(json_bytes(stored_state.as_dict()))
+        except TypeError as exc:
+            _LOGGER.error(
+                "Error serializing state of %s",
+                stored_state.state.entity_id,
+                exc_info=exc,
+            )
+            return None
+        return _DumpedState(
+            stored_state.state, extra_data, stored_state.last_seen, fragment
+        )
+
+    async def async_dump_states(self, full: bool = True) -> None:
+        """Save the current state machine to storage.
+
+        If full is False, only the states of the entities which wrote their
+        state since the last save are serialized and appended to the journal
+        of the store, except once per LAST_SEEN_REFRESH_INTERVAL when all
+        states are checked.
+        """
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        previous_states = self._dumped_states
+        changed_entity_ids = self._changed_entity_ids
+        self._changed_entity_ids = set()
+        dumped_states: dict[str, _DumpedState] = {}
+        if (
+            full
+            or self._last_all_states_dump is None
+            or now - self._last_all_states_dump >= LAST_SEEN_REFRESH_INTERVAL
+        ):
+            self._last_all_states_dump = now
+            for stored_state in self.async_get_stored_states():
+                entity_id = stored_state.state.entity_id
+                if (
+                    dumped := self._async_dump_state(
+                        stored_state, previous_states.get(entity_id), full
+                    )
+                ) is not None:
+                    dumped_states[entity_id] = dumped
+        else:
+            dumped_states = previous_states.copy()
+            for entity_id in changed_entity_ids:
+                if (
+                    stored_state := self._async_get_stored_state(entity_id, now)
+                ) is None or (
+                    dumped := self._async_dump_state(
+                        stored_state, previous_states.get(entity_id), full
+                    )
+                ) is None:
+                    dumped_states.pop(entity_id, None)
+                else:
+                    dumped_states[entity_id] = dumped
+        self._dumped_states = dumped_states
+        if full:
+            self.store.async_compact_journal()
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                {"states": [dumped.fragment for dumped in dumped_states.values()]}
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
@@ -215,20 +353,20 @@ class RestoreStateData:
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
-        async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_states(full=False)
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
         self.hass.async_create_task_internal(
-            _async_dump_states(), "RestoreStateData dump"
+            self.async_dump_states(), "RestoreStateData dump"
         )
 
-        # Dump states periodically
+        # Dump changed states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
@@ -246,6 +384,12 @@ class RestoreStateData:
     def async_restore_entity_added(self, entity: RestoreEntity) -> None:
         """Store this entity's state when hass is shutdown."""
         self.entities[entity.entity_id] = entity
+        self._changed_entity_ids.add(entity.entity_id)
+
+    @callback
+    def async_restore_entity_changed(self, entity_id: str) -> None:
+        """Save this entity's state and extra data on the next periodic save."""
+        self._changed_entity_ids.add(entity_id)
 
     @callback
     def async_restore_entity_removed(
@@ -266,6 +410,7 @@ class RestoreStateData:
             )
 
         del self.entities[entity_id]
+        self._changed_entity_ids.add(entity_id)
 
 
 class RestoreEntity(Entity):
@@ -283,6 +428,12 @@ class RestoreEntity(Entity):
         )
         await super().async_internal_will_remove_from_hass()
 
+    @callback
+    def _async_write_ha_state(self) -> None:
+        """Write the state and save it on the next periodic save."""
+        super()._async_write_ha_state()
+        async_get(self.hass).async_restore_entity_changed(self.entity_id)
+
     @callback
     def _async_get_restored_data(self) -> StoredState | None:
         """Get data stored for an entity, if any."""
@@ -6,12 +6,14 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 from propcache.api import cached_property
 
@@ -31,10 +33,11 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, json as json_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
+from .json import json_bytes, json_fragment
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -48,6 +51,137 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+_MISSING = object()
+
+# Suffix of the journal of a journaled store
+JOURNAL_SUFFIX = ".journal"
+# Key of the journal generation in a snapshot of a journaled store
+JOURNAL_KEY = "journal"
+
+# The serialized top level values of the data of a journaled store. Lists of
+# dicts with an id, or json fragments of them, are kept as the serialized
+# items mapped to their id so only changed items are journaled.
+type _JournalItems = dict[str, bytes | dict[bytes, Any]]
+
+
+@dataclass(slots=True)
+class _Journal:
+    """The journal of a journaled store since its snapshot was written."""
+
+    version: tuple[int, int]
+    items: _JournalItems
+    snapshot_size: int
+    size: int = 0
+
+
+def _serialize_keyed_items(
+    value: list[Any], old_items: dict[bytes, Any] | None
+) -> dict[bytes, Any] | None:
+    """Serialize the items of a list of dicts with a unique id.
+
+    The id of a json fragment is only parsed when it is not an old item.
+    Returns None if the items do not all have a unique id.
+    """
+    old_items = old_items or {}
+    keyed: dict[bytes, Any] = {}
+    for item in value:
+        if type(item) is json_fragment:
+            serialized = item.contents
+            if (id_ := old_items.get(serialized, _MISSING)) is _MISSING:
+                if not isinstance(loaded := json_util.json_loads(serialized), dict):
+                    return None
+                id_ = loaded.get("id", _MISSING)
+        elif isinstance(item, dict):
+            serialized = json_bytes(item)
+            id_ = item.get("id", _MISSING)
+        else:
+            return None
+        if id_ is _MISSING or id_ is None:
+            return None
+        keyed[serialized] = id_
+    if len(set(keyed.values())) != len(value):
+        return None
+    return keyed
+
+
+def _serialize_journal_items(
+    data: Mapping[str, Any], old: _JournalItems | None
+) -> _JournalItems:
+    """Serialize the top level values of data, or their items if they have an id."""
+    items: _JournalItems = {}
+    for key, value in data.items():
+        old_value = old.get(key) if old else None
+        if (
+            isinstance(value, list)
+            and value
+            and (
+                keyed := _serialize_keyed_items(
+                    value, old_value if isinstance(old_value, dict) else None
+                )
+            )
+            is not None
+        ):
+            items[key] = keyed
+        else:
+            items[key] = json_bytes(value)
+    return items
+
+
+def _journal_changes(old: _JournalItems, new: _JournalItems) -> list[bytes]:
+    """Return the journal lines which change old into new."""
+    lines: list[bytes] = []
+    for key, value in new.items():
+        old_value = old.get(key)
+        if isinstance(value, bytes):
+            if value != old_value:
+                lines.append(b'{"k":%b,"v":%b}\n' % (json_bytes(key), value))
+            continue
+        if not isinstance(old_value, dict):
+            old_value = {}
+            lines.append(b'{"k":%b,"v":[]}\n' % json_bytes(key))
+        lines.extend(
+            b'{"k":%b,"id":%b,"v":%b}\n' % (json_bytes(key), json_bytes(id_), item)
+            for item, id_ in value.items()
+            if item not in old_value
+        )
+        if removed := set(old_value.values()).difference(value.values()):
+            lines.extend(
+                b'{"k":%b,"id":%b,"r":true}\n' % (json_bytes(key), json_bytes(id_))
+                for id_ in removed
+            )
+    lines.extend(
+        b'{"k":%b,"r":true}\n' % json_bytes(key) for key in old.keys() - new.keys()
+    )
+    return lines
+
+
+def _replay_journal(data: dict[str, Any], lines: list[bytes]) -> None:
+    """Apply the changes of the journal lines to data."""
+    keyed: dict[str, dict[Any, Any]] = {}
+    for line in lines:
+        try:
+            change = json_util.json_loads_object(line)
+        except ValueError:
+            # The last change may not have been written completely
+            _LOGGER.warning("Ignoring incomplete journal entry %s", line)
+            break
+        key = change["k"]
+        if "id" not in change:
+            keyed.pop(key, None)
+            if change.get("r"):
+                data.pop(key, None)
+            else:
+                data[key] = change["v"]
+            continue
+        if (items := keyed.get(key)) is None:
+            items = keyed[key] = {item["id"]: item for item in data.get(key, ())}
+        if change.get("r"):
+            items.pop(change["id"], None)
+        else:
+            items[change["id"]] = change["v"]
+    for key, items in keyed.items():
+        data[key] = list(items.values())
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -241,8 +375,17 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journaled: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A journaled store appends the changed top level values of its data,
+        or the changed items of lists of dicts with an id, to a journal
+        instead of writing the whole file. The journal is replayed when
+        loading and compacted into the file when it gets larger than it.
+        """
+        if journaled and encoder not in (None, JSONEncoder):
+            raise ValueError("A journaled store can not use a custom encoder")
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +401,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journaled = journaled
+        self._journal: _Journal | None = None
+        self._compact_journal = False
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -387,6 +538,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if self._journaled and JOURNAL_KEY in data:
+            await self.hass.async_add_executor_job(self._load_journal, data)
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -435,6 +589,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         await self._async_handle_write_data()
 
+    @callback
+    def async_compact_journal(self) -> None:
+        """Write the snapshot instead of appending to the journal on the next write."""
+        self._compact_journal = True
+
     @callback
     def async_delay_save(
         self,
@@ -544,6 +703,81 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
+    def _load_journal(self, data: dict) -> None:
+        """Replay the journal of the snapshot onto the data."""
+        try:
+            with open(self.journal_path, "rb") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return
+        # A journal of an older snapshot is left over when writing
+        # the snapshot was interrupted before the journal was replaced
+        if not lines or lines[0] != self._journal_header(data[JOURNAL_KEY]):
+            return
+        _LOGGER.debug("Replaying %s journal entries for %s", len(lines) - 1, self.key)
+        _replay_journal(data["data"], lines[1:])
+
+    @staticmethod
+    def _journal_header(generation: str) -> bytes:
+        """Return the first line of the journal of a snapshot."""
+        return b'{"%b":%b}' % (JOURNAL_KEY.encode(), json_bytes(generation))
+
+    def _write_journaled_data(self, path: str, data: dict) -> None:
+        """Append the changes since the last write to the journal.
+
+        The snapshot is written instead on the first write, when the
+        version changed, when the journal got too large or when
+        compacting the journal was requested.
+        """
+        if not isinstance(stored := data["data"], dict):
+            self._journal = None
+            self._write_snapshot(path, data)
+            return
+
+        journal = self._journal
+        version = (data["version"], data["minor_version"])
+        items = _serialize_journal_items(stored, journal.items if journal else None)
+        if (
+            journal is None
+            or self._compact_journal
+            or journal.version != version
+            or journal.size > journal.snapshot_size
+        ):
+            self._journal = None
+            self._compact_journal = False
+            generation = uuid4().hex
+            self._write_snapshot(path, data | {JOURNAL_KEY: generation})
+            header = self._journal_header(generation) + b"\n"
+            self._write_file(self.journal_path, header)
+            self._journal = _Journal(version, items, os.path.getsize(path), len(header))
+            return
+
+        if not (lines := _journal_changes(journal.items, items)):
+            return
+        _LOGGER.debug("Appending %s changes of %s to journal", len(lines), self.key)
+        changes = b"".join(lines)
+        # The journal is written again with the snapshot if appending fails
+        self._journal = None
+        try:
+            with open(self.journal_path, "ab") as fdesc:
+                fdesc.write(changes)
+                if self._atomic_writes:
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+        except OSError as error:
+            _LOGGER.exception("Appending to journal failed: %s", self.journal_path)
+            raise WriteError(error) from error
+        journal.items = items
+        journal.size += len(changes)
+        self._journal = journal
+
+    def _write_file(self, path: str, data: bytes) -> None:
+        """Write a file with the same guarantees as the data."""
+        if self._atomic_writes:
+            write_utf8_file_atomic(path, data, self._private, mode="wb")
+        else:
+            write_utf8_file(path, data, self._private, mode="wb")
+
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -551,6 +785,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journaled:
+            self._write_journaled_data(path, data)
+        else:
+            self._write_snapshot(path, data)
+
+    def _write_snapshot(self, path: str, data: dict) -> None:
+        """Write all data to the file."""
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -570,5 +811,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
 
+        self._journal = None
+
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journaled:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
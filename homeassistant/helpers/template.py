@@ -11,12 +11,15 @@ from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
-from functools import cache, lru_cache, partial, wraps
+from functools import cache, cached_property, lru_cache, partial, wraps
 import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
+import os
 import pathlib
 import random
 import re
@@ -54,14 +57,18 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -79,6 +86,7 @@ from homeassistant.util import (
     slugify as slugify_util,
 )
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -95,6 +103,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import STORAGE_DIR
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -166,6 +175,9 @@ CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
+# The number of compiled templates kept in memory and on disk
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+COMPILED_TEMPLATE_CACHE_FILE = "core.template_code"
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
@@ -195,6 +207,63 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
     return template_state
 
 
+class _CompiledTemplateCache:
+    """Cache of the marshaled code of compiled templates.
+
+    The code is keyed by a hash of the template source and of the
+    environment it was compiled with, so identical templates are only
+    compiled once for all environments which compile them the same way.
+    The code is kept marshaled so it does not keep the compiled templates
+    alive, and so it can be written to disk and loaded on the next start.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self._codes: LRU[bytes, bytes] = LRU(size)
+        self.changed = False
+
+    def get(self, key: bytes) -> CodeType | None:
+        """Return the cached code of a template."""
+        if (data := self._codes.get(key)) is None:
+            return None
+        try:
+            return cast(CodeType, marshal.loads(data))
+        except (EOFError, TypeError, ValueError):
+            del self._codes[key]
+            return None
+
+    def set(self, key: bytes, code: CodeType) -> None:
+        """Cache the code of a template."""
+        try:
+            self._codes[key] = marshal.dumps(code)
+        except ValueError:
+            return
+        self.changed = True
+
+    def dumps(self) -> bytes:
+        """Return the cache serialized for the running Python version."""
+        self.changed = False
+        return MAGIC_NUMBER + marshal.dumps(dict(self._codes.items()))
+
+    def loads(self, data: bytes) -> None:
+        """Add the codes of a serialized cache which are not cached yet."""
+        if not data.startswith(MAGIC_NUMBER):
+            return
+        try:
+            codes = marshal.loads(data[len(MAGIC_NUMBER) :])
+        except (EOFError, TypeError, ValueError):
+            _LOGGER.debug("Ignoring invalid compiled template cache")
+            return
+        if not isinstance(codes, dict):
+            return
+        for key, code in codes.items():
+            if key not in self._codes:
+                self._codes[key] = code
+
+
+COMPILED_TEMPLATE_CACHE = _CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
+
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
 
@@ -2970,6 +3039,36 @@ async def async_load_custom_templates(hass: HomeAssistant) -> None:
     _get_hass_loader(hass).sources = custom_templates
 
 
+async def async_load_compiled_templates(hass: HomeAssistant) -> None:
+    """Load the compiled template cache and save it once started and at stop."""
+    path = hass.config.path(STORAGE_DIR, COMPILED_TEMPLATE_CACHE_FILE)
+
+    def _load() -> None:
+        try:
+            data = pathlib.Path(path).read_bytes()
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.debug("Could not read compiled template cache: %s", err)
+            return
+        COMPILED_TEMPLATE_CACHE.loads(data)
+
+    def _save(data: bytes) -> None:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_utf8_file(path, data, mode="wb")
+        except (OSError, WriteError) as err:
+            _LOGGER.debug("Could not write compiled template cache: %s", err)
+
+    async def _async_save(_: Event) -> None:
+        if COMPILED_TEMPLATE_CACHE.changed:
+            await hass.async_add_executor_job(_save, COMPILED_TEMPLATE_CACHE.dumps())
+
+    await hass.async_add_executor_job(_load)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save)
+
+
 def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     result = {}
     jinja_path = hass.config.path("custom_templates")
@@ -3437,9 +3536,51 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if not isinstance(source, str):
+            compiled = super().compile(source)
+            self.template_cache[source] = compiled
+            return compiled
+
+        # Filters with constant arguments are folded into the code when
+        # compiling and some of them convert to the configured time zone
+        key = hashlib.sha256(
+            self._compiled_template_fingerprint
+            + str(dt_util.get_default_time_zone()).encode()
+            + source.encode()
+        ).digest()
+        if (compiled := COMPILED_TEMPLATE_CACHE.get(key)) is None:
+            compiled = super().compile(source)
+            COMPILED_TEMPLATE_CACHE.set(key, compiled)
         self.template_cache[source] = compiled
         return compiled
 
+    @cached_property
+    def _compiled_template_fingerprint(self) -> bytes:
+        """Return what the code of templates compiled by this environment depends on.
+
+        Filters and tests are bound when compiling, including whether
+        they are passed the context, so environments which only differ in
+        their globals or their undefined share their compiled templates.
+        The filters and tests may change between Home Assistant versions.
+        """
+        return hashlib.sha256(
+            repr(
+                (
+                    __version__,
+                    jinja2.__version__,
+                    type(self).__qualname__,
+                    sorted(self.extensions),
+                    sorted(
+                        (name, str(getattr(func, "jinja_pass_arg", None)))
+                        for name, func in self.filters.items()
+                    ),
+                    sorted(
+                        (name, str(getattr(func, "jinja_pass_arg", None)))
+                        for name, func in self.tests.items()
+                    ),
+                )
+            ).encode()
+        ).digest()
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
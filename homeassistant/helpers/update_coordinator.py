@@ -173,9 +173,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
     @callback
     def async_update_listeners(self) -> None:
-        """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        """Update all registered listeners.
+
+        The states written by the listeners share their timestamp so they
+        are handled as a single update.
+        """
+        with self.hass.states.async_batch_update():
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 import functools as ft
@@ -16,6 +17,7 @@ import logging
 import os
 import pathlib
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast, final
@@ -29,8 +31,13 @@ from propcache.api import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
-from .core import HomeAssistant, callback
+from .const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+    __version__,
+)
+from .core import Event, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.config_flows import FLOWS
@@ -134,6 +141,15 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[_ManifestCache] = HassKey("manifest_cache")
+MANIFEST_CACHE_KEY = "core.integration_manifests"
+MANIFEST_CACHE_VERSION = 1
+DATA_IMPORT_TIMINGS: HassKey[dict[str, float]] = HassKey("import_timings")
+DATA_IMPORT_SNAPSHOT: HassKey[dict[str, list[str]]] = HassKey("import_snapshot")
+IMPORT_SNAPSHOT_KEY = "core.import_snapshot"
+IMPORT_SNAPSHOT_VERSION = 1
+# The number of threads importing the integrations of the import snapshot
+PRELOAD_IMPORT_WORKERS = 4
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -272,6 +288,204 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = {}
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return how long importing each integration module took."""
+    return hass.data[DATA_IMPORT_TIMINGS]
+
+
+class _ManifestCache:
+    """Cache of the manifests and top level files of integrations.
+
+    The entries are keyed by the path of the integration and are only
+    used while the mtimes of its manifest and of its directory, and the
+    version of Home Assistant, did not change.
+
+    This class is thread-safe as it's used from the executor.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.changed = False
+
+    @staticmethod
+    def _mtimes(file_path: pathlib.Path) -> list[int]:
+        """Return the mtimes of the manifest and the directory of an integration."""
+        return [
+            (file_path / "manifest.json").stat().st_mtime_ns,
+            file_path.stat().st_mtime_ns,
+        ]
+
+    def get(self, file_path: pathlib.Path) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and top level files of an integration."""
+        if (entry := self._entries.get(str(file_path))) is None:
+            return None
+        try:
+            if entry["mtimes"] != self._mtimes(file_path):
+                return None
+        except OSError:
+            return None
+        files = entry["files"]
+        return cast(Manifest, dict(entry["manifest"])), (
+            None if files is None else set(files)
+        )
+
+    def set(
+        self,
+        file_path: pathlib.Path,
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Cache the manifest and top level files of an integration."""
+        try:
+            mtimes = self._mtimes(file_path)
+        except OSError:
+            return
+        with self._lock:
+            self._entries[str(file_path)] = {
+                "mtimes": mtimes,
+                "manifest": dict(manifest),
+                "files": None if top_level_files is None else sorted(top_level_files),
+            }
+            self.changed = True
+
+    def load(self, data: dict[str, Any] | None) -> None:
+        """Load the cache saved by the same version of Home Assistant."""
+        if (
+            data is not None
+            and data.get("version") == __version__
+            and isinstance(entries := data.get("integrations"), dict)
+        ):
+            self._entries = entries
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache to be saved."""
+        with self._lock:
+            self.changed = False
+            return {"version": __version__, "integrations": self._entries.copy()}
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the manifest cache and save it once started and at stop."""
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store = Store[dict[str, Any]](hass, MANIFEST_CACHE_VERSION, MANIFEST_CACHE_KEY)
+    cache = _ManifestCache()
+    cache.load(await store.async_load())
+    hass.data[DATA_MANIFEST_CACHE] = cache
+
+    @callback
+    def _async_save(_: Event) -> None:
+        if cache.changed:
+            store.async_delay_save(cache.as_dict)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save)
+
+
+async def async_load_import_snapshot(hass: HomeAssistant) -> None:
+    """Load the modules imported by the last start and record them once started."""
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store = Store[dict[str, Any]](hass, IMPORT_SNAPSHOT_VERSION, IMPORT_SNAPSHOT_KEY)
+    data = await store.async_load()
+    # The modules imported by another version may no longer be the same
+    if data is not None and data.get("version") == __version__:
+        hass.data[DATA_IMPORT_SNAPSHOT] = data["integrations"]
+
+    @callback
+    def _async_save(_: Event) -> None:
+        imported: dict[str, list[str]] = {}
+        for name in hass.data[DATA_COMPONENTS]:
+            domain, _, platform_name = name.partition(".")
+            platforms = imported.setdefault(domain, [])
+            if platform_name:
+                platforms.append(platform_name)
+        store.async_delay_save(
+            lambda: {
+                "version": __version__,
+                "integrations": {
+                    domain: sorted(platforms)
+                    for domain, platforms in sorted(imported.items())
+                },
+            }
+        )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+
+
+@callback
+def async_has_import_snapshot(hass: HomeAssistant) -> bool:
+    """Return if there are modules imported by the last start to preload."""
+    return bool(hass.data.get(DATA_IMPORT_SNAPSHOT))
+
+
+async def async_preload_import_snapshot(
+    hass: HomeAssistant, integrations: dict[str, Integration]
+) -> None:
+    """Import the modules imported by the last start in parallel.
+
+    The integrations are imported by dependency level so the modules
+    of dependencies are imported before the integrations using them.
+    Import errors are ignored as they are raised again when setting up.
+    """
+    if not (snapshot := hass.data.pop(DATA_IMPORT_SNAPSHOT, None)):
+        return
+    to_import = {
+        domain: integration
+        for domain in snapshot
+        if (integration := integrations.get(domain)) is not None
+        and integration.import_executor
+    }
+    levels: dict[str, int] = {}
+
+    def _level(integration: Integration) -> int:
+        if (level := levels.get(integration.domain)) is None:
+            dependencies = (
+                integration.all_dependencies.intersection(to_import)
+                if integration.all_dependencies_resolved
+                else ()
+            )
+            level = levels[integration.domain] = max(
+                (_level(to_import[dep]) + 1 for dep in dependencies), default=0
+            )
+        return level
+
+    by_level: dict[int, list[Integration]] = {}
+    for integration in to_import.values():
+        by_level.setdefault(_level(integration), []).append(integration)
+
+    start = time.perf_counter()
+    # The import executor has a single thread which is used by the
+    # integrations being set up so the snapshot is imported by its own pool
+    executor = ThreadPoolExecutor(
+        max_workers=PRELOAD_IMPORT_WORKERS, thread_name_prefix="ImportPreload"
+    )
+    try:
+        for level in sorted(by_level):
+            await asyncio.gather(
+                *(
+                    hass.loop.run_in_executor(
+                        executor, integration.preload, snapshot[integration.domain]
+                    )
+                    for integration in by_level[level]
+                )
+            )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    _LOGGER.debug(
+        "Preloaded %s integrations in %s levels in %.2fs",
+        len(to_import),
+        len(by_level),
+        time.perf_counter() - start,
+    )
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -655,30 +869,39 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            file_path = pathlib.Path(base) / domain
 
-            if not manifest_path.is_file():
-                continue
+            if manifest_cache is not None and (cached := manifest_cache.get(file_path)):
+                manifest, top_level_files = cached
+            else:
+                manifest_path = file_path / "manifest.json"
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                if not manifest_path.is_file():
+                    continue
+
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_cache is not None:
+                    manifest_cache.set(file_path, manifest, top_level_files)
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -770,6 +993,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_timings = hass.data[DATA_IMPORT_TIMINGS]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -1049,9 +1273,7 @@ class Integration:
         cache = self._cache
         domain = self.domain
         try:
-            cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
-            )
+            cache[domain] = cast(ComponentProtocol, self._import(self.pkg_path))
         except ImportError:
             raise
         except RuntimeError as err:
@@ -1279,7 +1501,31 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._import(f"{self.pkg_path}.{platform_name}")
+
+    def _import(self, name: str) -> ModuleType:
+        """Import a module and record how long importing it took.
+
+        This method must be thread-safe as it's called from the executor
+        and the event loop.
+        """
+        if name in sys.modules:
+            return importlib.import_module(name)
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self._import_timings[name] = time.perf_counter() - start
+        return module
+
+    def preload(self, platform_names: Iterable[str]) -> None:
+        """Import the component and platforms of the integration.
+
+        This method must be thread-safe as it's called from the executor.
+        """
+        with suppress(ImportError):
+            self.get_component()
+            for platform_name in self.platforms_exists(platform_names):
+                with suppress(ImportError):
+                    self.get_platform(platform_name)
 
     def __repr__(self) -> str:
         """Text representation of class."""
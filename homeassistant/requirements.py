@@ -72,6 +72,12 @@ async def async_load_installed_versions(
     await _async_get_manager(hass).async_load_installed_versions(requirements)
 
 
+@callback
+def async_requirements_installed(hass: HomeAssistant, requirements: list[str]) -> bool:
+    """Return if the requirements are known to be installed."""
+    return not _async_get_manager(hass).find_missing_requirements(requirements)
+
+
 @callback
 @singleton.singleton(DATA_REQUIREMENTS_MANAGER)
 def _async_get_manager(hass: HomeAssistant) -> RequirementsManager:
@@ -259,16 +265,16 @@ class RequirementsManager:
 
             requirements = [r for r in requirements if r not in skipped_requirements]
 
-        if not (missing := self._find_missing_requirements(requirements)):
+        if not (missing := self.find_missing_requirements(requirements)):
             return
         self._raise_for_failed_requirements(name, missing)
 
         async with self.pip_lock:
             # Recalculate missing again now that we have the lock
-            if missing := self._find_missing_requirements(requirements):
+            if missing := self.find_missing_requirements(requirements):
                 await self._async_process_requirements(name, missing)
 
-    def _find_missing_requirements(self, requirements: list[str]) -> list[str]:
+    def find_missing_requirements(self, requirements: list[str]) -> list[str]:
         """Find requirements that are missing in the cache."""
         return [req for req in requirements if req not in self.is_installed_cache]
 
@@ -72,6 +72,10 @@ _DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# _DATA_SETUP_TRACE holds the spans of the setup of the integrations
+# during startup in the Chrome trace event format.
+_DATA_SETUP_TRACE: HassKey[_SetupTrace] = HassKey("setup_trace")
+
 _DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 _DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -341,14 +345,16 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with async_trace_setup(hass, domain, "import"):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
 
-    integration_config_info = await conf_util.async_process_component_config(
-        hass, config, integration, component
-    )
+    with async_trace_setup(hass, domain, "config_validation"):
+        integration_config_info = await conf_util.async_process_component_config(
+            hass, config, integration, component
+        )
     conf_util.async_handle_component_errors(hass, integration_config_info, integration)
     processed_config = conf_util.async_drop_config_annotations(
         integration_config_info, integration
@@ -578,13 +584,16 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    with async_trace_setup(hass, integration.domain, "wait_dependencies", wait=True):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with async_trace_setup(hass, integration.domain, "requirements"):
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -697,6 +706,113 @@ def _setup_started(
     return {}
 
 
+class _SetupTrace:
+    """Spans of the setup of the integrations in the Chrome trace event format.
+
+    Each integration is a process and each of its groups, which are set
+    up in parallel, a thread of that process.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the setup trace."""
+        self.started = time.monotonic()
+        self.events: list[dict[str, Any]] = []
+        self._ids: dict[tuple[str, str | None], tuple[int, int]] = {}
+        self._pids: dict[str, int] = {}
+
+    def _async_get_ids(self, integration: str, group: str | None) -> tuple[int, int]:
+        """Return the process and thread id of a group of an integration."""
+        if (ids := self._ids.get((integration, group))) is not None:
+            return ids
+        if (pid := self._pids.get(integration)) is None:
+            pid = self._pids[integration] = len(self._pids) + 1
+            self.events.append(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "args": {"name": integration},
+                }
+            )
+        tid = sum(1 for pid_, _ in self._ids.values() if pid_ == pid) + 1
+        ids = self._ids[integration, group] = (pid, tid)
+        self.events.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": group or integration},
+            }
+        )
+        return ids
+
+    def async_add_span(
+        self,
+        integration: str,
+        group: str | None,
+        name: str,
+        started: float,
+        time_taken: float,
+        wait: bool = False,
+    ) -> None:
+        """Add a span of the setup of an integration."""
+        pid, tid = self._async_get_ids(integration, group)
+        self.events.append(
+            {
+                "name": name,
+                "cat": "wait" if wait else "setup",
+                "ph": "X",
+                "pid": pid,
+                "tid": tid,
+                "ts": round((started - self.started) * 1_000_000),
+                "dur": round(time_taken * 1_000_000),
+            }
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace as a Chrome trace JSON object."""
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+
+@singleton.singleton(_DATA_SETUP_TRACE)
+def _setup_trace(hass: core.HomeAssistant) -> _SetupTrace:
+    """Return the setup trace."""
+    return _SetupTrace()
+
+
+@callback
+def async_get_setup_trace(hass: core.HomeAssistant) -> dict[str, Any]:
+    """Return the spans of the setup of the integrations during startup.
+
+    The trace is in the Chrome trace event format which can be
+    opened in Perfetto or chrome://tracing.
+    """
+    return _setup_trace(hass).as_dict()
+
+
+@contextlib.contextmanager
+def async_trace_setup(
+    hass: core.HomeAssistant,
+    integration: str,
+    name: str,
+    group: str | None = None,
+    wait: bool = False,
+) -> Generator[None]:
+    """Record a span of the setup of an integration during startup."""
+    if hass.is_stopping or hass.state is core.CoreState.running:
+        yield
+        return
+
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        _setup_trace(hass).async_add_span(
+            integration, group, name, started, time.monotonic() - started, wait
+        )
+
+
 @contextlib.contextmanager
 def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator[None]:
     """Keep track of time we are blocked waiting for other operations.
@@ -723,6 +839,9 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
         integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
+        _setup_trace(hass).async_add_span(
+            integration, group, phase, started, time_taken, wait=True
+        )
         _LOGGER.debug(
             "Adding wait for %s for %s (%s) of %.2f",
             phase,
@@ -782,6 +901,9 @@ def async_start_setup(
     finally:
         time_taken = time.monotonic() - started
         del setup_started[current]
+        _setup_trace(hass).async_add_span(
+            integration, group, phase, started, time_taken
+        )
         group_setup_times = _setup_times(hass)[integration][group]
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from array import array
 import bisect
 from contextlib import suppress
 import datetime as dt
@@ -549,6 +550,65 @@ def find_next_time_expression_time(
         return result
 
 
+class TimeExpression:
+    """A time expression compiled into a table of the matching seconds of the day.
+
+    Finding the next match is a single bisect into the table instead of
+    matching each time unit separately, which matters for expressions that
+    are evaluated every time they fire.
+    """
+
+    __slots__ = ("_seconds_of_day", "hours", "minutes", "seconds")
+
+    def __init__(
+        self, seconds: list[int], minutes: list[int], hours: list[int]
+    ) -> None:
+        """Compile the time expression."""
+        if not seconds or not minutes or not hours:
+            raise ValueError("Cannot find a next time: Time expression never matches!")
+        self.seconds = seconds
+        self.minutes = minutes
+        self.hours = hours
+        self._seconds_of_day = array(
+            "I",
+            sorted(
+                {
+                    hour * 3600 + minute * 60 + second
+                    for hour in hours
+                    for minute in minutes
+                    for second in seconds
+                }
+            ),
+        )
+
+    def find_next(self, now: dt.datetime) -> dt.datetime:  # pylint: disable=redefined-outer-name
+        """Find the next datetime from now for which the time expression matches.
+
+        Returns the same result as find_next_time_expression_time.
+        """
+        result = now.replace(microsecond=0, fold=0)
+        second_of_day = result.hour * 3600 + result.minute * 60 + result.second
+        seconds_of_day = self._seconds_of_day
+        if (index := bisect.bisect_left(seconds_of_day, second_of_day)) == len(
+            seconds_of_day
+        ):
+            # No time to match in this day. Roll-over to next day.
+            index = 0
+            result += dt.timedelta(days=1)
+        result += dt.timedelta(seconds=seconds_of_day[index] - second_of_day)
+
+        if result.tzinfo in (None, UTC) or (
+            _datetime_exists(result) and not _datetime_ambiguous(now)
+        ):
+            return result
+
+        # Times which don't exist or are ambiguous because of daylight saving
+        # time are left to the full algorithm.
+        return find_next_time_expression_time(
+            now, self.seconds, self.minutes, self.hours
+        )
+
+
 def _datetime_exists(dattim: dt.datetime) -> bool:
     """Check if a datetime exists."""
     assert dattim.tzinfo is not None
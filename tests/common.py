@@ -538,7 +538,15 @@ def _async_fire_time_changed(
                     return_value=timestamp,
                 ),
             ):
-                task._run()
+                if fire_all and isinstance(
+                    bucket := getattr(task._callback, "__self__", None),
+                    event._TimerBucket,
+                ):
+                    # Run all the timers of the timer wheel bucket, not only
+                    # the ones which are due
+                    bucket._async_run(*task._args, fire_all=True)
+                else:
+                    task._run()
                 task.cancel()
 
 
@@ -1,6 +1,8 @@
 """The tests the History component websocket_api."""
 
+from array import array
 import asyncio
+from base64 import b64decode
 from datetime import timedelta
 from unittest.mock import ANY, patch
 
@@ -173,6 +175,135 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_columnar(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period with the columnar format."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "again"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": False,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    sensor_test_history = response["result"]["sensor.test"]
+
+    assert sensor_test_history["s"] == ["on", "off"]
+    assert array("I", b64decode(sensor_test_history["si"])).tolist() == [
+        0,
+        1,
+        1,
+        1,
+        0,
+    ]
+    last_updated = array("d", b64decode(sensor_test_history["lu"]))
+    assert len(last_updated) == 5
+    assert last_updated.tolist() == sorted(last_updated)
+    assert len(array("d", b64decode(sensor_test_history["lc"]))) == 5
+    assert sensor_test_history["a"] == [
+        [0, {"any": "attr"}],
+        [2, {"any": "changed"}],
+        [3, {"any": "again"}],
+        [4, {"any": "attr"}],
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "include_start_time_state": True,
+            "significant_changes_only": True,
+            "minimal_response": True,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 2
+    sensor_test_history = response["result"]["sensor.test"]
+
+    assert sensor_test_history["s"] == ["on", "off"]
+    assert array("I", b64decode(sensor_test_history["si"])).tolist() == [0, 1, 0]
+    assert "lc" not in sensor_test_history
+    assert sensor_test_history["a"] == [[0, {"any": "attr"}]]
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples with max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now) as freezer:
+        for value in range(50):
+            freezer.move_to(now + timedelta(seconds=value + 1))
+            hass.states.async_set("sensor.power", str(value))
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "end_time": (now + timedelta(seconds=51)).isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 8,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    sensor_power_history = response["result"]["sensor.power"]
+    assert len(sensor_power_history) <= 8
+    assert sensor_power_history[0]["s"] == "0"
+    assert sensor_power_history[-1]["s"] == "49"
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
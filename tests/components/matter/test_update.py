@@ -343,10 +343,10 @@ async def test_update_state_save_and_restore(
     await hass.async_block_till_done()
     await async_mock_restore_state_shutdown_restart(hass)
 
-    assert len(hass_storage[RESTORE_STATE_KEY]["data"]) == 1
-    state = hass_storage[RESTORE_STATE_KEY]["data"][0]["state"]
+    assert len(hass_storage[RESTORE_STATE_KEY]["data"]["states"]) == 1
+    state = hass_storage[RESTORE_STATE_KEY]["data"]["states"][0]["state"]
     assert state["entity_id"] == "update.mock_dimmable_light"
-    extra_data = hass_storage[RESTORE_STATE_KEY]["data"][0]["extra_data"]
+    extra_data = hass_storage[RESTORE_STATE_KEY]["data"]["states"][0]["extra_data"]
 
     # Check that the extra data has the format we expect.
     assert extra_data == {
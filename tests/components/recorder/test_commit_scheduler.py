@@ -0,0 +1,55 @@
+"""Test the recorder commit scheduler."""
+
+from unittest.mock import patch
+
+from homeassistant.components.recorder.commit_scheduler import (
+    BURST_BACKLOG,
+    IDLE_COMMIT_INTERVAL,
+    MAX_COMMIT_BATCH_SIZE,
+    CommitScheduler,
+)
+
+
+def test_commit_when_drained() -> None:
+    """Test adaptive commits happen when the queue drains."""
+    with patch("time.monotonic", return_value=100.0):
+        scheduler = CommitScheduler(5, True)
+    assert not scheduler.should_commit_when_drained()
+
+    scheduler.event_processed()
+    with patch("time.monotonic", return_value=100.0 + IDLE_COMMIT_INTERVAL / 2):
+        assert not scheduler.should_commit_when_drained()
+    with patch("time.monotonic", return_value=100.0 + IDLE_COMMIT_INTERVAL):
+        assert scheduler.should_commit_when_drained()
+
+    with patch("time.monotonic", return_value=102.0):
+        scheduler.committed(101.5)
+    assert scheduler.pending_events == 0
+    assert scheduler.last_commit_batch_size == 1
+    assert scheduler.last_commit_latency == 0.5
+    assert not scheduler.should_commit_when_drained()
+
+
+def test_defer_commit_during_burst() -> None:
+    """Test periodic commits are deferred while there is a burst."""
+    with patch("time.monotonic", return_value=100.0):
+        scheduler = CommitScheduler(5, True)
+        assert not scheduler.should_defer_commit(BURST_BACKLOG - 1)
+        assert scheduler.should_defer_commit(BURST_BACKLOG)
+
+    with patch("time.monotonic", return_value=130.0):
+        assert not scheduler.should_defer_commit(BURST_BACKLOG)
+
+    scheduler.pending_events = MAX_COMMIT_BATCH_SIZE
+    with patch("time.monotonic", return_value=100.0):
+        assert not scheduler.should_defer_commit(BURST_BACKLOG)
+
+
+def test_not_adaptive() -> None:
+    """Test nothing changes when adaptive commits are disabled."""
+    with patch("time.monotonic", return_value=100.0):
+        scheduler = CommitScheduler(5, False)
+    scheduler.event_processed()
+    with patch("time.monotonic", return_value=110.0):
+        assert not scheduler.should_commit_when_drained()
+        assert not scheduler.should_defer_commit(BURST_BACKLOG)
@@ -0,0 +1,67 @@
+"""Test the recorder encoder."""
+
+from unittest.mock import MagicMock
+
+from homeassistant.components.recorder.db_schema import EventData, StateAttributes
+from homeassistant.components.recorder.encoder import RecorderEncoder
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event
+
+
+def _mock_recorder() -> MagicMock:
+    """Return a mock recorder with serializing table managers."""
+    recorder = MagicMock()
+    recorder.state_attributes_manager.serialize_from_event.return_value = b'{"a":1}'
+    recorder.event_data_manager.serialize_from_event.return_value = b'{"b":2}'
+    return recorder
+
+
+def test_encoder_claimed_after_encoding() -> None:
+    """Test the recorder picks up events the encoder got to first."""
+    encoder = RecorderEncoder(_mock_recorder())
+    state_event = Event(EVENT_STATE_CHANGED, {"entity_id": "test.one"})
+    other_event = Event("test_event", {"b": 2})
+    empty_event = Event("test_event")
+    for event in (state_event, other_event, empty_event):
+        encoder.queue_event(event)
+    encoder.stop()
+    encoder.run()
+
+    assert encoder.claim(state_event) == (
+        b'{"a":1}',
+        StateAttributes.hash_shared_attrs_bytes(b'{"a":1}'),
+    )
+    assert encoder.claim(other_event) == (
+        b'{"b":2}',
+        EventData.hash_shared_data_bytes(b'{"b":2}'),
+    )
+    assert encoder.claim(empty_event) == (None, None)
+    assert not encoder._encoded
+
+
+def test_encoder_skips_claimed_events() -> None:
+    """Test the encoder skips events the recorder already claimed."""
+    recorder = _mock_recorder()
+    encoder = RecorderEncoder(recorder)
+    event = Event(EVENT_STATE_CHANGED, {"entity_id": "test.one"})
+    encoder.queue_event(event)
+    assert encoder.claim(event) is None
+    encoder.stop()
+    encoder.run()
+
+    recorder.state_attributes_manager.serialize_from_event.assert_not_called()
+    assert not encoder._encoded
+
+
+def test_encoder_failure() -> None:
+    """Test the recorder encodes events itself when the encoder fails."""
+    recorder = _mock_recorder()
+    recorder.state_attributes_manager.serialize_from_event.side_effect = ValueError
+    encoder = RecorderEncoder(recorder)
+    event = Event(EVENT_STATE_CHANGED, {"entity_id": "test.one"})
+    encoder.queue_event(event)
+    encoder.stop()
+    encoder.run()
+
+    assert encoder.claim(event) is None
+    assert not encoder._encoded
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from array import array
+from base64 import b64decode
 from collections.abc import Generator
 from copy import copy
 from datetime import datetime, timedelta
@@ -13,12 +15,15 @@ import pytest
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.checkpoints import write_state_checkpoint
 from homeassistant.components.recorder.db_schema import (
     StateAttributes,
+    StateCheckpoints,
     States,
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.history.downsample import downsample_rows
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
@@ -533,6 +538,126 @@ async def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.usefixtures("multiple_start_time_chunk_sizes")
+@pytest.mark.parametrize("minimal_response", [False, True])
+@pytest.mark.parametrize("no_attributes", [False, True])
+@pytest.mark.parametrize("significant_changes_only", [False, True])
+async def test_get_significant_states_columnar(
+    hass: HomeAssistant,
+    minimal_response: bool,
+    no_attributes: bool,
+    significant_changes_only: bool,
+) -> None:
+    """Test the columnar history matches the compressed state format."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    kwargs = {
+        "significant_changes_only": significant_changes_only,
+        "minimal_response": minimal_response,
+        "no_attributes": no_attributes,
+    }
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids=list(states),
+        compressed_state_format=True,
+        **kwargs,
+    )
+    columnar = history.get_significant_states_columnar(
+        hass, zero, four, entity_ids=list(states), **kwargs
+    )
+    assert list(columnar) == list(hist)
+
+    for entity_id, comp_states in hist.items():
+        columns = columnar[entity_id].as_dict()
+        last_updated = array("d", b64decode(columns["lu"]))
+        state_indexes = array("I", b64decode(columns["si"]))
+        assert ("lc" in columns) is not significant_changes_only
+        last_changed = array("d", b64decode(columns.get("lc", "")))
+        attributes = dict(columns.get("a", []))
+        assert len(last_updated) == len(state_indexes) == len(comp_states)
+        current_attributes = None
+        for idx, comp_state in enumerate(comp_states):
+            current_attributes = attributes.get(idx, current_attributes)
+            assert columns["s"][state_indexes[idx]] == comp_state["s"]
+            assert last_updated[idx] == comp_state["lu"]
+            if last_changed:
+                assert last_changed[idx] == comp_state.get("lc", comp_state["lu"])
+            if "a" in comp_state:
+                assert current_attributes == comp_state["a"]
+        if no_attributes:
+            assert not attributes
+
+
+def test_downsample_rows() -> None:
+    """Test downsampling keeps the first, last, min and max of each bucket."""
+    rows = [(1, str(value), float(ts)) for ts, value in enumerate(range(100))]
+    rows[42] = (1, "500", 42.0)
+    rows[43] = (1, "-500", 43.0)
+    rows.insert(60, (1, "unavailable", 59.5))
+    rows.insert(0, (1, "7", None))
+
+    downsampled = list(downsample_rows(rows, 1, 2, 0.0, 100.0, 16))
+    assert [row[1] for row in downsampled] == [
+        "7",
+        "0",
+        "24",
+        "25",
+        "500",
+        "-500",
+        "49",
+        "50",
+        "59",
+        "unavailable",
+        "60",
+        "74",
+        "75",
+        "99",
+    ]
+    # Empty or reversed time ranges are not downsampled
+    assert list(downsample_rows(rows, 1, 2, 100.0, 100.0, 16)) == rows
+
+
+async def test_get_significant_states_max_points(hass: HomeAssistant) -> None:
+    """Test the number of states is limited with max_points."""
+    entity_id = "sensor.power"
+    zero = dt_util.utcnow()
+    with freeze_time(zero) as freezer:
+        for value in range(200):
+            freezer.move_to(zero + timedelta(seconds=value + 1))
+            hass.states.async_set(entity_id, str(value))
+    await async_wait_recording_done(hass)
+    end = zero + timedelta(seconds=201)
+
+    hist = history.get_significant_states(
+        hass, zero, end, entity_ids=[entity_id], compressed_state_format=True
+    )
+    assert len(hist[entity_id]) == 200
+
+    for max_points in (4, 20, 100):
+        hist = history.get_significant_states(
+            hass,
+            zero,
+            end,
+            entity_ids=[entity_id],
+            compressed_state_format=True,
+            max_points=max_points,
+        )
+        states = hist[entity_id]
+        assert len(states) <= max_points
+        assert states[0]["s"] == "0"
+        assert states[-1]["s"] == "199"
+        timestamps = [state["lu"] for state in states]
+        assert timestamps == sorted(timestamps)
+
+        columnar = history.get_significant_states_columnar(
+            hass, zero, end, entity_ids=[entity_id], max_points=max_points
+        )
+        assert len(columnar[entity_id]) == len(states)
+
+
 @pytest.mark.usefixtures("multiple_start_time_chunk_sizes")
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 async def test_get_significant_states_with_initial(
@@ -953,6 +1078,68 @@ async def test_state_changes_during_period_multiple_entities_single_test(
         assert hist[entity_id][0].state == value
 
 
+async def test_get_significant_states_start_state_from_checkpoint(
+    hass: HomeAssistant,
+) -> None:
+    """Test the start states are found from the state checkpoint of the hour."""
+    hour = dt_util.parse_datetime("2026-10-18 11:00:00+00:00")
+    instance = recorder.get_instance(hass)
+    with freeze_time(hour - timedelta(minutes=70)) as freezer:
+        hass.states.async_set("sensor.one", "a")
+        hass.states.async_set("sensor.two", "b")
+        await async_wait_recording_done(hass)
+        # The first checkpoint looks up the latest states in chunks of entities
+        with patch(
+            "homeassistant.components.recorder.checkpoints.MAX_IDS_FOR_INDEXED_GROUP_BY",
+            1,
+        ):
+            assert await instance.async_add_executor_job(
+                write_state_checkpoint, instance, hour - timedelta(hours=1)
+            )
+        freezer.move_to(hour - timedelta(minutes=20))
+        hass.states.async_set("sensor.one", "c")
+        await async_wait_recording_done(hass)
+        # The checkpoint is built from the previous checkpoint
+        assert await instance.async_add_executor_job(
+            write_state_checkpoint, instance, hour
+        )
+        freezer.move_to(hour + timedelta(minutes=10))
+        hass.states.async_set("sensor.two", "d")
+        await async_wait_recording_done(hass)
+        freezer.move_to(hour + timedelta(minutes=30))
+        hass.states.async_set("sensor.three", "e")
+        await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.history.modern._get_start_time_state_for_entities_stmt_checkpoint",
+        wraps=history.modern._get_start_time_state_for_entities_stmt_checkpoint,
+    ) as checkpoint_stmt:
+        hist = history.get_significant_states(
+            hass,
+            hour + timedelta(minutes=20),
+            hour + timedelta(minutes=50),
+            entity_ids=["sensor.one", "sensor.two", "sensor.three"],
+        )
+    assert checkpoint_stmt.called
+    assert {
+        entity_id: [state.state for state in states]
+        for entity_id, states in hist.items()
+    } == {"sensor.one": ["c"], "sensor.two": ["d"], "sensor.three": ["e"]}
+
+    with session_scope(hass=hass, read_only=True) as session:
+        checkpoints = session.query(StateCheckpoints).all()
+        assert sorted(
+            (row.hour_ts, row.last_updated_ts) for row in checkpoints
+        ) == sorted(
+            [
+                (hour.timestamp() - 3600, hour.timestamp() - 4200),
+                (hour.timestamp() - 3600, hour.timestamp() - 4200),
+                (hour.timestamp(), hour.timestamp() - 4200),
+                (hour.timestamp(), hour.timestamp() - 1200),
+            ]
+        )
+
+
 @pytest.mark.freeze_time("2039-01-19 03:14:07.555555-00:00")
 async def test_get_full_significant_states_past_year_2038(
     hass: HomeAssistant,
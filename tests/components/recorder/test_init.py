@@ -21,10 +21,12 @@ from homeassistant.components.lock import LockState
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_INSERT,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
+    CONF_PRE_ENCODE,
     CONFIG_SCHEMA,
     DOMAIN,
     Recorder,
@@ -37,6 +39,7 @@ from homeassistant.components.recorder.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
+    PENDING_PURGE_STORAGE_KEY,
     SupportedDialect,
 )
 from homeassistant.components.recorder.db_schema import (
@@ -132,6 +135,11 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         auto_repack=True,
         keep_days=7,
         commit_interval=1,
+        adaptive_commit=False,
+        bulk_insert=False,
+        pre_encode=False,
+        ref_counting=False,
+        partition_tables=False,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
@@ -259,6 +267,10 @@ async def test_state_gets_saved_when_set_before_start_event(
         assert db_states[0].event_id is None
 
 
+@pytest.mark.parametrize(
+    "recorder_config",
+    [None, {CONF_BULK_INSERT: True}, {CONF_PRE_ENCODE: True}],
+)
 async def test_saving_state(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving and restoring a state."""
     entity_id = "test.recorder"
@@ -506,6 +518,10 @@ async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
     assert "Error saving events" not in caplog.text
 
 
+@pytest.mark.parametrize(
+    "recorder_config",
+    [None, {CONF_BULK_INSERT: True}, {CONF_PRE_ENCODE: True}],
+)
 async def test_saving_event(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving and restoring an event."""
     event_type = "EVENT_TEST"
@@ -1263,6 +1279,44 @@ async def test_auto_purge_disabled(
         periodic_db_cleanups.reset_mock()
 
 
+@pytest.mark.parametrize("enable_nightly_purge", [True])
+async def test_auto_purge_resumed_after_restart(
+    hass: HomeAssistant, setup_recorder: None, hass_storage: dict[str, Any]
+) -> None:
+    """Test an unfinished automatic purge is persisted and resumed."""
+    instance = recorder.get_instance(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=10)
+
+    instance._async_save_pending_purge(purge_before, True)
+    await hass.async_block_till_done()
+    assert hass_storage[PENDING_PURGE_STORAGE_KEY]["data"] == {
+        "purge_before": purge_before.isoformat(),
+        "repack": True,
+    }
+
+    with (
+        patch(
+            "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+        ) as purge_old_data,
+        patch("homeassistant.components.recorder.tasks.periodic_db_cleanups"),
+    ):
+        await instance._async_resume_pending_purge()
+        await async_recorder_block_till_done(hass)
+        await hass.async_block_till_done()
+
+    purge_old_data.assert_called_once_with(instance, purge_before, True, False)
+    assert hass_storage[PENDING_PURGE_STORAGE_KEY]["data"] == {}
+
+    # A purge of older data does not finish the pending purge
+    instance._async_save_pending_purge(purge_before, False)
+    instance.async_purge_finished(purge_before - timedelta(days=1))
+    await hass.async_block_till_done()
+    assert hass_storage[PENDING_PURGE_STORAGE_KEY]["data"] == {
+        "purge_before": purge_before.isoformat(),
+        "repack": False,
+    }
+
+
 @pytest.mark.parametrize("enable_statistics", [True])
 async def test_auto_statistics(
     hass: HomeAssistant,
@@ -1446,6 +1500,7 @@ async def test_compile_missing_statistics(
         await hass.async_stop()
 
 
+@pytest.mark.parametrize("recorder_config", [None, {CONF_BULK_INSERT: True}])
 async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving sets old state."""
     hass.states.async_set("test.one", "s1", {})
@@ -1474,6 +1529,37 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_INSERT: True}])
+async def test_bulk_insert_links_old_state_across_commits(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test the bulk insert buffer links old states in and across commits."""
+    instance = recorder.get_instance(hass)
+    assert instance._bulk_insert_buffer is not None
+
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.one", "s2", {"attr": 1})
+    hass.states.async_set("test.one", "s3", {"attr": 2})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s4", {"attr": 2})
+    hass.states.async_remove("test.one")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                States.state_id, States.old_state_id, States.state, States.attributes_id
+            ).order_by(States.state_id)
+        )
+        assert [state.state for state in states] == ["s1", "s2", "s3", "s4", None]
+        assert states[0].old_state_id is None
+        for state, old_state in zip(states[1:], states, strict=False):
+            assert state.old_state_id == old_state.state_id
+        assert states[0].attributes_id == states[1].attributes_id
+        assert states[2].attributes_id == states[3].attributes_id
+        assert states[1].attributes_id != states[2].attributes_id
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -0,0 +1,205 @@
+"""Test the recorder partitioned tables."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from sqlalchemy import func, inspect, select
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import Events, StateAttributes, States
+from homeassistant.components.recorder.migration import PartitionTablesMigration
+from homeassistant.components.recorder.partitions import (
+    PARTITION_INTERVAL,
+    PARTITIONED_TABLES,
+    get_partitioned_tables,
+    get_partitions,
+    partition_name,
+    partition_start,
+    partition_table,
+    start_of_utc_day,
+)
+from homeassistant.components.recorder.purge import PurgeBatchSizer, purge_old_data
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+
+def test_partition_names() -> None:
+    """Test partition names are mapped to the start of their day."""
+    start = start_of_utc_day(datetime(2026, 10, 18, 13, 45, tzinfo=UTC))
+    assert start == datetime(2026, 10, 18, tzinfo=UTC)
+    assert partition_name("states", start) == "states_p20261018"
+    assert partition_start("states", "states_p20261018") == start
+    assert partition_start("states", "states_default") is None
+    assert partition_start("states", "states_pnotadate") is None
+    assert partition_start("states", "events_p20261018") is None
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_partition_tables(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test converting the states and events tables to partitioned tables."""
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.test", state, {"unit": "W"})
+    hass.bus.async_fire("test_event", {"data": 1})
+    await async_wait_recording_done(hass)
+
+    def _count_rows() -> dict[str, list[int]]:
+        with session_scope(session=recorder_mock.get_session()) as session:
+            return {
+                "states": [row[0] for row in session.execute(select(States.state_id))],
+                "events": [row[0] for row in session.execute(select(Events.event_id))],
+            }
+
+    rows_before = await recorder_mock.async_add_executor_job(_count_rows)
+    migrator = PartitionTablesMigration(
+        initial_schema_version=0, start_schema_version=0, migration_changes={}
+    )
+
+    def _partition_states() -> int:
+        today = start_of_utc_day(dt_util.utcnow())
+        steps = 0
+        done = False
+        while not done:
+            with session_scope(session=recorder_mock.get_session()) as session:
+                done = partition_table(
+                    session,
+                    "states",
+                    today - PARTITION_INTERVAL,
+                    today + 2 * PARTITION_INTERVAL,
+                    batch_size=1,
+                )
+            steps += 1
+        return steps
+
+    def _needs_migrate() -> bool:
+        with session_scope(session=recorder_mock.get_session()) as session:
+            return migrator.needs_migrate(recorder_mock, session)
+
+    def _migrate() -> None:
+        while migrator.migrate_data_impl(recorder_mock).needs_migrate:
+            pass
+
+    with patch.object(recorder_mock, "partition_tables", True):
+        assert await recorder_mock.async_add_executor_job(_needs_migrate)
+        # Create the table, copy one row at a time and the final empty
+        # batch, then replace the table
+        assert await recorder_mock.async_add_executor_job(_partition_states) == (
+            len(rows_before["states"]) + 2
+        )
+        assert await recorder_mock.async_add_executor_job(_needs_migrate)
+        await recorder_mock.async_add_executor_job(_migrate)
+        assert not await recorder_mock.async_add_executor_job(_needs_migrate)
+
+    assert await recorder_mock.async_add_executor_job(_count_rows) == rows_before
+
+    def _inspect() -> None:
+        with session_scope(session=recorder_mock.get_session()) as session:
+            assert get_partitioned_tables(session) == set(PARTITIONED_TABLES)
+        inspector = inspect(recorder_mock.engine)
+        for table_name, referred_tables in (
+            ("states", {"state_attributes", "states_meta"}),
+            ("events", {"event_data", "event_types"}),
+        ):
+            primary_key = inspector.get_pk_constraint(table_name)
+            assert primary_key["name"] == f"{table_name}_pkey"
+            assert primary_key["constrained_columns"] == list(
+                PARTITIONED_TABLES[table_name]
+            )
+            assert {
+                foreign_key["referred_table"]
+                for foreign_key in inspector.get_foreign_keys(table_name)
+            } == referred_tables
+            assert {index["name"] for index in inspector.get_indexes(table_name)} >= {
+                index.name
+                for index in (
+                    States if table_name == "states" else Events
+                ).__table__.indexes
+            }
+            assert "states_partitioned" not in inspector.get_table_names()
+
+    await recorder_mock.async_add_executor_job(_inspect)
+
+    hass.states.async_set("sensor.test", "4", {"unit": "W"})
+    await async_wait_recording_done(hass)
+
+    def _get_new_state() -> tuple[int, int | None]:
+        with session_scope(session=recorder_mock.get_session()) as session:
+            count = session.execute(select(func.count(States.state_id))).scalar()
+            old_state_id = session.execute(
+                select(States.old_state_id).where(
+                    States.state_id == max(rows_before["states"]) + 1
+                )
+            ).scalar()
+            return count, old_state_id
+
+    assert await recorder_mock.async_add_executor_job(_get_new_state) == (
+        len(rows_before["states"]) + 1,
+        max(rows_before["states"]),
+    )
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_purge_partitions(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test purging drops the partitions before purge_before."""
+    now = dt_util.utcnow()
+    freezer.move_to(now - timedelta(days=5))
+    hass.states.async_set("sensor.old", "1", {"unit": "W"})
+    hass.bus.async_fire("old_event", {"data": 1})
+    await async_wait_recording_done(hass)
+    freezer.move_to(now)
+    hass.states.async_set("sensor.new", "1", {"unit": "W"})
+    await async_wait_recording_done(hass)
+
+    def _partition_tables() -> None:
+        today = start_of_utc_day(now)
+        for table_name in PARTITIONED_TABLES:
+            done = False
+            while not done:
+                with session_scope(session=recorder_mock.get_session()) as session:
+                    done = partition_table(
+                        session,
+                        table_name,
+                        today - 7 * PARTITION_INTERVAL,
+                        today + 2 * PARTITION_INTERVAL,
+                    )
+
+    await recorder_mock.async_add_executor_job(_partition_tables)
+    old_partitions = {
+        partition_name(table_name, start_of_utc_day(now - timedelta(days=5)))
+        for table_name in PARTITIONED_TABLES
+    }
+
+    def _get_partitions() -> set[str]:
+        with session_scope(hass=hass) as session:
+            return {
+                partition
+                for table_name in PARTITIONED_TABLES
+                for partition in get_partitions(session, table_name)
+            }
+
+    assert old_partitions <= _get_partitions()
+    assert "sensor.old" in recorder_mock.states_manager._last_committed_id
+
+    purge_before = now - timedelta(days=2)
+    # Dropping partitions stops once the purge cycle used its time budget
+    with patch.object(PurgeBatchSizer, "cycle_expired", True):
+        assert not purge_old_data(recorder_mock, purge_before, repack=False)
+    assert old_partitions <= _get_partitions()
+
+    assert purge_old_data(recorder_mock, purge_before, repack=False)
+    assert not old_partitions & _get_partitions()
+    # The dropped states are no longer linked as old state
+    assert "sensor.old" not in recorder_mock.states_manager._last_committed_id
+    assert "sensor.new" in recorder_mock.states_manager._last_committed_id
+
+    with session_scope(hass=hass) as session:
+        assert [state.entity_id for state in session.query(States)] == ["sensor.new"]
+        assert session.query(StateAttributes).count() == 1
@@ -13,10 +13,14 @@ from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
 from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
-from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.const import (
+    REF_COUNT_MIGRATION_ID,
+    SupportedDialect,
+)
 from homeassistant.components.recorder.db_schema import (
     Events,
     EventTypes,
+    MigrationChanges,
     RecorderRuns,
     StateAttributes,
     States,
@@ -25,7 +29,13 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    MIN_PURGE_BATCH_SIZE,
+    PURGE_CYCLE_TARGET_LATENCY,
+    PurgeBatchSizer,
+    _select_unused_attributes_ids,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -110,6 +120,76 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+@pytest.mark.parametrize("recorder_config", [{"ref_counting": True}])
+async def test_purge_with_ref_counting(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test unreferenced attributes are found by their reference counts."""
+    for _ in range(4):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+    assert recorder_mock.state_attributes_manager.ref_counts_valid
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 24
+        assert [
+            ref_count for (ref_count,) in session.query(StateAttributes.ref_count)
+        ] == [8, 8, 8]
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with patch(
+        "homeassistant.components.recorder.purge._select_unused_attributes_ids",
+        wraps=_select_unused_attributes_ids,
+    ) as select_unused_attributes_ids:
+        purge_old_data(recorder_mock, purge_before, repack=False)
+    # Only the attributes found by the reference counts are checked
+    select_unused_attributes_ids.assert_called_once()
+    assert len(select_unused_attributes_ids.call_args[0][2]) == 2
+    assert recorder_mock.state_attributes_manager.ref_counts_valid
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 8
+        assert [
+            ref_count for (ref_count,) in session.query(StateAttributes.ref_count)
+        ] == [8]
+
+
+@pytest.mark.parametrize("recorder_config", [{"ref_counting": True}])
+async def test_purge_with_stale_ref_counts(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test attributes are kept when their reference counts are out of date."""
+    with freeze_time(dt_util.utcnow() - timedelta(days=5)):
+        hass.states.async_set("sensor.old", "1", {"shared": True})
+        await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.new", "1", {"shared": True})
+    await async_wait_recording_done(hass)
+    assert recorder_mock.state_attributes_manager.ref_counts_valid
+    with session_scope(hass=hass) as session:
+        assert (
+            session.query(MigrationChanges)
+            .filter_by(migration_id=REF_COUNT_MIGRATION_ID)
+            .count()
+        )
+        # Counts as if another version recorded states without counting
+        session.query(StateAttributes).update({StateAttributes.ref_count: 0})
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    purge_old_data(recorder_mock, purge_before, repack=False)
+    assert not recorder_mock.state_attributes_manager.ref_counts_valid
+    assert not recorder_mock.event_data_manager.ref_counts_valid
+
+    with session_scope(hass=hass) as session:
+        assert [state.entity_id for state in session.query(States)] == ["sensor.new"]
+        # The attributes of the remaining state are kept
+        assert session.query(StateAttributes).count() == 1
+        assert (
+            not session.query(MigrationChanges)
+            .filter_by(migration_id=REF_COUNT_MIGRATION_ID)
+            .count()
+        )
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     assert recorder_mock.states_manager.oldest_ts is None
@@ -2249,3 +2329,61 @@ async def test_purge_entities_keep_days(
     )
     assert len(states["sensor.keep"]) == 2
     assert "sensor.purge" not in states
+
+
+async def test_purge_batch_time_includes_unused_ids(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the time of a batch includes releasing its attributes and data."""
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    calls: list[str] = []
+    with (
+        patch(
+            "homeassistant.components.recorder.purge._purge_unused_attributes_ids",
+            side_effect=lambda *args: calls.append("attributes"),
+        ),
+        patch(
+            "homeassistant.components.recorder.purge._purge_unused_data_ids",
+            side_effect=lambda *args: calls.append("data"),
+        ),
+        patch.object(
+            PurgeBatchSizer,
+            "batch_done",
+            autospec=True,
+            side_effect=lambda *args: calls.append("batch_done"),
+        ),
+    ):
+        purge_old_data(
+            recorder_mock, dt_util.utcnow() - timedelta(days=4), repack=False
+        )
+    assert calls == ["attributes", "batch_done", "data", "batch_done"]
+
+
+def test_purge_batch_sizer() -> None:
+    """Test the purge batch size adapts to the target latency."""
+    batch_sizer = PurgeBatchSizer()
+    assert batch_sizer.batch_size(4000) == 4000
+
+    # Slow deletes shrink the batch size
+    with patch("time.monotonic", return_value=101.0):
+        batch_sizer.batch_done(4000, 100.0, 4000)
+    assert batch_sizer.batch_size(4000) == (4000 + 200) // 2
+    with patch("time.monotonic", return_value=1000.0):
+        for _ in range(20):
+            batch_sizer.batch_done(100, 900.0, 4000)
+    assert batch_sizer.batch_size(4000) == MIN_PURGE_BATCH_SIZE
+
+    # Fast deletes grow the batch size up to max_bind_vars
+    with patch("time.monotonic", return_value=100.001):
+        for _ in range(20):
+            batch_sizer.batch_done(1000, 100.0, 4000)
+    assert batch_sizer.batch_size(4000) == 4000
+    assert batch_sizer.batch_size(500) == 500
+
+    with patch("time.monotonic", return_value=100.0):
+        batch_sizer.start_cycle()
+        assert not batch_sizer.cycle_expired
+    with patch("time.monotonic", return_value=100.0 + PURGE_CYCLE_TARGET_LATENCY):
+        assert batch_sizer.cycle_expired
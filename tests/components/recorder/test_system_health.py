@@ -35,6 +35,9 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "commit_latency": ANY,
+        "commit_batch_size": ANY,
+        "queue_depth": ANY,
     }
 
 
@@ -64,6 +67,9 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "commit_latency": ANY,
+        "commit_batch_size": ANY,
+        "queue_depth": ANY,
     }
 
 
@@ -99,6 +105,9 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "commit_latency": ANY,
+        "commit_batch_size": ANY,
+        "queue_depth": ANY,
     }
 
 
@@ -127,4 +136,7 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "commit_latency": ANY,
+        "commit_batch_size": ANY,
+        "queue_depth": ANY,
     }
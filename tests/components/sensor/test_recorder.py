@@ -49,8 +49,14 @@ from homeassistant.components.sensor.recorder import (
     MEAN_TYPE_CHANGED_ISSUE,
     STATE_CLASS_REMOVED_ISSUE,
     UNITS_CHANGED_ISSUE,
+    SensorStatesBuffer,
+)
+from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    DEGREE,
+    EVENT_HOMEASSISTANT_STOP,
+    STATE_UNAVAILABLE,
 )
-from homeassistant.const import ATTR_FRIENDLY_NAME, DEGREE, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.setup import async_setup_component
@@ -6293,3 +6299,88 @@ async def test_validate_statistics_mean_type_changed(
 
     # Issue should be resolved
     await assert_validation_result(hass, client, {}, {})
+
+
+async def test_sensor_states_buffer(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the sensor states buffer returns the same states as the history API."""
+    zero = get_start_time(dt_util.utcnow())
+    freezer.move_to(zero - timedelta(minutes=1))
+    attributes = {"state_class": "measurement"}
+    hass.states.async_set("sensor.test1", "10", attributes)
+    hass.states.async_set("sensor.test2", "1", attributes)
+    hass.states.async_set("sensor.test3", "1", attributes)
+    hass.states.async_set("sensor.no_state_class", "1")
+    hass.states.async_set("binary_sensor.test", "on")
+
+    freezer.move_to(zero - timedelta(seconds=30))
+    states_buffer = SensorStatesBuffer(hass)
+    states_buffer.async_start()
+    start = zero
+    end = zero + timedelta(minutes=5)
+
+    freezer.move_to(zero + timedelta(minutes=1))
+    hass.states.async_set("sensor.test1", "20", attributes)
+    hass.states.async_set(
+        "sensor.test2", "1", {**attributes, "unit_of_measurement": "W"}
+    )
+    hass.states.async_set("sensor.no_state_class", "2")
+    # Removed sensors and sensors which lose their state class are dropped
+    hass.states.async_remove("sensor.test3")
+    hass.states.async_set("sensor.test1", "25")
+    hass.states.async_set("sensor.test1", "20", attributes)
+    freezer.move_to(zero + timedelta(minutes=2))
+    hass.states.async_set("sensor.test1", "30", attributes)
+    hass.states.async_set("binary_sensor.test", "off")
+    freezer.move_to(end)
+    hass.states.async_set("sensor.test1", "40", attributes)
+
+    # The buffer started tracking after the start of the previous period
+    assert (
+        states_buffer.get_history(
+            ["sensor.test1"], zero - timedelta(minutes=5), zero, False
+        )
+        is None
+    )
+    history_list = states_buffer.get_history(
+        [
+            "sensor.test1",
+            "sensor.test2",
+            "sensor.test3",
+            "sensor.no_state_class",
+            "sensor.missing",
+        ],
+        start,
+        end,
+        False,
+    )
+    assert history_list is not None
+    assert [state.state for state in history_list["sensor.test1"]] == ["20", "30"]
+    assert len(history_list["sensor.test2"]) == 2
+    assert history_list.keys() == {"sensor.test1", "sensor.test2"}
+
+    # Attribute changes are not significant
+    history_list = states_buffer.get_history(["sensor.test2"], start, end, True)
+    assert history_list is not None
+    assert len(history_list["sensor.test2"]) == 1
+
+    states_buffer.prune(end)
+    history_list = states_buffer.get_history(
+        ["sensor.test1"], end, end + timedelta(minutes=5), False
+    )
+    assert history_list is not None
+    assert [state.state for state in history_list["sensor.test1"]] == ["30", "40"]
+    # Pruned periods are no longer available
+    assert states_buffer.get_history(["sensor.test1"], start, end, False) is None
+
+    # The buffer stops tracking when Home Assistant stops
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.test1", "50", attributes)
+    assert (
+        states_buffer.get_history(
+            ["sensor.test1"], end, end + timedelta(minutes=5), False
+        )
+        is None
+    )
@@ -19,7 +19,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -1220,6 +1220,115 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_share_state_changed_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test subscribe_entities subscriptions share a single listener."""
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    await websocket_client.send_json_auto_id({"type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    all_subscription = msg["id"]
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == all_subscription
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "entity_ids": ["light.one"]}
+    )
+    msg = await websocket_client.receive_json()
+    one_subscription = msg["id"]
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == one_subscription
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.one", "on")
+    received = {}
+    for _ in range(3):
+        msg = await websocket_client.receive_json()
+        received.setdefault(msg["id"], []).extend(msg["event"]["a"])
+    assert received == {
+        all_subscription: ["light.two", "light.one"],
+        one_subscription: ["light.one"],
+    }
+
+    for subscription in (all_subscription, one_subscription):
+        await websocket_client.send_json_auto_id(
+            {"type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
+
+
+async def test_subscribe_entities_resync_since_sequence(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test subscribe_entities only sends the changes since a sequence."""
+    hass.states.async_set("light.unchanged", "off")
+    hass.states.async_set("light.changed", "off")
+    hass.states.async_set("light.removed", "off")
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "include_sequence": True}
+    )
+    msg = await websocket_client.receive_json()
+    subscription = msg["id"]
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == subscription
+    assert set(msg["event"]["a"]) == {
+        "light.unchanged",
+        "light.changed",
+        "light.removed",
+    }
+    assert "delta" not in msg
+    sequence = msg["seq"]
+
+    hass.states.async_set("light.unchanged", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.unchanged"]["+"]["s"] == "on"
+    assert msg["seq"] == sequence + 1
+    sequence = msg["seq"]
+
+    await websocket_client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": subscription}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.changed", "on")
+    hass.states.async_remove("light.removed")
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "since": sequence}
+    )
+    msg = await websocket_client.receive_json()
+    subscription = msg["id"]
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == subscription
+    assert msg["delta"] is True
+    assert msg["seq"] == sequence + 2
+    assert list(msg["event"]["a"]) == ["light.changed"]
+    assert msg["event"]["a"]["light.changed"]["s"] == "on"
+    assert msg["event"]["r"] == ["light.removed"]
+
+    # A sequence which is no longer tracked gets all states
+    await websocket_client.send_json_auto_id({"type": "subscribe_entities", "since": 0})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert "delta" not in msg
+    assert set(msg["event"]["a"]) == {"light.unchanged", "light.changed"}
+
+
 async def test_subscribe_unsubscribe_entities_with_filter(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2478,6 +2587,63 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_import_info(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test getting the import timings of integration modules."""
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_import_timings",
+        return_value={
+            "homeassistant.components.august": 1.5,
+            "homeassistant.components.august.lock": 0.25,
+        },
+    ):
+        await websocket_client.send_json_auto_id({"type": "integration/import_info"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"module": "homeassistant.components.august", "seconds": 1.5},
+        {"module": "homeassistant.components.august.lock", "seconds": 0.25},
+    ]
+
+
+async def test_integration_setup_trace(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test getting the setup trace of the startup."""
+    trace = {
+        "traceEvents": [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "august"}},
+            {
+                "name": "setup",
+                "cat": "setup",
+                "ph": "X",
+                "pid": 1,
+                "tid": 1,
+                "ts": 0,
+                "dur": 12500000,
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_setup_trace",
+        return_value=trace,
+    ):
+        await websocket_client.send_json_auto_id({"type": "integration/setup_trace"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == trace
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -18,6 +19,7 @@ from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -346,6 +348,85 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_conflate_pending_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test pending messages with the same key are replaced by the full message."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    with patch("homeassistant.components.websocket_api.http.PENDING_MSG_CONFLATE", 0):
+        for idx in range(3):
+            instance._send_conflatable_message(
+                "light.one",
+                f'{{"diff":{idx}}}'.encode(),
+                lambda idx=idx: f'{{"full":{idx}}}'.encode(),
+            )
+        instance._send_conflatable_message(
+            "light.two", b'{"diff":3}', lambda: b'{"full":3}'
+        )
+        assert len(instance._message_queue) == 2
+
+    assert await websocket_client.receive_json() == {"full": 2}
+    assert await websocket_client.receive_json() == {"diff": 3}
+    assert not instance._conflated_messages
+
+    instance._send_conflatable_message(
+        "light.one", b'{"diff":4}', lambda: b'{"full":4}'
+    )
+    assert await websocket_client.receive_json() == {"diff": 4}
+
+
+async def test_conflated_message_overflow(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the pending message is logged and dropped when the queue overflows."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    with (
+        patch("homeassistant.components.websocket_api.http.PENDING_MSG_CONFLATE", 0),
+        patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 1),
+    ):
+        instance._send_conflatable_message(
+            "light.one", b'{"diff":0}', lambda: b'{"full":0}'
+        )
+
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.CLOSE
+    await hass.async_block_till_done()
+    assert "Last message was: b'{\"diff\":0}'" in caplog.text
+    assert not instance._conflated_messages
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -452,6 +533,42 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_compressed_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test large messages are sent compressed once enabled."""
+    websocket_client = await hass_ws_client(hass)
+
+    with patch(
+        "homeassistant.components.websocket_api.http.COMPRESSED_MESSAGE_MIN_SIZE", 30
+    ):
+        await websocket_client.send_json({"id": 1, "type": "ping"})
+        msg = await websocket_client.receive()
+        assert msg.type is WSMsgType.TEXT
+
+        await websocket_client.send_json(
+            {
+                "id": 2,
+                "type": "supported_features",
+                "features": {const.FEATURE_COMPRESSED_MESSAGES: 1},
+            }
+        )
+        msg = await websocket_client.receive()
+        assert msg.type is WSMsgType.BINARY
+        assert json_loads(zlib.decompress(msg.data)) == {
+            "id": 2,
+            "type": "result",
+            "success": True,
+            "result": None,
+        }
+
+        # Small messages are still sent as text
+        await websocket_client.send_json({"id": 3, "type": "ping"})
+        msg = await websocket_client.receive()
+        assert msg.type is WSMsgType.TEXT
+        assert json_loads(msg.data) == {"id": 3, "type": "pong"}
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
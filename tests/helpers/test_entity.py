@@ -2486,6 +2486,58 @@ async def test_cached_entity_property_override(hass: HomeAssistant) -> None:
                 return "🤡"
 
 
+async def test_track_attribute_changes(hass: HomeAssistant) -> None:
+    """Test attributes are reused until an _attr_ property changes them."""
+
+    class TrackingEntity(entity.Entity):
+        _track_attribute_changes = True
+        _attr_icon = "mdi:one"
+
+        def __init__(self) -> None:
+            self.calculations = 0
+
+        @property
+        def state_attributes(self) -> dict[str, Any]:
+            self.calculations += 1
+            return {"calculations": self.calculations}
+
+    ent = TrackingEntity()
+    ent.entity_id = "test.tracking"
+    ent.hass = hass
+
+    ent._attr_state = "one"
+    ent.async_write_ha_state()
+    first = hass.states.get(ent.entity_id)
+    assert first.attributes == {"calculations": 1, "icon": "mdi:one"}
+
+    # Setting the state does not calculate the attributes again
+    ent._attr_state = "two"
+    ent.async_write_ha_state()
+    second = hass.states.get(ent.entity_id)
+    assert second.state == "two"
+    assert second.attributes is first.attributes
+    assert ent.calculations == 1
+
+    ent._attr_icon = "mdi:two"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes == {
+        "calculations": 2,
+        "icon": "mdi:two",
+    }
+
+    del ent._attr_icon
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes == {
+        "calculations": 3,
+        "icon": "mdi:one",
+    }
+
+    ent._attr_available = False
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == STATE_UNAVAILABLE
+    assert ent.calculations == 3
+
+
 async def test_entity_report_deprecated_supported_features_values(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
@@ -19,6 +19,7 @@ from homeassistant.core import (
     Event,
     EventStateChangedData,
     EventStateReportedData,
+    HassJob,
     HomeAssistant,
     callback,
 )
@@ -26,9 +27,14 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    _TRACK_TIME_PATTERN_DATA,
+    TIMER_WHEEL_RESOLUTION,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    _async_get_timer_wheel,
+    _Timer,
+    async_call_at,
     async_call_later,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
@@ -53,6 +59,7 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.template import Template, result_as_boolean
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import get_scheduled_timer_handles
 
 from tests.common import async_fire_time_changed, async_fire_time_changed_exact
 
@@ -3887,6 +3894,120 @@ async def test_async_track_time_change(
     assert len(none_runs) == 3
 
 
+async def test_periodic_task_shared_pattern(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test periodic tasks with the same pattern share a single wakeup."""
+    runs_1 = []
+    runs_2 = []
+    runs_3 = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    unsub_1 = async_track_utc_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: runs_1.append(x)),
+        minute="/5",
+        second=0,
+    )
+    unsub_2 = async_track_utc_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: runs_2.append(x)),
+        minute="/5",
+        second=0,
+    )
+    unsub_3 = async_track_utc_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: runs_3.append(x)),
+        minute="/10",
+        second=0,
+    )
+    assert len(hass.data[_TRACK_TIME_PATTERN_DATA]) == 2
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == len(runs_2) == len(runs_3) == 1
+    assert runs_1 == runs_2
+
+    unsub_1()
+    assert len(hass.data[_TRACK_TIME_PATTERN_DATA]) == 2
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+    assert len(runs_2) == 2
+    assert len(runs_3) == 1
+
+    unsub_2()
+    unsub_3()
+    assert not hass.data[_TRACK_TIME_PATTERN_DATA]
+
+
+async def test_periodic_task_shared_pattern_matches_before_wakeup(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a listener joining a shared pattern still fires on the current match."""
+    runs_1 = []
+    runs_2 = []
+
+    now = dt_util.utcnow()
+    freezer.move_to(datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC))
+
+    with patch("homeassistant.helpers.event.randint", return_value=50000):
+        unsub_1 = async_track_utc_time_change(
+            hass,
+            # pylint: disable-next=unnecessary-lambda
+            callback(lambda x: runs_1.append(x)),
+            minute="*",
+            second=0,
+        )
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+
+    # The second listener matches 12:00:00.05 like the first one did
+    freezer.move_to(datetime(now.year + 1, 5, 24, 12, 0, 0, 10000, tzinfo=dt_util.UTC))
+    unsub_2 = async_track_utc_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: runs_2.append(x)),
+        minute="*",
+        second=0,
+    )
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+    assert len(runs_2) == 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 1, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == 2
+    assert len(runs_2) == 2
+
+    unsub_1()
+    unsub_2()
+
+
 async def test_periodic_task_minute(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -4468,6 +4589,103 @@ async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
             assert await future, "callback not canceled"
 
 
+async def test_timer_wheel(hass: HomeAssistant) -> None:
+    """Test timers due in the same slot share a single loop handle."""
+    calls: list[int] = []
+
+    def _active_handles() -> int:
+        return sum(
+            not handle.cancelled() for handle in get_scheduled_timer_handles(hass.loop)
+        )
+
+    active_handles = _active_handles()
+    slot_start = (
+        int(hass.loop.time() // TIMER_WHEEL_RESOLUTION) + 10
+    ) * TIMER_WHEEL_RESOLUTION
+    async_call_at(hass, callback(lambda _: calls.append(2)), slot_start + 0.2)
+    async_call_at(hass, callback(lambda _: calls.append(1)), slot_start + 0.1)
+    remove = async_call_at(hass, callback(lambda _: calls.append(3)), slot_start + 0.3)
+    assert _active_handles() == active_handles + 1
+
+    remove()
+    remove()
+    assert _active_handles() == active_handles + 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert calls == [1, 2]
+    assert _active_handles() == active_handles
+
+    remove = async_call_later(hass, 5, callback(lambda _: calls.append(4)))
+    assert _active_handles() == active_handles + 1
+    remove()
+    assert _active_handles() == active_handles
+
+
+async def test_timer_wheel_cancel_and_schedule_in_batch(hass: HomeAssistant) -> None:
+    """Test timers due in the same batch can cancel or schedule each other."""
+    calls: list[int] = []
+    wheel = _async_get_timer_wheel(hass)
+    slot_start = (
+        int(hass.loop.time() // TIMER_WHEEL_RESOLUTION) + 10
+    ) * TIMER_WHEEL_RESOLUTION
+    job = HassJob(lambda: None, "test timer")
+
+    @callback
+    def _first() -> None:
+        calls.append(1)
+        wheel.async_cancel(second)
+        wheel.async_schedule(third, slot_start + 20)
+
+    first = _Timer(job, _first)
+    second = _Timer(job, lambda: calls.append(2))
+    third = _Timer(job, lambda: calls.append(3))
+    wheel.async_schedule(first, slot_start + 0.1)
+    wheel.async_schedule(second, slot_start + 0.2)
+    wheel.async_schedule(third, slot_start + 0.3)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert calls == [1]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=21))
+    await hass.async_block_till_done()
+    assert calls == [1, 3]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+    assert calls == [1, 3]
+
+
+async def test_timer_wheel_handle_cancelled_on_shutdown(hass: HomeAssistant) -> None:
+    """Test timers of a bucket cancelled on shutdown are not revived."""
+    calls: list[int] = []
+    wheel = _async_get_timer_wheel(hass)
+    slot_start = (
+        int(hass.loop.time() // TIMER_WHEEL_RESOLUTION) + 10
+    ) * TIMER_WHEEL_RESOLUTION
+    job = HassJob(lambda: None, "test timer", cancel_on_shutdown=True)
+
+    first = _Timer(job, lambda: calls.append(1))
+    second = _Timer(job, lambda: calls.append(2))
+    third = _Timer(job, lambda: calls.append(3))
+    wheel.async_schedule(first, slot_start + 0.1)
+    wheel.async_schedule(second, slot_start + 0.2)
+    bucket = first.bucket
+    bucket.handle.cancel()
+
+    wheel.async_schedule(third, slot_start + 0.3)
+    assert third.bucket is bucket
+    assert first.bucket is None
+    assert second.bucket is None
+    assert bucket.size == 1
+    assert bucket.when == slot_start + 0.3
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert calls == [3]
+
+
 async def test_track_state_change_event_chain_multple_entity(
     hass: HomeAssistant,
 ) -> None:
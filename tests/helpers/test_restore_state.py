@@ -6,6 +6,8 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
+
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
@@ -15,6 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    LAST_SEEN_REFRESH_INTERVAL,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -51,7 +54,9 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(
+        {"states": [state.as_dict() for state in stored_states]}
+    )
 
     # Emulate a fresh load
     hass.data.pop(DATA_RESTORE_STATE)
@@ -96,7 +101,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     """Test that we write periodiclly but not after stop."""
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([])
+    await data.store.async_save({"states": []})
 
     # Emulate a fresh load
     with patch(
@@ -144,7 +149,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     """Test that we cancel the currently running job, save the data, and verify the perdiodic job continues."""
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([])
+    await data.store.async_save({"states": []})
 
     # Emulate a fresh load
     with patch(
@@ -211,7 +216,9 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(
+        {"states": [state.as_dict() for state in stored_states]}
+    )
 
     # Emulate a fresh load
     hass.set_state(CoreState.not_running)
@@ -298,7 +305,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0]["states"]
 
     for state in states:
         hass.states.async_remove(state.entity_id)
@@ -332,7 +339,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0]["states"]
     assert len(written_states) == 2
     state0 = json_round_trip(written_states[0])
     state1 = json_round_trip(written_states[1])
@@ -342,6 +349,75 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_changed_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that only changed states are serialized when dumping changes."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await platform.async_add_entities([entity])
+        entities.append(entity)
+
+    data = async_get(hass)
+
+    with (
+        patch.object(data.store, "async_compact_journal") as mock_compact,
+        patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data,
+    ):
+        await data.async_dump_states()
+
+    assert mock_compact.called
+    written_states = mock_write_data.mock_calls[0][1][0]["states"]
+    assert [json_round_trip(state)["id"] for state in written_states] == [
+        "input_boolean.b0",
+        "input_boolean.b1",
+    ]
+
+    entities[1]._attr_state = "on"
+    entities[1].async_write_ha_state()
+    freezer.tick(timedelta(minutes=15))
+
+    with (
+        patch.object(data.store, "async_compact_journal") as mock_compact,
+        patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data,
+        patch.object(
+            data, "_async_dump_state", wraps=data._async_dump_state
+        ) as mock_dump_state,
+    ):
+        await data.async_dump_states(full=False)
+
+    # Only the state of the entity which wrote its state is serialized
+    assert not mock_compact.called
+    assert len(mock_dump_state.mock_calls) == 1
+    changed_states = mock_write_data.mock_calls[0][1][0]["states"]
+    assert changed_states[0] is written_states[0]
+    assert changed_states[1] is not written_states[1]
+    assert json_round_trip(changed_states[1])["state"]["state"] == "on"
+
+    # The unchanged states are checked and their last seen time
+    # refreshed once a day
+    freezer.tick(LAST_SEEN_REFRESH_INTERVAL)
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states(full=False)
+
+    refreshed_states = mock_write_data.mock_calls[0][1][0]["states"]
+    assert refreshed_states[0] is not written_states[0]
+    assert json_round_trip(refreshed_states[0])["last_seen"] == (
+        dt_util.utcnow().isoformat()
+    )
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -515,7 +591,7 @@ async def test_restore_entity_end_to_end(
     await data.async_dump_states()
     await hass.async_block_till_done()
 
-    storage_data = hass_storage[STORAGE_KEY]["data"]
+    storage_data = hass_storage[STORAGE_KEY]["data"]["states"]
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
@@ -530,7 +606,7 @@ async def test_restore_entity_end_to_end(
     await data.async_dump_states()
     await hass.async_block_till_done()
 
-    storage_data = hass_storage[STORAGE_KEY]["data"]
+    storage_data = hass_storage[STORAGE_KEY]["data"]["states"]
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
@@ -20,7 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -786,6 +786,75 @@ async def test_loading_corrupt_file_known_domain(
         await hass.async_stop(force=True)
 
 
+async def test_journaled_store(tmpdir: py.path.local) -> None:
+    """Test a journaled store appends the changes to its journal."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journaled=True)
+
+        def _read(path: str) -> str:
+            with open(path, encoding="utf8") as fdesc:
+                return fdesc.read()
+
+        data = {
+            "items": [{"id": "a", "value": 1}, {"id": "b", "value": 2}],
+            "other": "one",
+        }
+        await store.async_save(data)
+        snapshot = await hass.async_add_executor_job(_read, store.path)
+        assert json.loads(snapshot)["data"] == data
+
+        data = {
+            "items": [{"id": "a", "value": 1}, {"id": "c", "value": 3}],
+            "other": "two",
+        }
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(_read, store.path) == snapshot
+        journal = await hass.async_add_executor_job(_read, store.journal_path)
+        assert journal.splitlines()[1:] == [
+            '{"k":"items","id":"c","v":{"id":"c","value":3}}',
+            '{"k":"items","id":"b","r":true}',
+            '{"k":"other","v":"two"}',
+        ]
+
+        # Saving the same data, or json fragments of it, does not append
+        # to the journal
+        await store.async_save(data)
+        await store.async_save(
+            data
+            | {"items": [json_fragment(json_bytes(item)) for item in data["items"]]}
+        )
+        assert await hass.async_add_executor_job(_read, store.journal_path) == journal
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journaled=True)
+        assert await store2.async_load() == data
+
+        # The journal is compacted into the snapshot when it gets too large
+        for value in range(2, 20):
+            data["items"][0] = {"id": "a", "value": value, "padding": "x" * 100}
+            await store.async_save(data)
+        snapshot = await hass.async_add_executor_job(_read, store.path)
+        assert json.loads(snapshot)["data"]["items"][0]["value"] > 2
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journaled=True)
+        assert await store3.async_load() == data
+
+        # A journal of another snapshot is not replayed
+        def _replace_journal() -> None:
+            with open(store.journal_path, "w", encoding="utf8") as fdesc:
+                fdesc.write('{"journal":"other"}\n{"k":"other","v":"three"}\n')
+
+        await hass.async_add_executor_job(_replace_journal)
+        store4 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journaled=True)
+        assert (await store4.async_load())["other"] == "two"
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
 async def test_os_error_is_fatal(tmpdir: py.path.local) -> None:
     """Test OSError during load is fatal."""
     loop = asyncio.get_running_loop()
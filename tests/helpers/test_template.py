@@ -5192,6 +5192,61 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test identical templates are compiled once per kind of environment."""
+    template_string = "{{ 'compiled ' ~ 20 }}"
+    cache = template.COMPILED_TEMPLATE_CACHE
+    with patch.object(cache, "set", wraps=cache.set) as mock_set:
+        tpl = template.Template(template_string, hass)
+        assert tpl.async_render() == "compiled 20"
+        assert len(mock_set.mock_calls) == 1
+
+        # A new environment which compiles the same way reuses the code
+        env = template.TemplateEnvironment(hass, log_fn=lambda level, msg: None)
+        assert env.compile(template_string)
+        assert len(mock_set.mock_calls) == 1
+
+        # Filters are bound differently in limited templates
+        env = template.TemplateEnvironment(hass, limited=True)
+        assert env.compile(template_string)
+        assert len(mock_set.mock_calls) == 2
+
+    # The cache is only loaded by the Python version which wrote it
+    data = cache.dumps()
+    assert not cache.changed
+    loaded = template._CompiledTemplateCache(10)
+    loaded.loads(b"\x00" * len(data))
+    assert not loaded._codes
+    loaded.loads(data)
+    assert loaded._codes
+    key = next(iter(loaded._codes.keys()))
+    assert loaded.get(key) is not None
+
+
+async def test_compiled_template_cache_version_and_time_zone(
+    hass: HomeAssistant,
+) -> None:
+    """Test code compiled by another version or in another time zone is not used."""
+    template_string = "{{ 'compiled in ' ~ 'version' }}"
+    cache = template.COMPILED_TEMPLATE_CACHE
+    with patch.object(cache, "set", wraps=cache.set) as mock_set:
+        with patch.object(template, "__version__", "0.1.0"):
+            env = template.TemplateEnvironment(hass)
+            assert env.compile(template_string)
+        assert len(mock_set.mock_calls) == 1
+
+        # The cache written by the other version is loaded but not used
+        cache.loads(cache.dumps())
+        env = template.TemplateEnvironment(hass)
+        assert env.compile(template_string)
+        assert len(mock_set.mock_calls) == 2
+
+        await hass.config.async_update(time_zone="America/New_York")
+        env = template.TemplateEnvironment(hass)
+        assert env.compile(template_string)
+        assert len(mock_set.mock_calls) == 3
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
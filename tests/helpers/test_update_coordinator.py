@@ -249,6 +249,31 @@ async def test_update_context(
     assert not set(crd.async_contexts())
 
 
+async def test_update_listeners_share_state_timestamp(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the states written by the listeners are written as one update."""
+
+    @callback
+    def update_callback1() -> None:
+        hass.states.async_set("sensor.one", str(crd.data))
+
+    @callback
+    def update_callback2() -> None:
+        hass.states.async_set("sensor.two", str(crd.data))
+
+    crd.async_add_listener(update_callback1)
+    crd.async_add_listener(update_callback2)
+    await crd.async_refresh()
+
+    one = hass.states.get("sensor.one")
+    two = hass.states.get("sensor.two")
+    assert one.state == two.state == "1"
+    assert one.last_updated == two.last_updated
+    assert one.context is not two.context
+
+
 async def test_request_refresh(
     crd: update_coordinator.DataUpdateCoordinator[int],
 ) -> None:
@@ -1613,3 +1613,54 @@ async def test_no_base_platforms_loaded_before_recorder(hass: HomeAssistant) ->
     assert not problems, (
         f"Integrations that are setup before recorder implement base platforms: {problems}"
     )
+
+
+async def test_integrations_to_preload(hass: HomeAssistant) -> None:
+    """Test only integrations with installed requirements are imported ahead."""
+    installed = mock_integration(
+        hass, MockModule("installed", requirements=["installed==1.0"])
+    )
+    missing = mock_integration(
+        hass, MockModule("missing", requirements=["missing==1.0"])
+    )
+    dependent = mock_integration(
+        hass, MockModule("dependent", dependencies=["missing"])
+    )
+    integrations = {
+        integration.domain: integration
+        for integration in (installed, missing, dependent)
+    }
+    for integration in integrations.values():
+        await integration.resolve_dependencies()
+
+    with patch(
+        "homeassistant.util.package.is_installed",
+        side_effect=lambda requirement: requirement == "installed==1.0",
+    ):
+        assert await bootstrap._async_get_integrations_to_preload(
+            hass, integrations
+        ) == {"installed": installed}
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_preload_import_snapshot_only_with_snapshot(
+    hass: HomeAssistant,
+) -> None:
+    """Test the requirements are only checked when there is a snapshot."""
+    mock_integration(hass, MockModule("root"))
+
+    with patch.object(
+        bootstrap, "_async_get_integrations_to_preload", return_value={}
+    ) as mock_to_preload:
+        await bootstrap._async_set_up_integrations(hass, {"root": {}})
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert not mock_to_preload.called
+
+    hass.data[loader.DATA_IMPORT_SNAPSHOT] = {"root": []}
+    with patch.object(
+        bootstrap, "_async_get_integrations_to_preload", return_value={}
+    ) as mock_to_preload:
+        await bootstrap._async_set_up_integrations(hass, {"root": {}})
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert mock_to_preload.called
+    assert loader.DATA_IMPORT_SNAPSHOT not in hass.data
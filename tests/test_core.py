@@ -1165,6 +1165,91 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_match_data_listener(hass: HomeAssistant) -> None:
+    """Test listeners indexed by the values of a key of the event data."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data.get("filtered")
+
+    init_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen(
+        "test", listener, match_data=("entity_id", ["light.a", "light.b"])
+    )
+    unsub_filtered = hass.bus.async_listen(
+        "test",
+        listener,
+        event_filter=mock_filter,
+        match_data=("entity_id", ["light.b"]),
+    )
+    assert hass.bus.async_listeners()["test"] == init_count + 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    hass.bus.async_fire("test", {"entity_id": "light.b"})
+    hass.bus.async_fire("test", {"entity_id": "light.b", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": "light.c"})
+    hass.bus.async_fire("test", {"entity_id": ["light.a"]})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert calls == [
+        {"entity_id": "light.a"},
+        {"entity_id": "light.b"},
+        {"entity_id": "light.b"},
+        {"entity_id": "light.b", "filtered": True},
+    ]
+
+    unsub()
+    calls.clear()
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    hass.bus.async_fire("test", {"entity_id": "light.b"})
+    await hass.async_block_till_done()
+    assert calls == [{"entity_id": "light.b"}]
+
+    unsub_filtered()
+    assert hass.bus.async_listeners().get("test", 0) == init_count
+
+    with pytest.raises(HomeAssistantError, match="Match data is not supported"):
+        hass.bus.async_listen(MATCH_ALL, listener, match_data=("entity_id", ["a"]))
+
+
+async def test_eventbus_match_data_listener_order(hass: HomeAssistant) -> None:
+    """Test indexed listeners run in registration order with the others."""
+    calls = []
+
+    def _listener(name):
+        @ha.callback
+        def listener(event):
+            """Mock listener."""
+            calls.append(name)
+
+        return listener
+
+    hass.bus.async_listen("test", _listener("first"))
+    hass.bus.async_listen(
+        "test", _listener("second"), match_data=("entity_id", ["light.a"])
+    )
+    hass.bus.async_listen("test", _listener("third"))
+    hass.bus.async_listen_once("test", _listener("fourth"))
+    hass.bus.async_listen(
+        "test", _listener("fifth"), match_data=("device_id", ["device"])
+    )
+    hass.bus.async_listen(
+        "test", _listener("sixth"), match_data=("entity_id", ["light.a"])
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.a", "device_id": "device"})
+    await hass.async_block_till_done()
+    assert calls == ["first", "second", "third", "fourth", "fifth", "sixth"]
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1488,6 +1573,70 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_change_sequence(hass: HomeAssistant) -> None:
+    """Test the state machine tracks the sequence of recent state changes."""
+    start = hass.states.async_change_sequence()
+    assert hass.states.async_entity_ids_changed_since(start) == set()
+    assert hass.states.async_entity_ids_changed_since(start - 1) is None
+
+    hass.states.async_set("light.bowl", "on")
+    assert hass.states.get("light.bowl").change_sequence == start + 1
+    hass.states.async_set("light.ceiling", "on")
+    middle = hass.states.async_change_sequence()
+    # Reporting the same state is not a change
+    hass.states.async_set("light.ceiling", "on")
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_remove("light.ceiling")
+
+    assert hass.states.async_change_sequence() == start + 4
+    assert hass.states.async_entity_ids_changed_since(start) == {
+        "light.bowl",
+        "light.ceiling",
+    }
+    assert hass.states.async_entity_ids_changed_since(middle) == {
+        "light.bowl",
+        "light.ceiling",
+    }
+    assert hass.states.async_entity_ids_changed_since(start + 3) == {"light.ceiling"}
+    assert hass.states.async_entity_ids_changed_since(start + 4) == set()
+    assert hass.states.async_entity_ids_changed_since(start + 5) is None
+
+    with patch("homeassistant.core.MAX_TRACKED_STATE_CHANGES", 2):
+        state_machine = ha.StateMachine(hass.bus, hass.loop)
+    first = state_machine.async_change_sequence()
+    for state in ("on", "off", "on"):
+        state_machine.async_set("light.bowl", state)
+    assert state_machine.async_entity_ids_changed_since(first) is None
+    assert state_machine.async_entity_ids_changed_since(first + 1) == {"light.bowl"}
+
+
+async def test_statemachine_batch_update(hass: HomeAssistant) -> None:
+    """Test states set in a batch share their timestamp."""
+    own_context = ha.Context()
+    with hass.states.async_batch_update():
+        hass.states.async_set("light.bowl", "on")
+        with hass.states.async_batch_update():
+            hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("light.desk", "on", context=own_context)
+
+    bowl = hass.states.get("light.bowl")
+    ceiling = hass.states.get("light.ceiling")
+    desk = hass.states.get("light.desk")
+    assert bowl.last_updated == ceiling.last_updated == desk.last_updated
+    assert bowl.context is not ceiling.context
+    assert desk.context is own_context
+
+    batch_context = ha.Context()
+    with hass.states.async_batch_update(batch_context):
+        hass.states.async_set("light.bowl", "off")
+        hass.states.async_set("light.ceiling", "off")
+    assert hass.states.get("light.bowl").context is batch_context
+    assert hass.states.get("light.ceiling").context is batch_context
+
+    hass.states.async_set("light.bowl", "on")
+    assert hass.states.get("light.bowl").context is not batch_context
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
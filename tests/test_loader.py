@@ -14,11 +14,17 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -2089,6 +2095,82 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
     )
 
 
+async def test_manifest_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test manifests are loaded from the cache until they change."""
+    from homeassistant import components  # pylint: disable=import-outside-toplevel
+
+    await loader.async_load_manifest_cache(hass)
+    integration = await hass.async_add_executor_job(
+        loader.Integration.resolve_from_root, hass, components, "hue"
+    )
+    assert integration is not None
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    cached = hass_storage[loader.MANIFEST_CACHE_KEY]["data"]
+    assert str(integration.file_path) in cached["integrations"]
+
+    # A new start reads the manifest from the cache
+    await loader.async_load_manifest_cache(hass)
+    with patch("homeassistant.loader.json_loads") as mock_json_loads:
+        cached_integration = await hass.async_add_executor_job(
+            loader.Integration.resolve_from_root, hass, components, "hue"
+        )
+    assert not mock_json_loads.called
+    assert cached_integration.manifest == integration.manifest
+    assert cached_integration.platforms_exists(["light"]) == ["light"]
+
+    # The cache of another version or of a changed manifest is not used
+    for entry in cached["integrations"].values():
+        entry["mtimes"] = [0, 0]
+    hass_storage[loader.MANIFEST_CACHE_KEY]["data"] = cached
+    await loader.async_load_manifest_cache(hass)
+    with patch("homeassistant.loader.json_loads", wraps=json_loads) as mock_json_loads:
+        await hass.async_add_executor_job(
+            loader.Integration.resolve_from_root, hass, components, "hue"
+        )
+    assert mock_json_loads.called
+
+    hass_storage[loader.MANIFEST_CACHE_KEY]["data"]["version"] = "0.0.0"
+    await loader.async_load_manifest_cache(hass)
+    assert loader.DATA_MANIFEST_CACHE in hass.data
+    assert hass.data[loader.DATA_MANIFEST_CACHE].get(integration.file_path) is None
+
+
+async def test_import_snapshot(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the modules imported by the last start are preloaded."""
+    await loader.async_load_import_snapshot(hass)
+    integration = await loader.async_get_integration(hass, "hue")
+    await integration.async_get_platform("light")
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    snapshot = hass_storage[loader.IMPORT_SNAPSHOT_KEY]["data"]["integrations"]
+    assert "light" in snapshot["hue"]
+
+    # The next start imports the snapshot before setting up
+    await loader.async_load_import_snapshot(hass)
+    components = hass.data[loader.DATA_COMPONENTS]
+    components.clear()
+    await loader.async_preload_import_snapshot(hass, {"hue": integration})
+    assert "hue" in components
+    assert "hue.light" in components
+    assert loader.DATA_IMPORT_SNAPSHOT not in hass.data
+
+    # A snapshot of another version is not used
+    hass_storage[loader.IMPORT_SNAPSHOT_KEY]["data"]["version"] = "0.1.0"
+    await loader.async_load_import_snapshot(hass)
+    assert loader.DATA_IMPORT_SNAPSHOT not in hass.data
+
+
 async def test_async_get_integrations_multiple_non_existent(
     hass: HomeAssistant,
 ) -> None:
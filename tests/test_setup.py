@@ -1057,6 +1057,60 @@ async def test_async_start_setup_config_entry(
     }
 
 
+async def test_async_setup_trace(hass: HomeAssistant) -> None:
+    """Test the spans of the setup of integrations are traced during startup."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule("comp_dep"))
+    mock_integration(hass, MockModule("comp", dependencies=["comp_dep"]))
+
+    assert await setup.async_setup_component(hass, "comp", {})
+    with (
+        setup.async_start_setup(
+            hass,
+            integration="comp",
+            group="entry_id",
+            phase=setup.SetupPhases.CONFIG_ENTRY_SETUP,
+        ),
+        setup.async_pause_setup(hass, setup.SetupPhases.WAIT_BASE_PLATFORM_SETUP),
+    ):
+        await asyncio.sleep(0)
+
+    trace = setup.async_get_setup_trace(hass)
+    assert trace["displayTimeUnit"] == "ms"
+    events = trace["traceEvents"]
+    processes = {
+        event["pid"]: event["args"]["name"]
+        for event in events
+        if event["name"] == "process_name"
+    }
+    threads = {
+        (event["pid"], event["tid"]): event["args"]["name"]
+        for event in events
+        if event["name"] == "thread_name"
+    }
+    spans = {
+        (processes[event["pid"]], threads[event["pid"], event["tid"]], event["name"])
+        for event in events
+        if event["ph"] == "X"
+    }
+    assert {
+        ("comp", "comp", "wait_dependencies"),
+        ("comp", "comp", "requirements"),
+        ("comp", "comp", "import"),
+        ("comp", "comp", "config_validation"),
+        ("comp", "comp", setup.SetupPhases.SETUP),
+        ("comp_dep", "comp_dep", setup.SetupPhases.SETUP),
+        ("comp", "entry_id", setup.SetupPhases.CONFIG_ENTRY_SETUP),
+        ("comp", "entry_id", setup.SetupPhases.WAIT_BASE_PLATFORM_SETUP),
+    } <= spans
+    assert all(
+        event["cat"] == "wait"
+        for event in events
+        if event["name"]
+        in ("wait_dependencies", setup.SetupPhases.WAIT_BASE_PLATFORM_SETUP)
+    )
+
+
 async def test_async_start_setup_config_entry_late_platform(
     hass: HomeAssistant, freezer: FrozenDateTimeFactory
 ) -> None:
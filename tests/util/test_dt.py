@@ -818,3 +818,44 @@ def test_find_next_time_expression_tenth_second_pattern_does_not_drift_entering_
         assert (next_target - prev_target).total_seconds() == 60
         assert next_target.second == 10
         prev_target = next_target
+
+
+@pytest.mark.parametrize("time_zone", ["UTC", "Europe/Vienna", "America/Chicago"])
+@pytest.mark.parametrize(
+    ("hour", "minute", "second"),
+    [("*", "/30", 0), ("/3", "/30", [30, 45]), (None, None, "/10")],
+)
+def test_time_expression_find_next(
+    time_zone: str, hour: str, minute: str, second: str
+) -> None:
+    """Test the compiled time expression matches find_next_time_expression_time."""
+    tz = dt_util.get_time_zone(time_zone)
+    seconds = dt_util.parse_time_expression(second, 0, 59)
+    minutes = dt_util.parse_time_expression(minute, 0, 59)
+    hours = dt_util.parse_time_expression(hour, 0, 23)
+    expression = dt_util.TimeExpression(seconds, minutes, hours)
+
+    # Cover entering and exiting daylight saving time in Europe and the US
+    for start in (
+        datetime(2021, 3, 13, tzinfo=tz),
+        datetime(2021, 3, 27, tzinfo=tz),
+        datetime(2021, 10, 30, tzinfo=tz),
+        datetime(2021, 11, 6, tzinfo=tz),
+    ):
+        for step in range(0, 2 * 24 * 3600, 1199):
+            for fold in (0, 1):
+                now = (start + timedelta(seconds=step, microseconds=step)).replace(
+                    fold=fold
+                )
+                expected = dt_util.find_next_time_expression_time(
+                    now, seconds, minutes, hours
+                )
+                result = expression.find_next(now)
+                assert result == expected
+                assert result.fold == expected.fold
+
+
+def test_time_expression_never_matches() -> None:
+    """Test a time expression which never matches can't be compiled."""
+    with pytest.raises(ValueError):
+        dt_util.TimeExpression([], [0], [0])